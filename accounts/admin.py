@@ -1,12 +1,28 @@
 from django.contrib import admin
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from posts.models import Post, PostLike
+from mypage.models import Music, MusicLike
+from prototype.paginators import EstimatedCountAdminMixin
 from .models import Profile
 
 
+def count_by_user(model, user_field):
+    """사용자별 행 수 서브쿼리 (여러 COUNT를 JOIN으로 묶으면 행이 곱해지므로 따로 셈)"""
+    counts = (
+        model.objects.filter(**{user_field: OuterRef('user_id')})
+        .order_by().values(user_field).annotate(total=Count('pk')).values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['user', 'posts_count', 'music_count', 'favorites_count', 'created_at']
+    list_select_related = ['user']
     search_fields = ['user__username', 'user__email', 'bio']
-    readonly_fields = ['created_at', 'updated_at', 'posts_count', 'music_count', 'favorites_count']
+    readonly_fields = ['created_at', 'updated_at', 'deleted_at', 'posts_count', 'music_count', 'favorites_count']
+    actions = ['soft_delete_users']
     
     fieldsets = (
         ('사용자 정보', {
@@ -19,6 +35,30 @@ class ProfileAdmin(admin.ModelAdmin):
             'fields': ('posts_count', 'music_count', 'favorites_count')
         }),
         ('메타데이터', {
-            'fields': ('created_at', 'updated_at')
+            'fields': ('created_at', 'updated_at', 'deleted_at')
         }),
     )
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _posts_count=count_by_user(Post, 'author'),
+            _music_count=count_by_user(Music, 'author'),
+            _favorites_count=count_by_user(PostLike, 'user') + count_by_user(MusicLike, 'user'),
+        )
+
+    @admin.display(description='게시물 수', ordering='_posts_count')
+    def posts_count(self, obj):
+        return obj._posts_count
+
+    @admin.display(description='음악 수', ordering='_music_count')
+    def music_count(self, obj):
+        return obj._music_count
+
+    @admin.display(description='좋아요 수', ordering='_favorites_count')
+    def favorites_count(self, obj):
+        return obj._favorites_count
+
+    @admin.action(description="선택한 사용자 탈퇴 처리 (실제 삭제는 백그라운드)")
+    def soft_delete_users(self, request, queryset):
+        for profile in queryset:
+            profile.soft_delete()
@@ -0,0 +1,175 @@
+# accounts/export.py
+import csv
+import time
+import zipfile
+
+from django.core.files.storage import default_storage
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer
+
+from posts.models import Post, PostLike
+from mypage.models import Music, MusicLike
+from prototype.streaming import dumps
+
+
+# (type, 쿼리셋 함수, 내보낼 컬럼)
+EXPORT_SOURCES = [
+    ('post', lambda user: Post.objects.filter(author=user),
+     ['id', 'title', 'content', 'created_at', 'audio_file', 'image', 'view_count', 'like_count']),
+    ('music', lambda user: Music.objects.filter(author=user),
+     ['id', 'title', 'description', 'artist', 'genre', 'duration', 'audio_file', 'cover_image',
+      'created_at', 'updated_at']),
+    ('post_like', lambda user: PostLike.objects.filter(user=user),
+     ['id', 'post_id', 'created_at']),
+    ('music_like', lambda user: MusicLike.objects.filter(user=user),
+     ['id', 'music_id', 'created_at']),
+]
+
+# 미디어로 묶을 파일 컬럼
+MEDIA_SOURCES = [
+    (lambda user: Post.objects.filter(author=user), ['audio_file', 'image']),
+    (lambda user: Music.objects.filter(author=user), ['audio_file', 'cover_image']),
+]
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+CHUNK_SIZE = 2000
+FILE_CHUNK_SIZE = 256 * 1024
+
+
+class NDJSONRenderer(BaseRenderer):
+    """?format=ndjson 협상용"""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return dumps(data) + b'\n'
+
+
+class CSVRenderer(NDJSONRenderer):
+    """?format=csv 협상용"""
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    """?format= 없이 Accept: application/json 으로 요청하면 406 대신 NDJSON으로"""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        try:
+            return super().select_renderer(request, renderers, format_suffix)
+        except NotAcceptable:
+            accept = request.META.get('HTTP_ACCEPT', '')
+            if self.settings.URL_FORMAT_OVERRIDE in request.query_params or 'application/json' not in accept:
+                raise
+            return renderers[0], renderers[0].media_type
+
+
+def iter_rows(user, chunk_size=CHUNK_SIZE):
+    """(type, row dict)를 DB에서 chunk 단위로 읽어오며 하나씩 내줌"""
+    for kind, get_queryset, fields in EXPORT_SOURCES:
+        queryset = get_queryset(user).order_by('pk').values(*fields)
+        for row in queryset.iterator(chunk_size=chunk_size):
+            yield kind, row
+
+
+def iter_ndjson(user):
+    for kind, row in iter_rows(user):
+        yield dumps({'type': kind, **row}) + b'\n'
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 가짜 파일"""
+    def write(self, value):
+        return value
+
+
+def iter_csv(user):
+    header = ['type']
+    for _, _, fields in EXPORT_SOURCES:
+        header += [field for field in fields if field not in header]
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header).encode('utf-8')
+    for kind, row in iter_rows(user):
+        values = [kind]
+        for field in header[1:]:
+            value = row.get(field)
+            if hasattr(value, 'isoformat'):
+                value = value.isoformat()
+            values.append('' if value is None else value)
+        yield writer.writerow(values).encode('utf-8')
+
+
+def iter_export(user, export_format):
+    if export_format == 'csv':
+        return iter_csv(user)
+    return iter_ndjson(user)
+
+
+def iter_media_names(user):
+    """사용자 게시물/음악이 참조하는 미디어 파일 경로 (중복 제외)"""
+    seen = set()
+    for get_queryset, fields in MEDIA_SOURCES:
+        for row in get_queryset(user).values_list(*fields).iterator(chunk_size=CHUNK_SIZE):
+            for name in row:
+                if name and name not in seen:
+                    seen.add(name)
+                    yield name
+
+
+class _ZipStream:
+    """
+    seek 없이 write/tell만 되는 버퍼.
+    zipfile은 seek이 안 되면 data descriptor 방식으로 써주므로 디스크 없이 스트리밍 가능.
+    """
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    @property
+    def pending(self):
+        return bool(self._chunks)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_export_zip(user, export_format):
+    """데이터 파일 + media/ 아래 미디어 파일을 zip으로 묶어 조각 단위로 내줌"""
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open(f'export.{export_format}', mode='w', force_zip64=True) as dest:
+            for chunk in iter_export(user, export_format):
+                dest.write(chunk)
+                if stream.pending:
+                    yield stream.drain()
+
+        for name in iter_media_names(user):
+            if not default_storage.exists(name):
+                continue
+            # 오디오/이미지는 이미 압축된 포맷이라 그대로 저장
+            info = zipfile.ZipInfo(f'media/{name}', date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            with default_storage.open(name, 'rb') as src, \
+                    archive.open(info, mode='w', force_zip64=True) as dest:
+                for chunk in iter(lambda: src.read(FILE_CHUNK_SIZE), b''):
+                    dest.write(chunk)
+                    if stream.pending:
+                        yield stream.drain()
+    yield stream.drain()
@@ -0,0 +1,37 @@
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.export import EXPORT_FORMATS, iter_export, iter_export_zip
+
+
+class Command(BaseCommand):
+    help = "사용자의 게시물/음악/좋아요를 NDJSON 또는 CSV로 내보냅니다. (--media 시 미디어 포함 zip)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('username')
+        parser.add_argument('--format', dest='export_format', choices=EXPORT_FORMATS, default='ndjson')
+        parser.add_argument('--media', action='store_true', help="미디어 파일까지 zip으로 묶기")
+        parser.add_argument('-o', '--output', help="저장할 파일 경로 (생략하면 stdout)")
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"사용자를 찾을 수 없습니다: {options['username']}")
+
+        if options['media']:
+            chunks = iter_export_zip(user, options['export_format'])
+        else:
+            chunks = iter_export(user, options['export_format'])
+
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                for chunk in chunks:
+                    output.write(chunk)
+            self.stderr.write(self.style.SUCCESS(f"저장 완료: {options['output']}"))
+        else:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
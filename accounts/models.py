@@ -1,7 +1,10 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 
 class Profile(models.Model):
@@ -12,6 +15,7 @@ class Profile(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+    deleted_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="탈퇴 요청일")
     
     class Meta:
         verbose_name = "프로필"
@@ -35,6 +39,35 @@ class Profile(models.Model):
         """좋아요한 게시물 + 음악 수"""
         return self.user.post_likes.count() + self.user.music_likes.count()
 
+    def soft_delete(self):
+        """
+        탈퇴 표시: 로그인을 막고 게시물/음악을 삭제 표시만 함.
+        실제 삭제는 reap_deleted가 작은 배치로 나눠서 진행
+        """
+        from posts.models import Post
+        from mypage.models import Music, bump_genre_facets
+        from search import suggest
+        from tasks.queue import enqueue
+
+        now = timezone.now()
+        with transaction.atomic():
+            # 이미 탈퇴 표시된 사용자는 그대로 둠 (삭제 시각이 늦춰지지 않도록)
+            if not Profile.objects.filter(pk=self.pk, deleted_at__isnull=True).update(deleted_at=now):
+                return
+            User.objects.filter(pk=self.user_id).update(is_active=False)
+            posts = Post.objects.filter(author_id=self.user_id)
+            suggest.forget('post', *posts.values_list('pk', flat=True))
+            posts.update(deleted_at=now)
+
+            music = Music.objects.filter(author_id=self.user_id)
+            genres = Counter(music.values_list('genre', flat=True))
+            suggest.forget('music', *music.values_list('pk', flat=True))
+            music.update(deleted_at=now)
+            bump_genre_facets({genre: -count for genre, count in genres.items()})
+            suggest.forget('user', self.user_id)
+            enqueue('posts.tasks.reap_deleted', unique=True)
+        self.deleted_at = now
+
 
 # Signal: User 생성 시 자동으로 Profile 생성
 @receiver(post_save, sender=User)
@@ -46,3 +79,25 @@ def create_user_profile(sender, instance, created, **kwargs):
 @receiver(post_save, sender=User)
 def save_user_profile(sender, instance, **kwargs):
     instance.profile.save()
+
+
+# Signal: 작성자 이름이 바뀌면 게시물/음악 직렬화 조각(author 포함)의 버전을 올림
+@receiver(pre_save, sender=User)
+def remember_author_unchanged(sender, instance, update_fields=None, **kwargs):
+    # 로그인(last_login만 저장)처럼 username을 저장하지 않는 경우는 뒤따르는 프로필 저장에서도 건너뜀
+    instance._author_unchanged = update_fields is not None and 'username' not in update_fields
+
+
+@receiver(post_save, sender=Profile)
+def bump_author_fragments(sender, instance, created, **kwargs):
+    if created:
+        return
+    if Profile.user.is_cached(instance) and getattr(instance.user, '_author_unchanged', False):
+        instance.user._author_unchanged = False
+        return
+    from posts.models import Post
+    from mypage.models import Music
+    from prototype.fragment_cache import fragment_cache
+
+    fragment_cache.bump('post', *Post.all_objects.filter(author_id=instance.user_id).values_list('pk', flat=True))
+    fragment_cache.bump('music', *Music.all_objects.filter(author_id=instance.user_id).values_list('pk', flat=True))
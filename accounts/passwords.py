@@ -0,0 +1,136 @@
+# accounts/passwords.py
+"""
+비밀번호 해시 계산을 요청 스레드 밖의 전용 스레드 풀에서 실행.
+
+PBKDF2 같은 해셔는 일부러 느리게(수십~수백 ms) 만든 것이라, 로그인이 몰리면 워커가 해시 계산에 묶여
+다른 요청까지 밀린다. 해시 계산은 PASSWORD_HASH_WORKERS개 스레드에서만 돌리고
+(hashlib는 계산 중 GIL을 놓으므로 코어 수만큼 병렬로 돈다), 대기까지 PASSWORD_HASH_QUEUE개를 넘으면
+HasherBusy를 내서 503으로 바로 돌려보낸다.
+
+- 동기 뷰: check_password / make_password 가 결과를 기다림
+- async 뷰: acheck_password / amake_password 를 await (이벤트 루프는 막지 않음)
+
+DB 작업은 호출한 쪽에서 하고 풀에서는 해시 계산만 한다.
+해셔 설정(반복 횟수, 기본 해셔)이 바뀐 뒤 로그인에 성공하면 새 설정으로 다시 해시해서 저장한다.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.contrib.auth.models import User
+
+
+class HasherBusy(Exception):
+    """해시 풀이 가득 참 (잠시 뒤 다시 시도)"""
+
+
+_executor = None
+_slots = None
+_lock = threading.Lock()
+
+
+def _workers():
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+def _pool():
+    global _executor, _slots
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _slots = threading.BoundedSemaphore(_workers() + settings.PASSWORD_HASH_QUEUE)
+                _executor = ThreadPoolExecutor(max_workers=_workers(), thread_name_prefix='password-hash')
+    return _executor, _slots
+
+
+def _reset_after_fork():
+    # fork된 자식에는 풀의 스레드가 없으므로 새로 만듦
+    global _executor, _slots
+    _executor = _slots = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _submit(fn, *args):
+    executor, slots = _pool()
+    if not slots.acquire(blocking=False):
+        raise HasherBusy
+    try:
+        future = executor.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+def _verify(password, encoded):
+    """(맞는지, 다시 해시해야 하는지)"""
+    outdated = []
+    correct = hashers.check_password(password, encoded, setter=outdated.append)
+    return correct, bool(outdated)
+
+
+def _dummy_hash(password):
+    # 없는 사용자도 해시 한 번만큼 시간을 써서 사용자 존재 여부가 응답 시간으로 드러나지 않게 함 (ModelBackend와 같음)
+    hashers.make_password(password)
+
+
+# ==================== 동기 ====================
+
+def make_password(password):
+    return _submit(hashers.make_password, password).result()
+
+
+def check_password(user, password):
+    """user의 비밀번호가 맞는지. 해셔 설정이 바뀌었으면 새로 해시해서 저장"""
+    correct, outdated = _submit(_verify, password, user.password).result()
+    if correct and outdated:
+        try:
+            user.password = make_password(password)
+        except HasherBusy:
+            return correct   # 다음 로그인 때 다시 해시
+        user.save(update_fields=['password'])
+    return correct
+
+
+def authenticate(username, password):
+    """ModelBackend.authenticate와 같은 판단 (비활성 사용자는 None)을 해시 풀에서"""
+    user = User._default_manager.filter(username=username).first() if username is not None else None
+    if user is None:
+        _submit(_dummy_hash, password).result()
+        return None
+    if check_password(user, password) and user.is_active:
+        return user
+    return None
+
+
+# ==================== async ====================
+
+async def amake_password(password):
+    return await asyncio.wrap_future(_submit(hashers.make_password, password))
+
+
+async def acheck_password(user, password):
+    correct, outdated = await asyncio.wrap_future(_submit(_verify, password, user.password))
+    if correct and outdated:
+        try:
+            user.password = await amake_password(password)
+        except HasherBusy:
+            return correct
+        await user.asave(update_fields=['password'])
+    return correct
+
+
+async def aauthenticate(username, password):
+    user = await User._default_manager.filter(username=username).afirst() if username is not None else None
+    if user is None:
+        await asyncio.wrap_future(_submit(_dummy_hash, password))
+        return None
+    if await acheck_password(user, password) and user.is_active:
+        return user
+    return None
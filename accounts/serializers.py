@@ -2,6 +2,7 @@ from django.contrib.auth.models import User
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from .models import Profile
+from . import passwords
 
 
 # ==================== 기존 코드 (그대로 유지!) ====================
@@ -62,6 +63,21 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return instance
 
 
+class PublicUserSerializer(serializers.ModelSerializer):
+    """다른 사용자의 공개 프로필 (이메일 제외)
+    posts_count/music_count는 public_users()가 붙인 값을 씀 (사용자마다 COUNT하지 않도록)"""
+    nickname = serializers.CharField(source='first_name', read_only=True)
+    bio = serializers.CharField(source='profile.bio', read_only=True)
+    profile_image = serializers.ImageField(source='profile.profile_image', read_only=True)
+    posts_count = serializers.IntegerField(read_only=True)
+    music_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = ['id', 'username', 'nickname', 'bio', 'profile_image', 'posts_count', 'music_count']
+        read_only_fields = fields
+
+
 class UserStatisticsSerializer(serializers.Serializer):
     """사용자 통계 시리얼라이저"""
     total_posts = serializers.IntegerField()
@@ -79,7 +95,7 @@ class ChangePasswordSerializer(serializers.Serializer):
     
     def validate_old_password(self, value):
         user = self.context['request'].user
-        if not user.check_password(value):
+        if not passwords.check_password(user, value):
             raise serializers.ValidationError("기존 비밀번호가 일치하지 않습니다.")
         return value
     
@@ -93,6 +109,6 @@ class ChangePasswordSerializer(serializers.Serializer):
     
     def save(self):
         user = self.context['request'].user
-        user.set_password(self.validated_data['new_password'])
+        user.password = passwords.make_password(self.validated_data['new_password'])
         user.save()
         return user
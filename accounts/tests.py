@@ -1,3 +1,103 @@
-from django.test import TestCase
+import json
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from . import passwords
+from .models import Profile
+from .views import login_async, register_async
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'accounts-tests'},
+    'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'accounts-tests'},
+}
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@override_settings(CACHES=LOCMEM_CACHES, THROTTLE_ENABLED=False, PASSWORD_HASHERS=FAST_HASHERS)
+class AuthViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def register(self, username='newbie', password='pw12345!'):
+        return self.client.post('/api/accounts/register/',
+                                {'username': username, 'password': password, 'nickname': 'nick'}, format='json')
+
+    def login(self, username='newbie', password='pw12345!'):
+        return self.client.post('/api/accounts/login/', {'username': username, 'password': password}, format='json')
+
+    def test_register_saves_user_once(self):
+        saves = []
+
+        def count(sender, instance, **kwargs):
+            saves.append(instance.pk)
+
+        post_save.connect(count, sender=User)
+        self.addCleanup(post_save.disconnect, count, sender=User)
+        self.assertEqual(self.register().status_code, 201)
+
+        user = User.objects.get(username='newbie')
+        self.assertEqual(saves, [user.pk])
+        self.assertEqual(user.first_name, 'nick')
+        self.assertTrue(user.check_password('pw12345!'))
+        self.assertTrue(Profile.objects.filter(user=user).exists())
+        self.assertEqual(self.register().status_code, 400)
+
+    def test_busy_hasher_returns_503(self):
+        with mock.patch.object(passwords, '_submit', side_effect=passwords.HasherBusy):
+            for response in (self.register(), self.login()):
+                self.assertEqual(response.status_code, 503)
+                self.assertEqual(response['Retry-After'], '1')
+        self.assertFalse(User.objects.exists())
+
+    @override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.PBKDF2PasswordHasher', *FAST_HASHERS])
+    def test_outdated_hash_is_replaced_on_login(self):
+        user = User.objects.create(username='old', password=make_password('pw12345!', hasher='md5'))
+        self.assertEqual(self.login('old', 'wrong').status_code, 401)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('md5$'))
+
+        self.assertEqual(self.login('old').status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$'))
+        self.assertEqual(self.login('old').status_code, 200)
+
+    def test_inactive_user_cannot_login(self):
+        self.register()
+        User.objects.filter(username='newbie').update(is_active=False)
+        self.assertEqual(self.login().status_code, 401)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, THROTTLE_ENABLED=False, PASSWORD_HASHERS=FAST_HASHERS)
+class AsyncAuthViewTests(TestCase):
+    def request(self, view, data):
+        request = AsyncRequestFactory().post('/', json.dumps(data), content_type='application/json')
+        return view(request)
+
+    async def test_register_and_login(self):
+        response = await self.request(register_async, {'username': 'async', 'password': 'pw12345!', 'nickname': 'n'})
+        self.assertEqual(response.status_code, 201)
+        response = await self.request(register_async, {'username': 'async', 'password': 'pw12345!'})
+        self.assertEqual(response.status_code, 400)
+
+        response = await self.request(login_async, {'username': 'async', 'password': 'pw12345!'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access', json.loads(response.content))
+        response = await self.request(login_async, {'username': 'async', 'password': 'wrong'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_busy_hasher_returns_503(self):
+        with mock.patch.object(passwords, '_submit', side_effect=passwords.HasherBusy):
+            response = await self.request(login_async, {'username': 'x', 'password': 'y'})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '1')
+
+    async def test_bad_body_and_method(self):
+        request = AsyncRequestFactory().post('/', 'not json', content_type='application/json')
+        self.assertEqual((await register_async(request)).status_code, 400)
+        self.assertEqual((await login_async(AsyncRequestFactory().get('/'))).status_code, 405)
@@ -1,4 +1,5 @@
 # accounts/urls.py
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView, TokenBlacklistView
 from .views import (
@@ -8,13 +9,20 @@ from .views import (
     LogoutView,
     UserProfileView,
     change_password,
-    user_statistics
+    user_statistics,
+    UserExportView,
+    UserDetailView,
+    UserBatchView,
+    login_async,
+    register_async,
 )
+from analytics.views import MyAnalyticsView
 
 urlpatterns = [
     # ==================== 기존 URL (그대로 유지!) ====================
-    path('register/', RegisterView.as_view(), name='register'),
-    path('login/', LoginView.as_view(), name='login'),
+    # ACCOUNTS_ASYNC_AUTH_VIEWS: ASGI에서 해시 계산을 await하는 async 뷰로 처리
+    path('register/', register_async if settings.ACCOUNTS_ASYNC_AUTH_VIEWS else RegisterView.as_view(), name='register'),
+    path('login/', login_async if settings.ACCOUNTS_ASYNC_AUTH_VIEWS else LoginView.as_view(), name='login'),
     path('user/', UserView.as_view(), name='user'),
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('auth/logout/', LogoutView.as_view(), name='logout'),
@@ -23,5 +31,8 @@ urlpatterns = [
     path('me/', UserProfileView.as_view(), name='user-profile'),
     path('change-password/', change_password, name='change-password'),
     path('me/statistics/', user_statistics, name='user-statistics'),
-    path('<int:pk>/', UserProfileView.as_view(), name='user-detail'), #추가
+    path('me/export/', UserExportView.as_view(), name='user-export'),
+    path('me/analytics/', MyAnalyticsView.as_view(), name='user-analytics'),
+    path('batch/', UserBatchView.as_view(), name='user-batch'),
+    path('<int:pk>/', UserDetailView.as_view(), name='user-detail'), #추가
 ]
@@ -1,24 +1,45 @@
 # accounts/views.py
+import json
+import math
 
 from rest_framework import status, permissions, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.decorators import api_view, permission_classes
-from django.contrib.auth import authenticate
+from rest_framework.exceptions import Throttled
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth.models import User
+from django.contrib.auth.models import AnonymousUser, User
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from asgiref.sync import sync_to_async
+from . import passwords
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.renderers import JSONRenderer
 from .serializers import (
     UserProfileSerializer,
     ChangePasswordSerializer,
-    UserStatisticsSerializer
+    UserStatisticsSerializer,
+    PublicUserSerializer,
 )
+from .export import NDJSONRenderer, CSVRenderer, ExportContentNegotiation, iter_export, iter_export_zip
+from prototype.batch import BatchLookupView
+from prototype.throttling import TokenBucketThrottle
+from posts.models import Post
+from mypage.models import Music
+
+
+# 해시 풀(accounts/passwords.py)이 가득 찼을 때의 응답
+HASHER_BUSY = {'error': '요청이 많아 비밀번호를 처리하지 못했습니다. 잠시 후 다시 시도해주세요.'}
 
 
 # ==================== 기존 코드 (그대로 유지!) ====================
 
 class RegisterView(APIView):
+    throttle_classes = [TokenBucketThrottle.scoped('register')]
+
     def post(self, request):
         username = request.data.get('username') 
         password = request.data.get('password')
@@ -27,19 +48,28 @@ class RegisterView(APIView):
         if User.objects.filter(username=username).exists():
             return Response({'error': '이미 존재하는 사용자입니다.'}, status=400)
 
-        user = User.objects.create_user(username=username, password=password)
-        user.first_name = nickname  
-        user.save()
+        # 해시는 해시 풀에서 하고, 사용자는 저장 한 번으로 만듦 (프로필 생성 신호까지 한 트랜잭션)
+        try:
+            encoded = passwords.make_password(password)
+        except passwords.HasherBusy:
+            return Response(HASHER_BUSY, status=503, headers={'Retry-After': '1'})
+        with transaction.atomic():
+            User(username=User.normalize_username(username), first_name=nickname, password=encoded).save()
 
         return Response({'message': '회원가입 성공'}, status=201)
     
 
 class LoginView(APIView):
+    throttle_classes = [TokenBucketThrottle.scoped('login')]
+
     def post(self, request):
         username = request.data.get('username')
         password = request.data.get('password')
         
-        user = authenticate(username=username, password=password)
+        try:
+            user = passwords.authenticate(username, password)
+        except passwords.HasherBusy:
+            return Response(HASHER_BUSY, status=503, headers={'Retry-After': '1'})
         if user is None:
             return Response({'error': '인증 실패'}, status=401)
 
@@ -88,14 +118,53 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         return self.request.user
 
 
+def _count_by_author(model):
+    return Coalesce(Subquery(
+        model.objects.filter(author=OuterRef('pk')).order_by()
+        .values('author').annotate(n=Count('pk')).values('n'),
+        output_field=IntegerField(),
+    ), 0)
+
+
+def public_users():
+    """공개 프로필 조회용 쿼리셋 (탈퇴한 사용자 제외, 프로필 JOIN, 게시물/음악 수는 서브쿼리로 함께)"""
+    return User.objects.filter(is_active=True, profile__deleted_at__isnull=True).select_related('profile').annotate(
+        posts_count=_count_by_author(Post),
+        music_count=_count_by_author(Music),
+    )
+
+
+class UserDetailView(generics.RetrieveAPIView):
+    """다른 사용자의 공개 프로필 (/api/users/<pk>/)"""
+    serializer_class = PublicUserSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return public_users()
+
+
+class UserBatchView(BatchLookupView):
+    """사용자 공개 프로필 여러 개를 id로 한 번에 조회 (?ids=1,2,3, 요청 순서 유지, 없는 id는 missing)"""
+    serializer_class = PublicUserSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return public_users()
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def change_password(request):
     """비밀번호 변경"""
     serializer = ChangePasswordSerializer(data=request.data, context={'request': request})
     
-    if serializer.is_valid():
-        serializer.save()
+    try:
+        valid = serializer.is_valid()
+        if valid:
+            serializer.save()
+    except passwords.HasherBusy:
+        return Response(HASHER_BUSY, status=503, headers={'Retry-After': '1'})
+    if valid:
         return Response(
             {"message": "비밀번호가 성공적으로 변경되었습니다."},
             status=status.HTTP_200_OK
@@ -121,3 +190,128 @@ def user_statistics(request):
     
     serializer = UserStatisticsSerializer(stats)
     return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class UserExportView(APIView):
+    """내 데이터 내보내기 (?format=ndjson|csv, ?media=1 이면 미디어 파일까지 zip으로)"""
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    content_negotiation_class = ExportContentNegotiation
+
+    def handle_exception(self, exc):
+        response = super().handle_exception(exc)
+        # 에러는 요청한 내보내기 형식(csv 등)과 상관없이 JSON으로
+        self.request.accepted_renderer = JSONRenderer()
+        self.request.accepted_media_type = JSONRenderer.media_type
+        return response
+
+    def get(self, request):
+        export_format = request.accepted_renderer.format
+        include_media = request.query_params.get('media', '').lower() in ('1', 'true', 'yes')
+        filename = f'{request.user.username}-export'
+
+        if include_media:
+            response = StreamingHttpResponse(
+                iter_export_zip(request.user, export_format),
+                content_type='application/zip'
+            )
+            filename += '.zip'
+        else:
+            response = StreamingHttpResponse(
+                iter_export(request.user, export_format),
+                content_type=f'{request.accepted_renderer.media_type}; charset=utf-8'
+            )
+            filename += f'.{export_format}'
+
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+# ==================== async 로그인/회원가입 (ASGI용) ====================
+# ACCOUNTS_ASYNC_AUTH_VIEWS가 켜져 있으면 login/, register/ 가 이 뷰로 연결됨 (accounts/urls.py).
+# 해시 계산을 await하는 동안 이벤트 루프가 다른 요청을 처리하므로, 로그인이 몰려도 ASGI 워커가 막히지 않는다.
+# DRF 뷰는 async를 지원하지 않아 Django async 뷰로 같은 요청/응답 형태를 맞춤.
+# (Django 4.2의 csrf_exempt/require_POST 데코레이터는 async 뷰를 감싸지 못해 직접 처리)
+
+def _request_data(request):
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+    return request.POST
+
+
+def _reject(request, scope):
+    """POST가 아니거나 요청 제한에 걸렸으면 그 응답, 아니면 None"""
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+    # 로그인/가입은 익명 요청으로 셈 (세션 사용자를 불러오려고 동기 DB 조회를 하지 않도록)
+    request.user = AnonymousUser()
+    throttle = TokenBucketThrottle.scoped(scope)()
+    if throttle.allow_request(request, None):
+        return None
+    wait = throttle.wait()
+    response = JsonResponse({'detail': str(Throttled(wait).detail)}, status=429)
+    response['Retry-After'] = str(math.ceil(wait))
+    return response
+
+
+def _busy():
+    response = JsonResponse(HASHER_BUSY, status=503, json_dumps_params={'ensure_ascii': False})
+    response['Retry-After'] = '1'
+    return response
+
+
+async def register_async(request):
+    rejected = _reject(request, 'register')
+    if rejected:
+        return rejected
+    data = _request_data(request)
+    if data is None:
+        return JsonResponse({'error': '잘못된 요청 본문입니다.'}, status=400, json_dumps_params={'ensure_ascii': False})
+    username = data.get('username')
+    password = data.get('password')
+    nickname = data.get('nickname')
+
+    if await User.objects.filter(username=username).aexists():
+        return JsonResponse({'error': '이미 존재하는 사용자입니다.'}, status=400, json_dumps_params={'ensure_ascii': False})
+
+    try:
+        encoded = await passwords.amake_password(password)
+    except passwords.HasherBusy:
+        return _busy()
+    user = User(username=User.normalize_username(username), first_name=nickname, password=encoded)
+    await user.asave()
+
+    return JsonResponse({'message': '회원가입 성공'}, status=201, json_dumps_params={'ensure_ascii': False})
+
+
+register_async.csrf_exempt = True
+
+
+async def login_async(request):
+    rejected = _reject(request, 'login')
+    if rejected:
+        return rejected
+    data = _request_data(request)
+    if data is None:
+        return JsonResponse({'error': '잘못된 요청 본문입니다.'}, status=400, json_dumps_params={'ensure_ascii': False})
+
+    try:
+        user = await passwords.aauthenticate(data.get('username'), data.get('password'))
+    except passwords.HasherBusy:
+        return _busy()
+    if user is None:
+        return JsonResponse({'error': '인증 실패'}, status=401, json_dumps_params={'ensure_ascii': False})
+
+    # token_blacklist가 발급한 refresh 토큰을 DB에 기록하므로 동기 호출
+    refresh = await sync_to_async(RefreshToken.for_user)(user)
+    return JsonResponse({
+        'access': str(refresh.access_token),
+        'refresh': str(refresh),
+    })
+
+
+login_async.csrf_exempt = True
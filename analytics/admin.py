@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import DailyEngagement, HourlyEngagement
+
+
+@admin.register(HourlyEngagement, DailyEngagement)
+class EngagementAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'object_id', 'author_id', 'bucket', 'likes', 'unlikes', 'views']
+    list_filter = ['kind']
+    search_fields = ['object_id', 'author_id']
+    date_hierarchy = 'bucket'
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from analytics.rollups import backfill
+
+
+class Command(BaseCommand):
+    help = (
+        "좋아요 테이블의 created_at으로 아직 없는 시간별/일별 반응 버킷의 좋아요 수를 채웁니다. "
+        "이미 있는 버킷(실시간 집계)은 덮어쓰지 않으며, 좋아요 취소와 조회 수는 원본이 없으므로 채우지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=['post', 'music'], action='append',
+                            help="대상 종류 (생략하면 전부)")
+        parser.add_argument('--days', type=int,
+                            help="최근 며칠만 다시 채움 (생략하면 전체, 날짜 경계에 맞춤)")
+
+    def handle(self, *args, **options):
+        since = None
+        if options['days']:
+            since = (timezone.now() - timedelta(days=options['days'])).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        for kind in options['kind'] or ['post', 'music']:
+            hourly, daily = backfill(kind, since=since)
+            self.stdout.write(self.style.SUCCESS(
+                f"{kind}: 시간 버킷 {hourly}개, 일 버킷 {daily}개 새로 채움"
+            ))
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.23 on 2026-10-19 08:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyEngagement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', '게시물'), ('music', '음악')], max_length=10, verbose_name='종류')),
+                ('object_id', models.BigIntegerField(verbose_name='대상 id')),
+                ('author_id', models.BigIntegerField(verbose_name='작성자 id')),
+                ('likes', models.IntegerField(default=0, verbose_name='좋아요')),
+                ('unlikes', models.IntegerField(default=0, verbose_name='좋아요 취소')),
+                ('views', models.IntegerField(default=0, verbose_name='조회')),
+                ('bucket', models.DateField(verbose_name='날짜 (UTC)')),
+            ],
+            options={
+                'verbose_name': '일별 반응',
+                'verbose_name_plural': '일별 반응들',
+            },
+        ),
+        migrations.CreateModel(
+            name='HourlyEngagement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', '게시물'), ('music', '음악')], max_length=10, verbose_name='종류')),
+                ('object_id', models.BigIntegerField(verbose_name='대상 id')),
+                ('author_id', models.BigIntegerField(verbose_name='작성자 id')),
+                ('likes', models.IntegerField(default=0, verbose_name='좋아요')),
+                ('unlikes', models.IntegerField(default=0, verbose_name='좋아요 취소')),
+                ('views', models.IntegerField(default=0, verbose_name='조회')),
+                ('bucket', models.DateTimeField(verbose_name='시각 (UTC, 정시)')),
+            ],
+            options={
+                'verbose_name': '시간별 반응',
+                'verbose_name_plural': '시간별 반응들',
+                'indexes': [models.Index(fields=['author_id', 'bucket'], name='hourly_engagement_author_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='hourlyengagement',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id', 'bucket'), name='hourly_engagement_uniq'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyengagement',
+            index=models.Index(fields=['author_id', 'bucket'], name='daily_engagement_author_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyengagement',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id', 'bucket'), name='daily_engagement_uniq'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import models
+
+
+class EngagementBucket(models.Model):
+    """게시물/음악 하나의 한 구간(시간/일) 동안의 좋아요, 좋아요 취소, 조회 수"""
+    KIND_CHOICES = [
+        ('post', '게시물'),
+        ('music', '음악'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="종류")
+    object_id = models.BigIntegerField(verbose_name="대상 id")
+    # 대시보드가 대상 테이블을 조인하지 않도록 작성자를 함께 저장 (대상이 지워져도 남음)
+    author_id = models.BigIntegerField(verbose_name="작성자 id")
+    likes = models.IntegerField(default=0, verbose_name="좋아요")
+    unlikes = models.IntegerField(default=0, verbose_name="좋아요 취소")
+    views = models.IntegerField(default=0, verbose_name="조회")
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} @ {self.bucket}"
+
+
+class HourlyEngagement(EngagementBucket):
+    bucket = models.DateTimeField(verbose_name="시각 (UTC, 정시)")
+
+    class Meta:
+        verbose_name = "시간별 반응"
+        verbose_name_plural = "시간별 반응들"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id', 'bucket'], name='hourly_engagement_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['author_id', 'bucket'], name='hourly_engagement_author_idx'),
+        ]
+
+
+class DailyEngagement(EngagementBucket):
+    bucket = models.DateField(verbose_name="날짜 (UTC)")
+
+    class Meta:
+        verbose_name = "일별 반응"
+        verbose_name_plural = "일별 반응들"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id', 'bucket'], name='daily_engagement_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['author_id', 'bucket'], name='daily_engagement_author_idx'),
+        ]
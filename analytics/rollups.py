@@ -0,0 +1,157 @@
+# analytics/rollups.py
+"""
+작성자 대시보드용 반응 집계 (시간별/일별 버킷).
+
+좋아요/취소/조회가 일어날 때마다 해당 시각의 시간 버킷과 날짜 버킷에 바로 더한다.
+(bump_genre_facets와 같은 방식: UPDATE로 더해보고, 행이 없으면 만든 뒤 다시 UPDATE)
+대시보드는 이 버킷만 읽으므로 좋아요 테이블을 날짜별로 GROUP BY 하지 않는다.
+모든 버킷은 UTC 기준이다.
+"""
+from datetime import timedelta, timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate, TruncHour
+from django.utils import timezone
+
+from .models import DailyEngagement, HourlyEngagement
+
+
+COUNTERS = ('likes', 'unlikes', 'views')
+
+# 대시보드에 보내는 항목별 합계 수
+TOP_ITEMS = 20
+
+
+def _targets(kind):
+    from mypage.models import Music, MusicLike
+    from posts.models import Post, PostLike
+
+    # 종류별 (대상 모델, 좋아요 모델, 좋아요 FK 필드)
+    return {
+        'post': (Post, PostLike, 'post'),
+        'music': (Music, MusicLike, 'music'),
+    }[kind]
+
+
+def hour_of(moment):
+    return moment.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def day_of(moment):
+    return moment.astimezone(dt_timezone.utc).date()
+
+
+def _bump_buckets(model, kind, bucket, deltas):
+    """deltas: {대상 id: {'likes': n, ...}}. 같은 증감값끼리 묶어서 UPDATE"""
+    by_delta = {}
+    for target_id, counts in deltas.items():
+        key = tuple(counts.get(name, 0) for name in COUNTERS)
+        if any(key):
+            by_delta.setdefault(key, []).append(target_id)
+
+    for key, ids in by_delta.items():
+        changes = {name: F(name) + n for name, n in zip(COUNTERS, key) if n}
+        rows = model.objects.filter(kind=kind, bucket=bucket)
+        if rows.filter(object_id__in=ids).update(**changes) == len(ids):
+            continue
+        # 이 구간에 처음 생긴 대상: 행을 만들고 다시 더함
+        existing = set(rows.filter(object_id__in=ids).values_list('object_id', flat=True))
+        missing = [target_id for target_id in ids if target_id not in existing]
+        target_model = _targets(kind)[0]
+        authors = dict(target_model.all_objects.filter(pk__in=missing).values_list('pk', 'author_id'))
+        model.objects.bulk_create([
+            model(kind=kind, object_id=target_id, author_id=authors[target_id], bucket=bucket)
+            for target_id in missing if target_id in authors
+        ], ignore_conflicts=True)
+        rows.filter(object_id__in=[target_id for target_id in missing if target_id in authors]).update(**changes)
+
+
+def bump(kind, deltas, when=None):
+    """
+    kind 대상들의 반응 수를 시간/일 버킷에 더함
+    deltas: {대상 id: {'likes': n, 'unlikes': n, 'views': n}} (없는 이름은 0)
+    좋아요/조회를 쓰는 트랜잭션 안에서 부르면 같은 커밋에 들어감 (밖에서 부르면 두 버킷을 한 트랜잭션으로 씀)
+    """
+    when = when or timezone.now()
+    with transaction.atomic():
+        _bump_buckets(HourlyEngagement, kind, hour_of(when), deltas)
+        _bump_buckets(DailyEngagement, kind, day_of(when), deltas)
+
+
+def backfill(kind, since=None):
+    """
+    좋아요 테이블의 created_at으로 아직 행이 없는 버킷의 likes를 채움. 반환: (새로 만든 시간 버킷 수, 일 버킷 수)
+    이미 있는 버킷은 실시간으로 더해진 값(이후 취소된 좋아요 포함)이므로 덮어쓰지 않음
+    취소된 좋아요와 조회는 원본이 남아 있지 않으므로 unlikes/views는 채우지 않음
+    """
+    target_model, like_model, field = _targets(kind)
+    likes = like_model.objects.all()
+    if since is not None:
+        likes = likes.filter(created_at__gte=since)
+    authors = dict(target_model.all_objects.values_list('pk', 'author_id'))
+
+    result = []
+    for model, trunc in ((HourlyEngagement, TruncHour), (DailyEngagement, TruncDate)):
+        existing = model.objects.filter(kind=kind)
+        if since is not None:
+            existing = existing.filter(bucket__gte=hour_of(since) if model is HourlyEngagement else day_of(since))
+        existing = set(existing.values_list('object_id', 'bucket'))
+        rows = (
+            likes.order_by().annotate(bucket=trunc('created_at', tzinfo=dt_timezone.utc))
+            .values(f'{field}_id', 'bucket').annotate(n=Count('id'))
+            .values_list(f'{field}_id', 'bucket', 'n')
+        )
+        buckets = [
+            model(kind=kind, object_id=target_id, author_id=authors[target_id], bucket=bucket, likes=n)
+            for target_id, bucket, n in rows.iterator()
+            if target_id in authors and (target_id, bucket) not in existing
+        ]
+        # 그 사이 실시간 집계가 먼저 만든 행은 그대로 둠
+        model.objects.bulk_create(buckets, batch_size=1000, ignore_conflicts=True)
+        result.append(len(buckets))
+    return tuple(result)
+
+
+# 대시보드 기간: (버킷 모델, 버킷 수, 버킷 간격)
+RANGES = {
+    '24h': (HourlyEngagement, 24, timedelta(hours=1)),
+    '7d': (DailyEngagement, 7, timedelta(days=1)),
+    '30d': (DailyEngagement, 30, timedelta(days=1)),
+    '90d': (DailyEngagement, 90, timedelta(days=1)),
+}
+
+
+def summarize(author_id, range_name, kind=None, now=None):
+    """
+    작성자의 기간별 반응. 비어 있는 구간은 0으로 채운 series와 합계, 항목별 합계(좋아요 많은 순)를 반환
+    """
+    model, count, step = RANGES[range_name]
+    now = now or timezone.now()
+    last = hour_of(now) if model is HourlyEngagement else day_of(now)
+    first = last - step * (count - 1)
+
+    rows = model.objects.filter(author_id=author_id, bucket__gte=first, bucket__lte=last)
+    if kind:
+        rows = rows.filter(kind=kind)
+
+    series = {first + step * i: dict.fromkeys(COUNTERS, 0) for i in range(count)}
+    sums = {name: Sum(name) for name in COUNTERS}
+    for row in rows.order_by().values('bucket').annotate(**{f'{name}_sum': total for name, total in sums.items()}):
+        if row['bucket'] in series:
+            series[row['bucket']] = {name: row[f'{name}_sum'] for name in COUNTERS}
+
+    items = (
+        rows.order_by().values('kind', 'object_id')
+        .annotate(**{f'{name}_sum': total for name, total in sums.items()})
+        .order_by('-likes_sum', '-views_sum', 'kind', 'object_id')[:TOP_ITEMS]
+    )
+    totals = {name: sum(bucket[name] for bucket in series.values()) for name in COUNTERS}
+    return {
+        'series': [{'bucket': bucket, **values} for bucket, values in series.items()],
+        'totals': totals,
+        'items': [
+            {'type': item['kind'], 'id': item['object_id'], **{name: item[f'{name}_sum'] for name in COUNTERS}}
+            for item in items
+        ],
+    }
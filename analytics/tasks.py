@@ -0,0 +1,14 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from tasks.queue import task
+from .models import HourlyEngagement
+
+
+@task(lane='low')
+def prune_hourly_engagement():
+    """보관 기간(ANALYTICS_HOURLY_KEEP_DAYS)이 지난 시간별 버킷 정리 (일별 버킷은 남김)"""
+    cutoff = timezone.now() - timedelta(days=settings.ANALYTICS_HOURLY_KEEP_DAYS)
+    HourlyEngagement.objects.filter(bucket__lt=cutoff).delete()
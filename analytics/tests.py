@@ -0,0 +1,73 @@
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from mypage.models import Music
+from posts import likes
+from posts.models import Post
+from prototype.fragment_cache import fragment_cache
+from . import rollups
+from .models import DailyEngagement, HourlyEngagement
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'analytics-tests'},
+    'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'analytics-tests'},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LIKE_INGESTION_MODE='sync', THROTTLE_ENABLED=False)
+class EngagementTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.fan = User.objects.create_user('fan', password='pw12345!')
+        self.post = Post.objects.create(title='t', content='c', author=self.author)
+
+    def daily(self, obj, kind='post'):
+        return DailyEngagement.objects.filter(kind=kind, object_id=obj.pk).values('likes', 'unlikes', 'views').first()
+
+    def test_likes_and_unlikes_are_counted_once(self):
+        likes.add_like('post', self.fan, self.post.pk)
+        likes.add_like('post', self.fan, self.post.pk)
+        likes.remove_like('post', self.fan, self.post.pk)
+        likes.remove_like('post', self.fan, self.post.pk)
+        self.assertEqual(self.daily(self.post), {'likes': 1, 'unlikes': 1, 'views': 0})
+        self.assertEqual(HourlyEngagement.objects.get().likes, 1)
+
+    def test_post_view_counts_and_replaces_fragment(self):
+        before = fragment_cache.versions('post', [self.post.pk])[self.post.pk]
+        response = APIClient().post(f'/api/posts/{self.post.pk}/view/')
+        self.assertEqual(response.status_code, 204)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 1)
+        self.assertEqual(self.daily(self.post)['views'], 1)
+        self.assertGreater(fragment_cache.versions('post', [self.post.pk])[self.post.pk], before)
+
+    def test_view_of_missing_target(self):
+        client = APIClient()
+        self.assertEqual(client.post('/api/posts/999999/view/').status_code, 404)
+        self.assertEqual(client.post('/api/music/999999/view/').status_code, 404)
+        self.assertFalse(DailyEngagement.objects.exists())
+
+    @override_settings(THROTTLE_ENABLED=True, THROTTLE_BUCKET_RATES={'view': {'ip': ('1/min', 2)}},
+                       THROTTLE_BUCKET_STORE='prototype.throttling.LocalBucketStore')
+    def test_views_are_throttled(self):
+        client = APIClient()
+        statuses = [client.post(f'/api/posts/{self.post.pk}/view/').status_code for _ in range(3)]
+        self.assertEqual(statuses, [204, 204, 429])
+
+    def test_backfill_fills_only_missing_buckets(self):
+        music = Music.objects.create(title='song', author=self.author)
+        likes.add_like('post', self.fan, self.post.pk)
+        likes.remove_like('post', self.fan, self.post.pk)
+        likes.add_like('music', self.fan, music.pk)
+        DailyEngagement.objects.filter(kind='music').delete()
+
+        self.assertEqual(rollups.backfill('post'), (0, 0))
+        self.assertEqual(rollups.backfill('music'), (0, 1))
+        # 실시간으로 쌓인 값(취소 전 좋아요 포함)은 그대로
+        self.assertEqual(self.daily(self.post)['likes'], 1)
+        self.assertEqual(self.daily(music, 'music')['likes'], 1)
@@ -0,0 +1,30 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .rollups import RANGES, summarize
+
+
+class MyAnalyticsView(APIView):
+    """
+    내 게시물/음악의 기간별 좋아요, 좋아요 취소, 조회 수
+    ?range=24h (시간별) | 7d | 30d | 90d (일별), ?type=post|music 으로 종류 제한
+    """
+    permission_classes = [IsAuthenticated]
+    default_range = '7d'
+
+    def get(self, request):
+        range_name = request.query_params.get('range', self.default_range)
+        if range_name not in RANGES:
+            return Response(
+                {'error': f"range는 {', '.join(RANGES)} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        kind = request.query_params.get('type')
+        if kind not in (None, 'post', 'music'):
+            return Response(
+                {'error': "type은 post 또는 music이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({'range': range_name, **summarize(request.user.pk, range_name, kind=kind)})
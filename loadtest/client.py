@@ -0,0 +1,265 @@
+# loadtest/client.py
+"""
+가상 사용자(스레드)마다 시나리오를 돌리고 엔드포인트별 지연 시간을 모은다.
+
+시나리오: 회원가입 -> 로그인 -> (게시물 작성(이미지+오디오) -> 좋아요 토글 -> 목록/내 게시물/좋아요 목록 페이지)
+괄호 안을 duration이 끝날 때까지 반복한다.
+요청 이름은 URL의 id를 <id>로 바꾼 것이라 같은 엔드포인트끼리 묶인다.
+"""
+import http.client
+import io
+import json
+import math
+import random
+import threading
+import time
+import uuid
+import wave
+from urllib.parse import urlsplit
+
+
+def _png_bytes():
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (16, 16), (200, 80, 40)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def _wav_bytes(seconds=0.25, rate=8000):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(b'\x00\x00' * int(seconds * rate))
+    return buffer.getvalue()
+
+
+def _multipart(fields, files):
+    """(본문, content-type). files: {이름: (파일명, content-type, bytes)}"""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, (filename, content_type, data) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'.encode() + data + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+class Recorder:
+    """엔드포인트별 (지연 시간 목록, 상태 코드별 수). 스레드마다 하나씩 쓰고 끝에 합침"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = {}
+
+    def add(self, name, seconds, status):
+        self.latencies.setdefault(name, []).append(seconds)
+        counts = self.statuses.setdefault(name, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def merge(self, other):
+        for name, values in other.latencies.items():
+            self.latencies.setdefault(name, []).extend(values)
+        for name, counts in other.statuses.items():
+            mine = self.statuses.setdefault(name, {})
+            for status, count in counts.items():
+                mine[status] = mine.get(status, 0) + count
+
+
+class Session:
+    """가상 사용자 하나의 HTTP 연결 (서버가 닫으면 다시 연결)"""
+
+    def __init__(self, base_url, recorder, timeout=30):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+        self.recorder = recorder
+        self.timeout = timeout
+        self.connection = None
+        self.token = None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def request(self, name, method, path, body=None, content_type=None, expect=(200,)):
+        """응답 본문(JSON이면 해석한 값)을 반환. 기대한 상태 코드가 아니면 None"""
+        headers = {}
+        if body is not None:
+            headers['Content-Type'] = content_type or 'application/json'
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode()
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+
+        started = time.perf_counter()
+        try:
+            data, status = self._send(method, self.prefix + path, body, headers)
+        except (OSError, http.client.HTTPException) as exc:
+            self.close()
+            self.recorder.add(name, time.perf_counter() - started, type(exc).__name__)
+            return None
+        self.recorder.add(name, time.perf_counter() - started, status)
+        if status not in expect:
+            return None
+        try:
+            return json.loads(data) if data else {}
+        except ValueError:
+            return {}
+
+    def _send(self, method, path, body, headers):
+        for attempt in (1, 2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.connection.request(method, path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # keep-alive 연결이 서버 쪽에서 닫혔으면 한 번만 새 연결로 다시
+                self.close()
+                if attempt == 2:
+                    raise
+                continue
+            if response.will_close:
+                self.close()
+            return data, response.status
+
+
+class Journey:
+    """가상 사용자 시나리오"""
+
+    def __init__(self, session, username, media, likes_per_round=3):
+        self.session = session
+        self.username = username
+        self.password = f'Lt-{uuid.uuid4().hex[:12]}!'
+        self.media = media
+        self.likes_per_round = likes_per_round
+        self.post_ids = []
+
+    def sign_in(self):
+        s = self.session
+        s.request('POST /api/accounts/register/', 'POST', '/api/accounts/register/',
+                  {'username': self.username, 'password': self.password, 'nickname': self.username},
+                  expect=(201,))
+        tokens = s.request('POST /api/accounts/login/', 'POST', '/api/accounts/login/',
+                           {'username': self.username, 'password': self.password})
+        s.token = (tokens or {}).get('access')
+        return bool(s.token)
+
+    def round(self):
+        s = self.session
+        body, content_type = _multipart(
+            {'title': f'load test {uuid.uuid4().hex[:8]}', 'content': 'generated by loadtest'},
+            {'image': ('cover.png', 'image/png', self.media['png']),
+             'audio_file': ('clip.wav', 'audio/wav', self.media['wav'])},
+        )
+        s.request('POST /api/posts/create-post/', 'POST', '/api/posts/create-post/',
+                  body, content_type, expect=(201,))
+
+        posts = s.request('GET /api/posts/list-posts/', 'GET', '/api/posts/list-posts/?fields=postId,title')
+        if isinstance(posts, list) and posts:
+            self.post_ids = [post['postId'] for post in posts[:200]]
+        for post_id in random.sample(self.post_ids, min(self.likes_per_round, len(self.post_ids))):
+            s.request('POST /api/posts/<id>/like/', 'POST', f'/api/posts/{post_id}/like/',
+                      expect=(200, 201))
+
+        # 다음 페이지가 있을 때만 이어서 넘김
+        for name, path in (('GET /api/posts/my-posts/', '/api/posts/my-posts/'),
+                           ('GET /api/posts/favorites/', '/api/posts/favorites/')):
+            for page in (1, 2):
+                data = s.request(name, 'GET', f'{path}?page={page}')
+                if not (isinstance(data, dict) and data.get('next')):
+                    break
+
+
+def run(base_url, concurrency, duration, username_prefix, stop=None):
+    """
+    concurrency명의 가상 사용자로 duration초 동안 시나리오를 돌림
+    반환: (Recorder, 실제 걸린 초)
+    """
+    media = {'png': _png_bytes(), 'wav': _wav_bytes()}
+    stop = stop or threading.Event()
+    recorders = [Recorder() for _ in range(concurrency)]
+    deadline = time.monotonic() + duration
+
+    def user(index):
+        session = Session(base_url, recorders[index])
+        journey = Journey(session, f'{username_prefix}{index}', media)
+        try:
+            if not journey.sign_in():
+                return
+            while time.monotonic() < deadline and not stop.is_set():
+                journey.round()
+        finally:
+            session.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    merged = Recorder()
+    for recorder in recorders:
+        merged.merge(recorder)
+    return merged, elapsed
+
+
+def _percentile(sorted_values, fraction):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summary(latencies, statuses, elapsed):
+    values = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if not (isinstance(status, int) and status < 400))
+    total = len(values)
+    return {
+        'requests': total,
+        'errors': errors,
+        'error_rate': round(errors / total, 4) if total else 0.0,
+        'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+        'latency_ms': {
+            name: round(value * 1000, 2) if value is not None else None
+            for name, value in (
+                ('p50', _percentile(values, 0.50)),
+                ('p95', _percentile(values, 0.95)),
+                ('p99', _percentile(values, 0.99)),
+                ('max', values[-1] if values else None),
+            )
+        },
+        'statuses': {str(status): count for status, count in sorted(statuses.items(), key=str)},
+    }
+
+
+def report(recorder, elapsed):
+    """전체와 엔드포인트별 처리량, p50/p95/p99, 오류율"""
+    all_latencies = [value for values in recorder.latencies.values() for value in values]
+    all_statuses = {}
+    for counts in recorder.statuses.values():
+        for status, count in counts.items():
+            all_statuses[status] = all_statuses.get(status, 0) + count
+    return {
+        'elapsed_seconds': round(elapsed, 2),
+        'total': _summary(all_latencies, all_statuses, elapsed),
+        'endpoints': {
+            name: _summary(recorder.latencies[name], recorder.statuses[name], elapsed)
+            for name in sorted(recorder.latencies)
+        },
+    }
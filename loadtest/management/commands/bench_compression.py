@@ -0,0 +1,75 @@
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+
+from prototype.compression import available_encodings
+
+
+class Command(BaseCommand):
+    help = (
+        "익명 GET 엔드포인트를 프로세스 안에서 반복 호출해 인코딩(identity/gzip/br)과 응답 캐시 사용 여부별로 "
+        "전송 바이트(헤더 포함)와 요청당 CPU 시간을 JSON으로 출력합니다. (CompressionMiddleware 효과 측정)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', default=['/api/posts/list-posts/', '/api/music/?limit=50',
+                                                          '/api/search/suggest/?q=a'])
+        parser.add_argument('--requests', type=int, default=200, help="조합마다 보낼 요청 수")
+        parser.add_argument('--output', help="결과 JSON을 저장할 파일 (생략하면 표준 출력)")
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError("requests는 양수여야 합니다.")
+        host = next((host for host in settings.ALLOWED_HOSTS if host and '*' not in host and not host.startswith('.')),
+                    'localhost')
+        client = Client(HTTP_HOST=host)
+        encodings = ['identity', *available_encodings()]
+
+        result = {'requests_per_case': options['requests'], 'encodings': encodings, 'paths': {}}
+        for path in options['paths']:
+            cases = {}
+            for cached in (False, True):
+                for encoding in encodings:
+                    name = f"{encoding}{'+cache' if cached else ''}"
+                    cases[name] = self.measure(client, path, encoding, cached, options['requests'])
+            result['paths'][path] = cases
+            self.stderr.write(f"{path}: " + ', '.join(
+                f"{name} {case['bytes_per_request']}B {case['cpu_ms_per_request']}ms" for name, case in cases.items()
+            ))
+
+        output = json.dumps(result, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def measure(self, client, path, encoding, cached, count):
+        paths = settings.RESPONSE_CACHE_PATHS if cached else {}
+        headers = {} if encoding == 'identity' else {'HTTP_ACCEPT_ENCODING': encoding}
+        with override_settings(RESPONSE_CACHE_PATHS=paths):
+            caches[settings.RESPONSE_CACHE_ALIAS].clear()
+            client.get(path, **headers)   # 첫 요청(캐시 채우기, import 등)은 빼고 잼
+            wire = 0
+            statuses = {}
+            cpu_started = time.process_time()
+            started = time.perf_counter()
+            for _ in range(count):
+                response = client.get(path, **headers)
+                body = b''.join(response.streaming_content) if response.streaming else response.content
+                wire += len(body) + len(response.serialize_headers()) + 4
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            cpu = time.process_time() - cpu_started
+            elapsed = time.perf_counter() - started
+        return {
+            'cached': cached and path.split('?')[0] in settings.RESPONSE_CACHE_PATHS,
+            'statuses': {str(status): n for status, n in sorted(statuses.items())},
+            'bytes_per_request': round(wire / count),
+            'cpu_ms_per_request': round(cpu * 1000 / count, 3),
+            'wall_ms_per_request': round(elapsed * 1000 / count, 3),
+        }
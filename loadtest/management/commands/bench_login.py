@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+import time
+import uuid
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from loadtest import client
+from loadtest.process import ServerProcess
+
+
+# 방식 이름: (서버 방식, async 로그인 뷰 사용 여부)
+MODES = {
+    'wsgi': ('wsgi', False),
+    'asgi': ('asgi', False),
+    'asgi-async': ('asgi', True),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "로그인 처리량을 잽니다. 서버를 방식별로 띄워 가상 사용자들이 같은 계정으로 로그인만 반복하고, "
+        "초당 로그인 수(코어당 포함), 지연 시간, 오류율과 그동안 가벼운 요청(--probe)의 지연 시간을 JSON으로 출력합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', default='wsgi,asgi,asgi-async', help=f"쉼표로 구분 ({', '.join(MODES)})")
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument('--duration', type=float, default=15)
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--probe', default='/api/music/?limit=1',
+                            help="로그인이 몰리는 동안 함께 재볼 가벼운 GET 경로 (빈 값이면 생략)")
+        parser.add_argument('--output', help="결과 JSON을 저장할 파일 (생략하면 표준 출력)")
+
+    def handle(self, *args, **options):
+        modes = [mode.strip() for mode in options['modes'].split(',') if mode.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"알 수 없는 방식: {', '.join(sorted(unknown))}")
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError("concurrency와 duration은 양수여야 합니다.")
+
+        cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+        username = f'lt{uuid.uuid4().hex[:8]}login'
+        password = f'Lt-{uuid.uuid4().hex[:12]}!'
+        User.objects.create_user(username=username, password=password)
+
+        result = {
+            'run': {'concurrency': options['concurrency'], 'duration_seconds': options['duration'], 'cores': cores},
+            'modes': {},
+        }
+        try:
+            for mode in modes:
+                server_mode, async_auth = MODES[mode]
+                self.stderr.write(f"{mode}: 로그인 {options['concurrency']}개 동시, {options['duration']}초")
+                with ServerProcess(server_mode, options['host'], async_auth=async_auth) as url:
+                    recorder, elapsed = self.hammer(url, username, password, options)
+                report = client.report(recorder, elapsed)
+                logins = report['endpoints'].get('POST /api/accounts/login/', report['total'])
+                ok = logins['requests'] - logins['errors']
+                result['modes'][mode] = {
+                    'logins_per_second': round(ok / elapsed, 2),
+                    'logins_per_second_per_core': round(ok / elapsed / cores, 2),
+                    **report,
+                }
+        finally:
+            User.objects.filter(username=username).delete()
+
+        output = json.dumps(result, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def hammer(self, url, username, password, options):
+        """로그인 스레드 concurrency개 + probe 스레드 1개를 duration초 동안 돌림"""
+        deadline = time.monotonic() + options['duration']
+        workers = options['concurrency'] + (1 if options['probe'] else 0)
+        recorders = [client.Recorder() for _ in range(workers)]
+        credentials = {'username': username, 'password': password}
+
+        def login(index):
+            session = client.Session(url, recorders[index])
+            try:
+                while time.monotonic() < deadline:
+                    session.request('POST /api/accounts/login/', 'POST', '/api/accounts/login/', credentials)
+            finally:
+                session.close()
+
+        def probe(index):
+            session = client.Session(url, recorders[index])
+            try:
+                while time.monotonic() < deadline:
+                    session.request(f"GET {options['probe']} (probe)", 'GET', options['probe'])
+                    time.sleep(0.05)
+            finally:
+                session.close()
+
+        threads = [threading.Thread(target=login, args=(i,), daemon=True) for i in range(options['concurrency'])]
+        if options['probe']:
+            threads.append(threading.Thread(target=probe, args=(workers - 1,), daemon=True))
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        merged = client.Recorder()
+        for recorder in recorders:
+            merged.merge(recorder)
+        return merged, elapsed
@@ -0,0 +1,79 @@
+import json
+import time
+import uuid
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from loadtest import client
+from loadtest.process import ServerProcess
+
+
+class Command(BaseCommand):
+    help = (
+        "프로젝트를 localhost에 WSGI/ASGI로 띄우고 가상 사용자 시나리오(가입, 로그인, 미디어 게시물 작성, "
+        "좋아요 토글, 목록/좋아요 목록 페이지)를 동시에 돌려 엔드포인트별 처리량, p50/p95/p99, 오류율을 JSON으로 출력합니다. "
+        "설정된 DB에 실제로 쓰므로 개발용 DB에서 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--modes', default='wsgi,asgi', help="띄울 서버 방식, 쉼표로 구분 (wsgi, asgi)")
+        parser.add_argument('--target', help="이미 떠 있는 서버 주소 (예: http://127.0.0.1:8000). 주면 서버를 띄우지 않음")
+        parser.add_argument('--concurrency', type=int, default=10, help="가상 사용자 수")
+        parser.add_argument('--duration', type=float, default=30, help="방식마다 부하를 주는 시간(초)")
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--output', help="결과 JSON을 저장할 파일 (생략하면 표준 출력)")
+        parser.add_argument('--keep-data', action='store_true', help="테스트로 만든 사용자/게시물을 지우지 않음")
+        parser.add_argument('--throttle', action='store_true', help="띄운 서버에서 요청 제한(THROTTLE_BUCKET_RATES)을 켬")
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError("concurrency와 duration은 양수여야 합니다.")
+
+        if options['target']:
+            targets = [('external', options['target'])]
+        else:
+            modes = [mode.strip() for mode in options['modes'].split(',') if mode.strip()]
+            unknown = set(modes) - {'wsgi', 'asgi'}
+            if unknown:
+                raise CommandError(f"알 수 없는 방식: {', '.join(sorted(unknown))}")
+            targets = [(mode, None) for mode in modes]
+
+        run_id = uuid.uuid4().hex[:8]
+        result = {
+            'run': {
+                'id': run_id,
+                'concurrency': options['concurrency'],
+                'duration_seconds': options['duration'],
+                'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            },
+            'modes': {},
+        }
+        prefixes = []
+        try:
+            for mode, url in targets:
+                prefix = f'lt{run_id}{mode[0]}'
+                prefixes.append(prefix)
+                self.stderr.write(f"{mode}: 가상 사용자 {options['concurrency']}명, {options['duration']}초")
+                if url:
+                    recorder, elapsed = client.run(url, options['concurrency'], options['duration'], prefix)
+                else:
+                    with self.server(mode, options['host'], options['throttle']) as url:
+                        recorder, elapsed = client.run(url, options['concurrency'], options['duration'], prefix)
+                result['modes'][mode] = {'target': url, **client.report(recorder, elapsed)}
+        finally:
+            if not options['keep_data']:
+                for prefix in prefixes:
+                    # 게시물/좋아요는 CASCADE로 함께 지워짐 (미디어 파일은 gc_media로 정리)
+                    User.objects.filter(username__startswith=prefix).delete()
+
+        output = json.dumps(result, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output + '\n')
+            self.stderr.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def server(self, mode, host, throttle=False):
+        return ServerProcess(mode, host, throttle=throttle)
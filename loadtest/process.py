@@ -0,0 +1,60 @@
+# loadtest/process.py
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import CommandError
+
+
+class ServerProcess:
+    """loadtest.servers를 별도 프로세스로 띄우고 포트가 열릴 때까지 기다림"""
+    startup_timeout = 30
+
+    def __init__(self, mode, host, throttle=False, async_auth=False):
+        self.mode = mode
+        self.host = host
+        self.throttle = throttle
+        self.async_auth = async_auth
+        self.process = None
+
+    def __enter__(self):
+        with socket.socket() as sock:
+            sock.bind((self.host, 0))
+            port = sock.getsockname()[1]
+
+        env = dict(os.environ)
+        env['DJANGO_SETTINGS_MODULE'] = settings.SETTINGS_MODULE
+        env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+        command = [sys.executable, '-m', 'loadtest.servers', self.mode, self.host, str(port)]
+        if not self.throttle:
+            command.append('--no-throttle')
+        if self.async_auth:
+            command.append('--async-auth')
+        self.process = subprocess.Popen(
+            command,
+            cwd=settings.BASE_DIR, env=env,
+        )
+
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise CommandError(f"{self.mode} 서버가 시작하지 못했습니다 (종료 코드 {self.process.returncode}).")
+            try:
+                socket.create_connection((self.host, port), timeout=0.5).close()
+                return f'http://{self.host}:{port}'
+            except OSError:
+                time.sleep(0.1)
+        self.__exit__(None, None, None)
+        raise CommandError(f"{self.mode} 서버가 {self.startup_timeout}초 안에 열리지 않았습니다.")
+
+    def __exit__(self, *exc_info):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
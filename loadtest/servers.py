@@ -0,0 +1,225 @@
+# loadtest/servers.py
+"""
+부하 테스트용으로 프로젝트를 localhost에 띄우는 작은 서버들 (표준 라이브러리만 사용).
+
+    python -m loadtest.servers wsgi 127.0.0.1 8001
+    python -m loadtest.servers asgi 127.0.0.1 8002 [--no-throttle] [--async-auth]
+
+- wsgi: prototype.wsgi 를 wsgiref + 요청별 스레드로 실행 (HTTP/1.0, 요청마다 연결을 닫음)
+- asgi: prototype.asgi 를 asyncio 위의 최소 HTTP/1.1 서버로 실행 (keep-alive, chunked 응답)
+운영용 서버(gunicorn/uvicorn)를 대신하려는 것이 아니라, 같은 조건에서 두 방식을 비교하려는 용도다.
+운영 서버를 재려면 loadtest --target 으로 이미 떠 있는 서버에 붙는다.
+"""
+import asyncio
+import os
+import sys
+from socketserver import ThreadingMixIn
+from urllib.parse import unquote
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+
+# 요청 헤더 최대 크기 / 연결이 놀고 있을 때 닫기까지의 시간(초)
+MAX_HEADER_BYTES = 64 * 1024
+KEEPALIVE_TIMEOUT = 15
+
+REASONS = {
+    200: 'OK', 201: 'Created', 204: 'No Content', 206: 'Partial Content',
+    301: 'Moved Permanently', 302: 'Found', 304: 'Not Modified',
+    400: 'Bad Request', 401: 'Unauthorized', 403: 'Forbidden', 404: 'Not Found',
+    405: 'Method Not Allowed', 409: 'Conflict', 413: 'Payload Too Large', 429: 'Too Many Requests',
+    500: 'Internal Server Error', 503: 'Service Unavailable',
+}
+
+
+# ==================== WSGI ====================
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_wsgi(host, port):
+    from prototype.wsgi import application
+
+    server = make_server(host, port, application, ThreadingWSGIServer, QuietHandler)
+    server.serve_forever()
+
+
+# ==================== ASGI ====================
+
+class _Connection:
+    """연결 하나에서 요청을 차례로 읽어 ASGI 앱에 넘김"""
+
+    def __init__(self, app, reader, writer):
+        self.app = app
+        self.reader = reader
+        self.writer = writer
+        self.closed = asyncio.Event()
+
+    async def serve(self):
+        try:
+            while await self.handle_one():
+                pass
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.closed.set()
+            self.writer.close()
+
+    async def respond_simple(self, status, body=b''):
+        self.writer.write(
+            f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\ncontent-length: {len(body)}\r\n'
+            f'connection: close\r\n\r\n'.encode('latin-1') + body
+        )
+        await self.writer.drain()
+
+    async def handle_one(self):
+        """요청 하나 처리. 연결을 계속 쓸 수 있으면 True"""
+        head = await asyncio.wait_for(self.reader.readuntil(b'\r\n\r\n'), KEEPALIVE_TIMEOUT)
+        lines = head[:-4].decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            await self.respond_simple(400)
+            return False
+        headers = []
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers.append((name.strip().lower().encode('latin-1'), value.strip().encode('latin-1')))
+        header_map = dict(headers)
+
+        if b'chunked' in header_map.get(b'transfer-encoding', b''):
+            await self.respond_simple(411)   # 요청 본문은 content-length만 지원
+            return False
+        body = await self.reader.readexactly(int(header_map.get(b'content-length', b'0') or 0))
+
+        keep_alive = version == 'HTTP/1.1' and header_map.get(b'connection', b'').lower() != b'close'
+        path, _, query = target.partition('?')
+        sockname = self.writer.get_extra_info('sockname')
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0', 'spec_version': '2.3'},
+            'http_version': version.split('/')[-1],
+            'method': method.upper(),
+            'scheme': 'http',
+            'path': unquote(path),
+            'raw_path': path.encode('latin-1'),
+            'query_string': query.encode('latin-1'),
+            'root_path': '',
+            'headers': headers,
+            'client': self.writer.get_extra_info('peername')[:2],
+            'server': sockname[:2] if sockname else None,
+        }
+
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await self.closed.wait()
+            return {'type': 'http.disconnect'}
+
+        state = {'started': False, 'chunked': False, 'headers': None}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                state['status'] = message['status']
+                state['headers'] = list(message.get('headers', []))
+                return
+            if message['type'] != 'http.response.body':
+                return
+            data = message.get('body', b'')
+            more = message.get('more_body', False)
+            if not state['started']:
+                state['started'] = True
+                response_headers = state['headers']
+                names = {name.lower() for name, _ in response_headers}
+                if b'content-length' not in names:
+                    if more:
+                        state['chunked'] = True
+                        response_headers.append((b'transfer-encoding', b'chunked'))
+                    else:
+                        response_headers.append((b'content-length', str(len(data)).encode()))
+                response_headers.append((b'connection', b'keep-alive' if keep_alive else b'close'))
+                status = state['status']
+                self.writer.write(
+                    f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\n'.encode('latin-1')
+                    + b''.join(name + b': ' + value + b'\r\n' for name, value in response_headers)
+                    + b'\r\n'
+                )
+            if state['chunked']:
+                if data:
+                    self.writer.write(f'{len(data):x}\r\n'.encode() + data + b'\r\n')
+                if not more:
+                    self.writer.write(b'0\r\n\r\n')
+            else:
+                self.writer.write(data)
+            await self.writer.drain()
+
+        await self.app(scope, receive, send)
+        if not state['started']:
+            await self.respond_simple(500)
+            return False
+        return keep_alive
+
+
+async def _lifespan(app):
+    """lifespan startup을 보내고 완료를 기다림 (앱이 lifespan을 지원하지 않으면 그냥 넘어감)"""
+    queue = asyncio.Queue()
+    started = asyncio.get_running_loop().create_future()
+    await queue.put({'type': 'lifespan.startup'})
+
+    async def receive():
+        return await queue.get()
+
+    async def send(message):
+        if message['type'].startswith('lifespan.startup') and not started.done():
+            started.set_result(message['type'])
+
+    task = asyncio.ensure_future(app({'type': 'lifespan', 'asgi': {'version': '3.0'}}, receive, send))
+    await asyncio.wait({task, started}, return_when=asyncio.FIRST_COMPLETED)
+    return task
+
+
+async def _serve_asgi(host, port):
+    from prototype.asgi import application
+
+    lifespan = await _lifespan(application)
+    server = await asyncio.start_server(
+        lambda reader, writer: _Connection(application, reader, writer).serve(),
+        host, port, limit=MAX_HEADER_BYTES, backlog=128,
+    )
+    async with server:
+        await server.serve_forever()
+    lifespan.cancel()
+
+
+def serve_asgi(host, port):
+    asyncio.run(_serve_asgi(host, port))
+
+
+SERVERS = {
+    'wsgi': serve_wsgi,
+    'asgi': serve_asgi,
+}
+
+
+if __name__ == '__main__':
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'prototype.settings')
+    mode, host, port = sys.argv[1], sys.argv[2], int(sys.argv[3])
+    flags = sys.argv[4:]
+    if flags:
+        from django.conf import settings
+        if '--no-throttle' in flags:
+            # 가상 사용자가 모두 같은 IP라 로그인/가입 제한에 걸리므로 끄고 잼
+            settings.THROTTLE_ENABLED = False
+        if '--async-auth' in flags:
+            settings.ACCOUNTS_ASYNC_AUTH_VIEWS = True
+    SERVERS[mode](host, port)
@@ -0,0 +1,78 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase
+
+from .client import Recorder, Session, _percentile, report
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status = 404 if self.path.endswith('/missing/') else 200
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ReportTests(SimpleTestCase):
+    def test_nearest_rank_percentiles(self):
+        values = list(range(1, 101))
+        self.assertEqual([_percentile(values, f) for f in (0.5, 0.95, 0.99, 1.0)], [50, 95, 99, 100])
+        self.assertEqual(_percentile([7], 0.99), 7)
+        self.assertIsNone(_percentile([], 0.5))
+
+    def test_report_counts_errors_per_endpoint(self):
+        first, second = Recorder(), Recorder()
+        for ms in range(1, 100):
+            first.add('GET /a', ms / 1000, 200)
+        first.add('GET /a', 0.5, 503)
+        second.add('POST /b', 0.01, 201)
+        second.add('POST /b', 0.02, 'ConnectionResetError')
+        first.merge(second)
+
+        result = report(first, elapsed=2.0)
+        self.assertEqual(result['total']['requests'], 102)
+        self.assertEqual(result['total']['errors'], 2)
+        a = result['endpoints']['GET /a']
+        self.assertEqual((a['requests'], a['errors'], a['error_rate']), (100, 1, 0.01))
+        self.assertEqual(a['latency_ms'], {'p50': 50.0, 'p95': 95.0, 'p99': 99.0, 'max': 500.0})
+        self.assertEqual(result['endpoints']['POST /b']['statuses'], {'201': 1, 'ConnectionResetError': 1})
+        self.assertEqual(result['endpoints']['POST /b']['throughput_rps'], 1.0)
+
+
+class SessionTests(SimpleTestCase):
+    def setUp(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.base_url = f'http://127.0.0.1:{server.server_address[1]}/prefix/'
+
+    def test_requests_are_recorded_by_name(self):
+        recorder = Recorder()
+        session = Session(self.base_url, recorder)
+        self.addCleanup(session.close)
+
+        self.assertEqual(session.request('GET /x/', 'GET', '/x/'), {'path': '/prefix/x/'})
+        self.assertIsNone(session.request('GET /missing/', 'GET', '/missing/'))
+        self.assertEqual(session.request('GET /x/', 'GET', '/x/?page=2')['path'], '/prefix/x/?page=2')
+        self.assertEqual(recorder.statuses, {'GET /x/': {200: 2}, 'GET /missing/': {404: 1}})
+
+    def test_connection_errors_are_recorded(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        recorder = Recorder()
+        session = Session(f'http://127.0.0.1:{port}/', recorder, timeout=1)
+        self.assertIsNone(session.request('GET /', 'GET', '/'))
+        self.assertEqual(list(recorder.statuses['GET /']), ['ConnectionRefusedError'])
@@ -1,10 +1,13 @@
 from django.contrib import admin
-from .models import Music, MusicLike
+from django.db.models import Count
+from prototype.paginators import EstimatedCountAdminMixin
+from .models import Music, MusicLike, GenreFacet
 
 
 @admin.register(Music)
-class MusicAdmin(admin.ModelAdmin):
+class MusicAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['title', 'author', 'genre', 'created_at', 'likes_count']
+    list_select_related = ['author']
     list_filter = ['genre', 'created_at']
     search_fields = ['title', 'description', 'author__username']
     readonly_fields = ['created_at', 'updated_at']
@@ -21,10 +24,33 @@ class MusicAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # 행마다 COUNT 쿼리를 날리지 않도록 좋아요 수를 한 번에 집계
+        return super().get_queryset(request).annotate(_likes_count=Count('music_likes'))
+
+    @admin.display(description='좋아요', ordering='_likes_count')
+    def likes_count(self, obj):
+        return obj._likes_count
+
+    def delete_model(self, request, obj):
+        # 삭제 표시만 하고 실제 삭제는 reap_deleted에 맡김
+        obj.soft_delete()
+
+    def delete_queryset(self, request, queryset):
+        for obj in queryset:
+            obj.soft_delete()
+
 
 @admin.register(MusicLike)
-class MusicLikeAdmin(admin.ModelAdmin):
+class MusicLikeAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['user', 'music', 'created_at']
+    list_select_related = ['user', 'music']
     list_filter = ['created_at']
     search_fields = ['user__username', 'music__title']
     readonly_fields = ['created_at']
+
+
+@admin.register(GenreFacet)
+class GenreFacetAdmin(admin.ModelAdmin):
+    list_display = ['genre', 'music_count']
+    search_fields = ['genre']
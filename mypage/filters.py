@@ -0,0 +1,13 @@
+from django_filters import rest_framework as filters
+from .models import Music
+
+
+class MusicCatalogueFilter(filters.FilterSet):
+    """음악 카탈로그 필터 (?genre=, ?artist=, ?duration_min=&duration_max=)"""
+    genre = filters.CharFilter(field_name='genre')
+    artist = filters.CharFilter(field_name='artist')
+    duration = filters.RangeFilter(field_name='duration')
+
+    class Meta:
+        model = Music
+        fields = ['genre', 'artist', 'duration']
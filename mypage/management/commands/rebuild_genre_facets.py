@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from mypage.models import Music, GenreFacet
+
+
+class Command(BaseCommand):
+    help = "Music 테이블을 다시 집계해 GenreFacet을 재구성합니다. (signal을 거치지 않은 변경 보정용)"
+
+    def handle(self, *args, **options):
+        rows = (
+            Music.objects.exclude(genre__isnull=True).exclude(genre='')
+            .order_by().values('genre').annotate(music_count=Count('id'))
+        )
+        with transaction.atomic():
+            GenreFacet.objects.all().delete()
+            facets = GenreFacet.objects.bulk_create([GenreFacet(**row) for row in rows])
+        self.stdout.write(self.style.SUCCESS(f"장르 {len(facets)}개 재집계 완료"))
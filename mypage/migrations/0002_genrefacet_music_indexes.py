@@ -0,0 +1,50 @@
+# Generated by Django 4.2.23 on 2026-10-19 07:36
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_genre_facets(apps, schema_editor):
+    Music = apps.get_model('mypage', 'Music')
+    GenreFacet = apps.get_model('mypage', 'GenreFacet')
+    rows = (
+        Music.objects.exclude(genre__isnull=True).exclude(genre='')
+        .order_by().values('genre').annotate(music_count=Count('id'))
+    )
+    GenreFacet.objects.bulk_create([GenreFacet(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mypage', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('genre', models.CharField(max_length=100, unique=True, verbose_name='장르')),
+                ('music_count', models.IntegerField(default=0, verbose_name='음악 수')),
+            ],
+            options={
+                'verbose_name': '장르 facet',
+                'verbose_name_plural': '장르 facet들',
+                'ordering': ['-music_count', 'genre'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='music',
+            index=models.Index(fields=['genre', '-created_at'], name='music_genre_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='music',
+            index=models.Index(fields=['artist'], name='music_artist_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='music',
+            index=models.Index(fields=['duration'], name='music_duration_idx'),
+        ),
+        migrations.RunPython(populate_genre_facets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-19 07:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mypage', '0002_genrefacet_music_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='music',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='삭제 요청일'),
+        ),
+    ]
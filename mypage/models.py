@@ -1,5 +1,12 @@
 from django.db import models
+from django.db.models import F
 from django.contrib.auth.models import User
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from posts.models import LiveManager
+from prototype.fragment_cache import fragment_cache
+from search import suggest
 
 
 class Music(models.Model):
@@ -14,20 +21,48 @@ class Music(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+    deleted_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="삭제 요청일")
+    
+    # 삭제 표시된 음악은 reap_deleted가 좋아요/미디어와 함께 실제로 지움
+    objects = LiveManager()
+    all_objects = models.Manager()
     
     class Meta:
         ordering = ['-created_at']
         verbose_name = "음악"
         verbose_name_plural = "음악들"
+        indexes = [
+            models.Index(fields=['genre', '-created_at'], name='music_genre_created_idx'),
+            models.Index(fields=['artist'], name='music_artist_idx'),
+            models.Index(fields=['duration'], name='music_duration_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
     @property
     def likes_count(self):
-        """좋아요 개수"""
+        """좋아요 개수 (목록 쿼리가 likes_count_field로 함께 읽었으면 그 값)"""
+        annotated = getattr(self, 'likes_count_field', None)
+        if annotated is not None:
+            return annotated
         return self.music_likes.count()
 
+    def soft_delete(self):
+        """
+        삭제 표시만 하고 실제 삭제(좋아요/미디어 포함)는 reap_deleted 작업에 맡김.
+        이미 삭제 표시된 음악은 그대로 둠 (삭제 시각이 늦춰지지 않도록)
+        """
+        from tasks.queue import enqueue
+
+        deleted_at = timezone.now()
+        if Music.objects.filter(pk=self.pk).update(deleted_at=deleted_at):
+            self.deleted_at = deleted_at
+            bump_genre_facets({self.genre: -1})
+            fragment_cache.bump('music', self.pk)
+            suggest.forget('music', self.pk)
+            enqueue('posts.tasks.reap_deleted', unique=True)
+
 
 class MusicLike(models.Model):
     """음악 좋아요 모델"""
@@ -43,3 +78,56 @@ class MusicLike(models.Model):
     
     def __str__(self):
         return f"{self.user.username} likes {self.music.title}"
+
+
+class GenreFacet(models.Model):
+    """장르별 음악 수 (카탈로그 facet 용, Music 저장/삭제 시 증감)"""
+    genre = models.CharField(max_length=100, unique=True, verbose_name="장르")
+    music_count = models.IntegerField(default=0, verbose_name="음악 수")
+
+    class Meta:
+        ordering = ['-music_count', 'genre']
+        verbose_name = "장르 facet"
+        verbose_name_plural = "장르 facet들"
+
+    def __str__(self):
+        return f"{self.genre} ({self.music_count})"
+
+
+def bump_genre_facets(deltas):
+    """{장르: 증감} 만큼 GenreFacet.music_count를 조정"""
+    for genre, delta in deltas.items():
+        if not genre or not delta:
+            continue
+        updated = GenreFacet.objects.filter(genre=genre).update(music_count=F('music_count') + delta)
+        if not updated:
+            GenreFacet.objects.get_or_create(genre=genre)
+            GenreFacet.objects.filter(genre=genre).update(music_count=F('music_count') + delta)
+
+
+# Signal: 장르가 바뀌면 이전 장르는 -1, 새 장르는 +1
+# (오디오 파일도 같이 읽어 둠 - 바뀌었을 때만 recommendations가 특징을 다시 추출)
+@receiver(pre_save, sender=Music)
+def remember_music_genre(sender, instance, **kwargs):
+    instance._previous_genre = instance._previous_audio_file = None
+    if instance.pk:
+        previous = Music.all_objects.filter(pk=instance.pk).values_list('genre', 'audio_file').first()
+        if previous:
+            instance._previous_genre, instance._previous_audio_file = previous
+
+
+@receiver(post_save, sender=Music)
+def update_genre_facet_on_save(sender, instance, created, **kwargs):
+    fragment_cache.bump('music', instance.pk)
+    if instance.deleted_at:
+        return  # 삭제 표시할 때 이미 빠짐
+    previous = None if created else getattr(instance, '_previous_genre', None)
+    if created or previous != instance.genre:
+        bump_genre_facets({previous: -1, instance.genre: 1})
+
+
+@receiver(post_delete, sender=Music)
+def update_genre_facet_on_delete(sender, instance, **kwargs):
+    if instance.deleted_at:
+        return  # 삭제 표시할 때 이미 빠짐
+    bump_genre_facets({instance.genre: -1})
@@ -1,6 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import Music, MusicLike
+from posts.likes import is_liked
+from prototype.fieldsets import SparseFieldsetMixin
+from prototype.fragment_cache import FragmentCacheMixin, FragmentListSerializer, NestedFragmentMixin
 
 
 class MusicAuthorSerializer(serializers.ModelSerializer):
@@ -10,7 +13,10 @@ class MusicAuthorSerializer(serializers.ModelSerializer):
         fields = ['id', 'username']
 
 
-class MusicSerializer(serializers.ModelSerializer):
+class MusicSerializer(SparseFieldsetMixin, FragmentCacheMixin, serializers.ModelSerializer):
+    fragment_kind = 'music'
+    per_user_fields = ('is_liked',)
+
     author = MusicAuthorSerializer(read_only=True)
     artist = serializers.CharField(allow_blank=True, required=False)  # ⭐ 추가!
     likes_count = serializers.IntegerField(read_only=True)
@@ -22,20 +28,26 @@ class MusicSerializer(serializers.ModelSerializer):
                   'audio_file', 'cover_image', 'genre', 'duration', 
                   'created_at', 'likes_count', 'is_liked']
         read_only_fields = ['id', 'created_at', 'author']
+        list_serializer_class = FragmentListSerializer
     
     def get_is_liked(self, obj):
         """현재 사용자가 좋아요 했는지 확인"""
+        liked = self.context.get('liked_ids')
+        if liked is not None:
+            return obj.pk in liked   # 뷰가 한 번에 조회해 둔 경우 (batch)
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return MusicLike.objects.filter(user=request.user, music=obj).exists()
+            return is_liked('music', request.user, obj.pk)
         return False
 
 
-class FavoriteMusicSerializer(serializers.ModelSerializer):
+class FavoriteMusicSerializer(NestedFragmentMixin, serializers.ModelSerializer):
     """좋아요한 음악 시리얼라이저"""
+    fragment_field = 'music'
     music = MusicSerializer(read_only=True)
     
     class Meta:
         model = MusicLike
         fields = ['id', 'music', 'created_at']
         read_only_fields = ['id', 'created_at']
+        list_serializer_class = FragmentListSerializer
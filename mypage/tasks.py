@@ -0,0 +1,9 @@
+from django.core.management import call_command
+
+from tasks.queue import task
+
+
+@task(lane='low', exclusive=True)
+def rebuild_genre_facets():
+    """장르 facet 재집계"""
+    call_command('rebuild_genre_facets')
@@ -1,3 +1,53 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from mypage.models import Music, MusicLike
+from prototype.fragment_cache import fragment_cache
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'mypage-tests'},
+    'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'mypage-tests'},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RESPONSE_CACHE_PATHS={}, THROTTLE_ENABLED=False)
+class MusicCatalogueTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        fragment_cache.local.clear()
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.fans = [User.objects.create_user(f'fan{i}', password='pw12345!') for i in range(3)]
+        self.music = [
+            Music.objects.create(title='a', author=self.author, artist='x', genre='rock', duration=100),
+            Music.objects.create(title='b', author=self.author, artist='x', genre='jazz', duration=300),
+            Music.objects.create(title='c', author=self.author, artist='y', genre='rock', duration=200),
+        ]
+        for fan in self.fans:
+            MusicLike.objects.create(user=fan, music=self.music[0])
+        MusicLike.objects.create(user=self.fans[0], music=self.music[2])
+        self.client = APIClient()
+
+    def facets(self, **params):
+        response = self.client.get('/api/music/', params)
+        self.assertEqual(response.status_code, 200)
+        return {row['genre']: row['music_count'] for row in response.json()['facets']['genre']}
+
+    def test_facets_without_filters_cover_the_whole_catalogue(self):
+        self.assertEqual(self.facets(), {'rock': 2, 'jazz': 1})
+        # 장르 필터만 있으면 다른 장르로 바꿀 수 있도록 전체 기준
+        self.assertEqual(self.facets(genre='rock'), {'rock': 2, 'jazz': 1})
+
+    def test_facets_follow_other_filters(self):
+        self.assertEqual(self.facets(artist='x'), {'rock': 1, 'jazz': 1})
+        self.assertEqual(self.facets(duration_min=150), {'rock': 1, 'jazz': 1})
+        self.assertEqual(self.facets(artist='y', genre='jazz'), {'rock': 1})
+
+    def test_likes_count_is_read_with_the_page(self):
+        # 조각 캐시가 비어 있어도 행마다 COUNT하지 않음 (개수, 목록, facet)
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/music/')
+        counts = {item['id']: item['likes_count'] for item in response.json()['results']}
+        self.assertEqual(counts, {self.music[0].pk: 3, self.music[1].pk: 0, self.music[2].pk: 1})
@@ -1,13 +1,31 @@
 from django.urls import path
-from .views import MyMusicListView, FavoriteMusicListView, toggle_music_like
+from .views import (
+    MyMusicListView, FavoriteMusicListView, MusicCatalogueView, MusicBatchView, toggle_music_like, record_music_view
+)
+from recommendations.views import RelatedMusicView, SimilarMusicView
 
 urlpatterns = [
+    # 전체 음악 카탈로그
+    path('', MusicCatalogueView.as_view(), name='music-list'),
+    
     # 내 음악 목록
     path('my-music/', MyMusicListView.as_view(), name='my-music'),
     
     # 좋아요한 음악 목록
     path('favorites/', FavoriteMusicListView.as_view(), name='favorite-music'),
+
+    # id 목록으로 한 번에 조회
+    path('batch/', MusicBatchView.as_view(), name='music-batch'),
     
     # 음악 좋아요 토글
     path('<int:music_id>/like/', toggle_music_like, name='toggle-music-like'),
+
+    # 음악 재생(조회) 기록
+    path('<int:music_id>/view/', record_music_view, name='music-view'),
+
+    # 함께 좋아한 음악 추천
+    path('<int:music_id>/related/', RelatedMusicView.as_view(), name='related-music'),
+
+    # 소리가 비슷한 음악
+    path('<int:music_id>/similar/', SimilarMusicView.as_view(), name='similar-music'),
 ]
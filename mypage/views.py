@@ -1,11 +1,21 @@
 from rest_framework import status, generics
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.pagination import PageNumberPagination
-from django.db.models import Q, Count
-from .models import Music, MusicLike
+from rest_framework.filters import OrderingFilter
+from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Q, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from .models import Music, MusicLike, GenreFacet
+from .filters import MusicCatalogueFilter
 from .serializers import MusicSerializer, FavoriteMusicSerializer
+from prototype.batch import BatchLookupView
+from prototype.fieldsets import SparseFieldsetViewMixin
+from prototype.streaming import StreamingListMixin
+from prototype.throttling import TokenBucketThrottle
+from posts.likes import add_like, remove_like, toggle_like, liked_ids, LikeTargetMissing
+from analytics import rollups
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -15,7 +25,7 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class MyMusicListView(generics.ListAPIView):
+class MyMusicListView(SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView):
     """내 음악 목록 조회"""
     serializer_class = MusicSerializer
     permission_classes = [IsAuthenticated]
@@ -42,42 +52,128 @@ class MyMusicListView(generics.ListAPIView):
         return queryset
 
 
-class FavoriteMusicListView(generics.ListAPIView):
-    """내가 좋아요한 음악 목록 조회"""
+class MusicCatalogueView(SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView):
+    """
+    전체 음악 카탈로그 (장르/아티스트/재생 시간 필터 + 장르 facet)
+    장르 facet은 장르 외의 필터를 적용한 결과 기준 (장르를 바꿔 고를 수 있도록 ?genre=는 무시)
+    """
+    serializer_class = MusicSerializer
+    permission_classes = [AllowAny]
+    pagination_class = StandardResultsSetPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = MusicCatalogueFilter
+    ordering_fields = ['created_at', 'duration', 'title']
+    ordering = ['-created_at']
+
+    def get_queryset(self):
+        # likes_count를 행마다 COUNT하지 않도록 상관 서브쿼리로 함께 읽음 (페이지에 나오는 행만 계산)
+        likes = (
+            MusicLike.objects.filter(music=OuterRef('pk')).order_by()
+            .values('music').annotate(n=Count('id')).values('n')
+        )
+        return Music.objects.select_related('author').annotate(
+            likes_count_field=Coalesce(Subquery(likes), 0)
+        )
+
+    def get_facets(self):
+        params = self.request.query_params.copy()
+        params.pop('genre', None)
+        filterset = MusicCatalogueFilter(params, queryset=Music.objects.all())
+        if not filterset.is_valid() or not any(value for value in filterset.form.cleaned_data.values()):
+            # 필터가 없으면 GROUP BY 대신 미리 집계된 GenreFacet 테이블에서 읽음
+            return {
+                'genre': list(GenreFacet.objects.filter(music_count__gt=0).values('genre', 'music_count'))
+            }
+        return {
+            'genre': list(
+                filterset.qs.exclude(genre__isnull=True).exclude(genre='').order_by()
+                .values('genre').annotate(music_count=Count('id')).order_by('-music_count', 'genre')
+            )
+        }
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data['facets'] = self.get_facets()
+        return response
+
+    def get_stream_envelope(self, envelope):
+        # ?stream=1 에서도 같은 facets를 results 앞에 넣음
+        return {**(envelope or {}), 'facets': self.get_facets()}
+
+
+class FavoriteMusicListView(SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView):
+    """내가 좋아요한 음악 목록 조회 (?fields= / ?omit= 은 안쪽 music에 적용)"""
     serializer_class = FavoriteMusicSerializer
+    projection_field = 'music'
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
     
     def get_queryset(self):
         user = self.request.user
-        return MusicLike.objects.filter(user=user).select_related('music', 'music__author')
+        return MusicLike.objects.filter(
+            user=user, music__deleted_at__isnull=True
+        ).select_related('music', 'music__author')
 
 
-@api_view(['POST'])
+class MusicBatchView(BatchLookupView):
+    """음악 여러 개를 id로 한 번에 조회 (?ids=1,2,3, 요청 순서 유지, 없는 id는 missing)"""
+    serializer_class = MusicSerializer
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        return Music.objects.select_related('author')
+
+    def get_batch_context(self, objects):
+        if self.request.user.is_authenticated:
+            return {'liked_ids': liked_ids('music', self.request.user, list(objects))}
+        return {}
+
+
+@api_view(['POST', 'PUT', 'DELETE'])
 @permission_classes([IsAuthenticated])
+@throttle_classes([TokenBucketThrottle.scoped('like')])
 def toggle_music_like(request, music_id):
-    """음악 좋아요 토글"""
+    """음악 좋아요 토글 (POST) / 좋아요 (PUT) / 좋아요 취소 (DELETE)"""
+    user = request.user
+
     try:
-        music = Music.objects.get(id=music_id)
-    except Music.DoesNotExist:
+        if request.method == 'PUT':
+            add_like('music', user, music_id)
+            is_liked = True
+        elif request.method == 'DELETE':
+            remove_like('music', user, music_id)
+            is_liked = False
+        else:
+            is_liked = toggle_like('music', user, music_id)
+    except LikeTargetMissing:
         return Response(
             {"error": "음악을 찾을 수 없습니다."},
             status=status.HTTP_404_NOT_FOUND
         )
     
-    user = request.user
-    like, created = MusicLike.objects.get_or_create(user=user, music=music)
-    
-    if not created:
-        # 이미 좋아요가 있으면 삭제 (토글)
-        like.delete()
+    if not is_liked:
+        # 좋아요 취소 (DELETE 또는 이미 좋아요였던 경우의 토글)
         return Response(
             {"message": "좋아요가 취소되었습니다.", "is_liked": False},
             status=status.HTTP_200_OK
         )
     else:
-        # 새로 좋아요 추가
+        # 좋아요 (PUT은 멱등이므로 항상 200, 토글로 새로 누른 경우만 201)
         return Response(
             {"message": "좋아요를 눌렀습니다.", "is_liked": True},
-            status=status.HTTP_201_CREATED
+            status=status.HTTP_201_CREATED if request.method == 'POST' else status.HTTP_200_OK
+        )
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@throttle_classes([TokenBucketThrottle.scoped('view')])
+def record_music_view(request, music_id):
+    """음악 재생(조회) 기록 (작성자 대시보드 집계)"""
+    if not Music.objects.filter(pk=music_id).exists():
+        return Response(
+            {"error": "음악을 찾을 수 없습니다."},
+            status=status.HTTP_404_NOT_FOUND
         )
+    rollups.bump('music', {music_id: {'views': 1}})
+    return Response(status=status.HTTP_204_NO_CONTENT)
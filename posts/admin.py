@@ -1,10 +1,13 @@
 from django.contrib import admin
+from django.db.models import Count
+from prototype.paginators import EstimatedCountAdminMixin
 from .models import Post, PostLike
 
 
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['title', 'author', 'created_at', 'likes_count', 'view_count', 'like_count']
+    list_select_related = ['author']
     list_filter = ['created_at']
     search_fields = ['title', 'content', 'author__username']
     readonly_fields = ['created_at']
@@ -24,10 +27,27 @@ class PostAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # 행마다 COUNT 쿼리를 날리지 않도록 좋아요 수를 한 번에 집계
+        return super().get_queryset(request).annotate(_likes_count=Count('post_likes'))
+
+    @admin.display(description='좋아요', ordering='_likes_count')
+    def likes_count(self, obj):
+        return obj._likes_count
+
+    def delete_model(self, request, obj):
+        # 삭제 표시만 하고 실제 삭제는 reap_deleted에 맡김
+        obj.soft_delete()
+
+    def delete_queryset(self, request, queryset):
+        for obj in queryset:
+            obj.soft_delete()
+
 
 @admin.register(PostLike)
-class PostLikeAdmin(admin.ModelAdmin):
+class PostLikeAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
     list_display = ['user', 'post', 'created_at']
+    list_select_related = ['user', 'post']
     list_filter = ['created_at']
     search_fields = ['user__username', 'post__title']
     readonly_fields = ['created_at']
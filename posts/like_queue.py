@@ -0,0 +1,259 @@
+# posts/like_queue.py
+"""
+좋아요 대량 유입 모드 (settings.LIKE_INGESTION_MODE = 'queued')
+
+요청 스레드는 좋아요/취소 의도를 로컬 append-only 파일에 한 줄 쓰고 바로 응답한다.
+쓰면서 작업 큐에 flush_likes를 LIKE_FLUSH_DELAY초 뒤로 예약하고 (run_workers가 실행, flush_likes 커맨드로도 가능),
+flush가 파일을 통째로 가져가 (user, 대상)별 마지막 의도만 남긴 뒤
+bulk_create / 일괄 삭제 + like_count 증감으로 큰 트랜잭션 몇 개에 반영한다.
+flush는 한 번에 하나만 돈다 (flush 잠금을 못 잡으면 이미 도는 flush에 맡기고 바로 끝남).
+반영 전까지는 캐시에 둔 overlay로 본인의 is_liked를 맞춰준다.
+"""
+import fcntl
+import json
+import os
+import time
+from collections import Counter
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import F, Q
+
+from analytics import rollups
+from mypage.models import Music
+from prototype import live
+from prototype.fragment_cache import fragment_cache
+from sync.models import record_tombstones
+from .models import Post
+
+
+QUEUE_FILE = 'likes.log'
+LOCK_FILE = 'likes.lock'
+FLUSH_LOCK_FILE = 'likes.flush.lock'
+PROCESSING_SUFFIX = '.processing'
+
+# 종류별 대상 모델 (like_count 컬럼이 있으면 증감도 반영)
+TARGET_MODELS = {
+    'post': Post,
+    'music': Music,
+}
+
+
+def update_like_counts(kind, deltas):
+    """
+    {대상 id: 증감}만큼 like_count 조정 (like_count 컬럼이 있는 모델만). 같은 증감값끼리 묶어서 UPDATE
+    sync/queued 모두 좋아요 행을 바꾸는 트랜잭션 안에서 부름
+    """
+    target_model = TARGET_MODELS[kind]
+    if not any(f.name == 'like_count' for f in target_model._meta.concrete_fields):
+        return
+    by_delta = {}
+    for target_id, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(target_id)
+    for delta, ids in by_delta.items():
+        target_model.objects.filter(pk__in=ids).update(like_count=F('like_count') + delta)
+
+
+def is_enabled():
+    return getattr(settings, 'LIKE_INGESTION_MODE', 'sync') == 'queued'
+
+
+def _queue_dir():
+    path = settings.LIKE_QUEUE_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _overlay_cache():
+    return caches[getattr(settings, 'LIKE_OVERLAY_CACHE', 'default')]
+
+
+def _overlay_key(kind, user_id, target_id):
+    return f'like-overlay:{kind}:{user_id}:{target_id}'
+
+
+def enqueue(kind, user_id, target_id, liked):
+    """좋아요(liked=True)/취소 의도를 큐 파일에 추가하고 overlay 갱신"""
+    line = json.dumps({
+        'k': kind, 'u': user_id, 't': target_id, 'l': liked, 'ts': time.time(),
+    }, separators=(',', ':')) + '\n'
+
+    queue_dir = _queue_dir()
+    # flush가 파일을 rename하는 동안에는 쓰지 않도록 공유 잠금
+    with open(os.path.join(queue_dir, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_SH)
+        fd = os.open(os.path.join(queue_dir, QUEUE_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode('utf-8'))
+            if getattr(settings, 'LIKE_QUEUE_FSYNC', False):
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    _overlay_cache().set(
+        _overlay_key(kind, user_id, target_id), liked,
+        getattr(settings, 'LIKE_OVERLAY_TIMEOUT', 600)
+    )
+    schedule_flush()
+
+
+def schedule_flush():
+    """
+    작업 큐에 flush_likes를 예약. LIKE_FLUSH_DELAY초에 한 번만 DB에 넣음 (좋아요마다 INSERT하지 않도록)
+    표시가 살아 있는 동안 쌓인 의도는 그 뒤(run_at 이후)에 도는 flush가 가져감
+    """
+    from tasks.queue import enqueue
+
+    delay = getattr(settings, 'LIKE_FLUSH_DELAY', 1)
+    if _overlay_cache().add('like-flush-scheduled', True, delay):
+        enqueue('posts.tasks.flush_likes', unique=True, delay=delay)
+
+
+def has_pending():
+    """아직 flush가 가져가지 않은 의도가 있는지"""
+    queue_dir = _queue_dir()
+    return os.path.exists(os.path.join(queue_dir, QUEUE_FILE)) or any(
+        name.endswith(PROCESSING_SUFFIX) for name in os.listdir(queue_dir)
+    )
+
+
+def get_overlay(kind, user_id, target_id):
+    """아직 반영되지 않은 본인의 좋아요 상태 (없으면 None)"""
+    return _overlay_cache().get(_overlay_key(kind, user_id, target_id))
+
+
+def _claim_files():
+    """현재 큐 파일을 처리용 이름으로 옮기고, 이전에 처리하다 만 파일까지 돌려줌"""
+    queue_dir = _queue_dir()
+    with open(os.path.join(queue_dir, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        current = os.path.join(queue_dir, QUEUE_FILE)
+        if os.path.exists(current):
+            os.rename(current, os.path.join(
+                queue_dir, f'likes.{time.time():.6f}.{os.getpid()}{PROCESSING_SUFFIX}'
+            ))
+    return sorted(
+        os.path.join(queue_dir, name) for name in os.listdir(queue_dir)
+        if name.endswith(PROCESSING_SUFFIX)
+    )
+
+
+def _read_intents(paths):
+    """(kind, user_id, target_id) -> 마지막 의도(True/False)"""
+    intents = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            for raw in f:
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    continue  # 쓰다 만 마지막 줄
+                intents[(event['k'], event['u'], event['t'])] = event['l']
+    return intents
+
+
+def apply_intents(kind, intents):
+    """
+    한 종류의 의도들을 DB에 반영.
+    이미 같은 상태인 것은 건너뛰고, 실제로 넣거나 지운 행만 좋아요 수 증감에 반영함.
+    반환: (추가된 수, 삭제된 수)
+    """
+    from .likes import LIKE_TARGETS
+
+    model, field = LIKE_TARGETS[kind]
+    target_model = TARGET_MODELS[kind]
+    user_ids = {user_id for user_id, _ in intents}
+    target_ids = {target_id for _, target_id in intents}
+
+    deltas = Counter()
+    with transaction.atomic():
+        alive = set(target_model.objects.filter(pk__in=target_ids).values_list('pk', flat=True))
+        existing = set(
+            model.objects.filter(user_id__in=user_ids, **{f'{field}_id__in': target_ids})
+            .values_list('user_id', f'{field}_id')
+        )
+        to_add = [key for key, liked in intents.items() if liked and key not in existing and key[1] in alive]
+        to_remove = [key for key, liked in intents.items() if not liked and key in existing]
+
+        added = []
+        if to_add:
+            likes = [model(user_id=user_id, **{f'{field}_id': target_id}) for user_id, target_id in to_add]
+            model.objects.bulk_create(likes, ignore_conflicts=True)
+            # 그 사이 다른 곳에서 먼저 들어간 행은 created_at이 다름 -> 이번에 넣은 행만 셈
+            stamps = {(like.user_id, getattr(like, f'{field}_id')): like.created_at for like in likes}
+            added = [
+                (user_id, target_id) for user_id, target_id, created_at in model.objects.filter(
+                    user_id__in={user_id for user_id, _ in to_add},
+                    **{f'{field}_id__in': {target_id for _, target_id in to_add}},
+                ).values_list('user_id', f'{field}_id', 'created_at')
+                if stamps.get((user_id, target_id)) == created_at
+            ]
+            deltas.update(target_id for _, target_id in added)
+        removed = []
+        if to_remove:
+            # 지울 행을 먼저 읽어서 실제로 지운 (user, 대상)만 셈
+            rows = {
+                pk: (user_id, target_id) for pk, user_id, target_id in model.objects.filter(reduce(or_, (
+                    Q(user_id=user_id, **{f'{field}_id': target_id}) for user_id, target_id in to_remove
+                ))).values_list('pk', 'user_id', f'{field}_id')
+            }
+            model.objects.filter(pk__in=list(rows)).delete()
+            removed = list(rows.values())
+            record_tombstones(f'{kind}_like', removed)
+            deltas.subtract(target_id for _, target_id in removed)
+
+        update_like_counts(kind, deltas)
+
+        counts = {}
+        for _, target_id in added:
+            counts.setdefault(target_id, Counter())['likes'] += 1
+        for _, target_id in removed:
+            counts.setdefault(target_id, Counter())['unlikes'] += 1
+        rollups.bump(kind, counts)
+
+    changed = [target_id for target_id, delta in deltas.items() if delta]
+    fragment_cache.bump(kind, *changed)
+    live.notify(kind, *changed)
+    return len(added), len(removed)
+
+
+def flush(batch_size=500):
+    """
+    큐를 비우고 DB에 반영. 반환: {'files': 처리한 파일 수, 'added': n, 'removed': n, 'busy': bool}
+    다른 flush(태스크, 커맨드, 다른 워커)가 돌고 있으면 같은 파일을 두 번 반영하지 않도록 아무것도 하지 않음 (busy)
+    """
+    with open(os.path.join(_queue_dir(), FLUSH_LOCK_FILE), 'a') as flush_lock:
+        try:
+            fcntl.flock(flush_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return {'files': 0, 'added': 0, 'removed': 0, 'busy': True}
+        return _flush(batch_size)
+
+
+def _flush(batch_size):
+    paths = _claim_files()
+    result = {'files': len(paths), 'added': 0, 'removed': 0, 'busy': False}
+    if not paths:
+        return result
+
+    intents = _read_intents(paths)
+    by_kind = {}
+    for (kind, user_id, target_id), liked in intents.items():
+        if kind in TARGET_MODELS:
+            by_kind.setdefault(kind, {})[(user_id, target_id)] = liked
+
+    for kind, kind_intents in by_kind.items():
+        items = list(kind_intents.items())
+        for start in range(0, len(items), batch_size):
+            added, removed = apply_intents(kind, dict(items[start:start + batch_size]))
+            result['added'] += added
+            result['removed'] += removed
+
+    # 모두 반영된 뒤에만 삭제 (도중에 죽으면 다음 flush가 다시 처리, 반영은 멱등)
+    for path in paths:
+        os.remove(path)
+    return result
@@ -0,0 +1,136 @@
+# posts/likes.py
+from django.db import connection, transaction
+from django.utils import timezone
+
+from analytics import rollups
+from mypage.models import MusicLike
+from prototype import live
+from prototype.fragment_cache import fragment_cache
+from sync.models import record_tombstones
+from .models import PostLike
+from . import like_queue
+
+
+# 좋아요 대상 종류별 (모델, FK 필드명)
+LIKE_TARGETS = {
+    'post': (PostLike, 'post'),
+    'music': (MusicLike, 'music'),
+}
+
+
+class LikeTargetMissing(Exception):
+    """좋아요 대상(게시물/음악)이 없음 (삭제 표시된 것 포함)"""
+
+
+def _check_target(kind, target_id):
+    # 삭제 표시된 대상도 없는 것으로 봄 (reaper가 지우기 전까지 좋아요가 쌓이지 않도록)
+    if not like_queue.TARGET_MODELS[kind].objects.filter(pk=target_id).exists():
+        raise LikeTargetMissing(target_id)
+
+
+def _insert_like(kind, user_id, target_id):
+    """
+    대상이 살아 있을 때만 넣는 INSERT ... SELECT ... WHERE EXISTS ... ON CONFLICT DO NOTHING 한 문장.
+    실제로 넣었으면 True (이미 좋아요 상태이거나 대상이 없으면 False, 동시 요청에도 중복 키 에러 없음)
+    """
+    model, field = LIKE_TARGETS[kind]
+    target_model = like_queue.TARGET_MODELS[kind]
+    qn = connection.ops.quote_name
+    created_at = model._meta.get_field('created_at')
+    columns = ', '.join(qn(model._meta.get_field(name).column) for name in ('user', field, 'created_at'))
+    sql = (
+        f'INSERT INTO {qn(model._meta.db_table)} ({columns}) '
+        f'SELECT %s, %s, %s WHERE EXISTS ('
+        f'SELECT 1 FROM {qn(target_model._meta.db_table)} '
+        f'WHERE {qn(target_model._meta.pk.column)} = %s AND {qn("deleted_at")} IS NULL'
+        f') ON CONFLICT DO NOTHING'
+    )
+    now = created_at.get_db_prep_save(timezone.now(), connection)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [user_id, target_id, now, target_id])
+        return cursor.rowcount == 1
+
+
+def add_like(kind, user, target_id):
+    """
+    좋아요. 쓰기는 INSERT 한 문장이고, 새로 넣었는지는 영향받은 행 수로 앎
+    이미 좋아요 상태면 아무 일도 일어나지 않음
+    새로 좋아요한 경우 True (큐 모드에서는 None)
+    """
+    if like_queue.is_enabled():
+        _check_target(kind, target_id)
+        like_queue.enqueue(kind, user.pk, target_id, True)
+        return None
+
+    # 대시보드 버킷도 같은 트랜잭션에서 더함 (커밋 한 번)
+    with transaction.atomic():
+        created = _insert_like(kind, user.pk, target_id)
+        if created:
+            like_queue.update_like_counts(kind, {target_id: 1})
+            rollups.bump(kind, {target_id: {'likes': 1}})
+    if not created:
+        # 아무것도 넣지 않은 경우에만 이미 좋아요한 것인지, 대상이 없는(삭제 표시 포함) 것인지 확인
+        _check_target(kind, target_id)
+        return False
+    fragment_cache.bump(kind, target_id)
+    live.notify(kind, target_id)
+    return True
+
+
+def remove_like(kind, user, target_id):
+    """DELETE 한 문장으로 좋아요 취소. 실제로 지워진 행 수를 반환 (큐 모드에서는 None)"""
+    if like_queue.is_enabled():
+        like_queue.enqueue(kind, user.pk, target_id, False)
+        return None
+
+    model, field = LIKE_TARGETS[kind]
+    with transaction.atomic():
+        deleted, _ = model.objects.filter(user=user, **{f'{field}_id': target_id}).delete()
+        if deleted:
+            # 델타 동기화(/api/sync/)가 취소를 알 수 있도록
+            record_tombstones(f'{kind}_like', [(user.pk, target_id)])
+            like_queue.update_like_counts(kind, {target_id: -1})
+            rollups.bump(kind, {target_id: {'unlikes': 1}})
+    if deleted:
+        fragment_cache.bump(kind, target_id)
+        live.notify(kind, target_id)
+    return deleted
+
+
+def toggle_like(kind, user, target_id):
+    """먼저 지워보고, 지운 게 없으면 좋아요. 좋아요 상태가 되면 True"""
+    if like_queue.is_enabled():
+        liked = not is_liked(kind, user, target_id)
+        if liked:
+            _check_target(kind, target_id)
+        like_queue.enqueue(kind, user.pk, target_id, liked)
+        return liked
+
+    if remove_like(kind, user, target_id):
+        return False
+    add_like(kind, user, target_id)
+    return True
+
+
+def liked_ids(kind, user, target_ids):
+    """target_ids 중 user가 좋아요한 id set (쿼리 한 번). 큐 모드에서는 아직 반영 안 된 본인의 의도도 반영"""
+    model, field = LIKE_TARGETS[kind]
+    liked = set(model.objects.filter(
+        user=user, **{f'{field}_id__in': target_ids}
+    ).values_list(f'{field}_id', flat=True))
+    if like_queue.is_enabled():
+        for target_id in target_ids:
+            pending = like_queue.get_overlay(kind, user.pk, target_id)
+            if pending is not None:
+                (liked.add if pending else liked.discard)(target_id)
+    return liked
+
+
+def is_liked(kind, user, target_id):
+    """좋아요 여부. 큐 모드에서는 아직 반영 안 된 본인의 의도를 먼저 봄"""
+    if like_queue.is_enabled():
+        pending = like_queue.get_overlay(kind, user.pk, target_id)
+        if pending is not None:
+            return pending
+    model, field = LIKE_TARGETS[kind]
+    return model.objects.filter(user=user, **{f'{field}_id': target_id}).exists()
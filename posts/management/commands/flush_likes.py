@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts import like_queue
+
+
+class Command(BaseCommand):
+    help = "queued 모드에서 쌓인 좋아요/취소 의도를 모아 DB에 일괄 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="트랜잭션 하나에 반영할 의도 수")
+        parser.add_argument('--loop', action='store_true', help="종료하지 않고 주기적으로 반복")
+        parser.add_argument('--interval', type=float, default=1.0, help="--loop 주기(초)")
+
+    def handle(self, *args, **options):
+        while True:
+            result = like_queue.flush(batch_size=options['batch_size'])
+            if result['busy'] and not options['loop']:
+                self.stdout.write("다른 flush가 실행 중이라 건너뜁니다.")
+            elif result['files'] or not options['loop']:
+                self.stdout.write(
+                    f"좋아요 {result['added']}건 추가, {result['removed']}건 취소 반영"
+                )
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
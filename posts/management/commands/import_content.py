@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from accounts.models import Profile
+from mypage.models import Music, bump_genre_facets
+from posts.models import ImportCheckpoint, Post
+from prototype.fragment_cache import fragment_cache
+from search import suggest
+from tasks.queue import enqueue
+
+
+# type별 (모델, 일반 컬럼, 파일 컬럼, 필수 파일 컬럼)
+IMPORT_TYPES = {
+    'post': (Post, ['title', 'content', 'view_count', 'like_count'], ['audio_file', 'image'], []),
+    'music': (Music, ['title', 'description', 'artist', 'genre', 'duration'],
+              ['audio_file', 'cover_image'], ['audio_file']),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "NDJSON(한 줄에 게시물/음악 하나)과 미디어 디렉터리를 받아 bulk_create로 대량 등록합니다. "
+        "배치마다 같은 트랜잭션에서 체크포인트를 저장하므로 --resume으로 중단된 지점부터 이어서 실행할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help="NDJSON 파일 경로")
+        parser.add_argument('--media-dir', help="레코드의 파일 경로가 가리키는 기준 디렉터리")
+        parser.add_argument('--author', help="author가 없는 레코드에 쓸 기본 사용자명")
+        parser.add_argument('--create-authors', action='store_true', help="없는 사용자를 새로 생성")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--workers', type=int, default=8, help="미디어 복사 스레드 수")
+        parser.add_argument('--checkpoint', help="체크포인트 파일 경로 (기본: <source>.checkpoint)")
+        parser.add_argument('--resume', action='store_true', help="체크포인트부터 이어서 실행")
+
+    def handle(self, *args, **options):
+        source = options['source']
+        if not os.path.exists(source):
+            raise CommandError(f"파일을 찾을 수 없습니다: {source}")
+
+        self.media_dir = options['media_dir']
+        self.default_author = options['author']
+        self.create_authors = options['create_authors']
+        self.authors = {}
+        self.stats = {'imported': 0, 'skipped': 0, 'missing_media': 0}
+
+        checkpoint_path = options['checkpoint'] or f'{source}.checkpoint'
+        self.checkpoint_key = os.path.abspath(checkpoint_path)
+        checkpoint = {'offset': 0, 'line': 0}
+        if options['resume']:
+            saved = self.load_checkpoint(checkpoint_path)
+            if saved:
+                checkpoint = saved
+                self.stdout.write(f"{checkpoint['line']}번째 줄부터 이어서 시작합니다.")
+
+        started = time.monotonic()
+        with open(source, 'rb') as f, ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            self.executor = executor
+            f.seek(checkpoint['offset'])
+            line_no = checkpoint['line']
+            while True:
+                batch = []
+                for raw in f:
+                    line_no += 1
+                    if raw.strip():
+                        batch.append((line_no, raw))
+                    if len(batch) >= options['batch_size']:
+                        break
+                if not batch:
+                    break
+
+                # 체크포인트는 배치와 같은 트랜잭션에서 DB에 저장 (중단되면 커밋되지 않은 이 배치부터 다시)
+                checkpoint = {'offset': f.tell(), 'line': line_no}
+                self.import_batch(batch, checkpoint)
+                # 파일은 사람이 보기 위한 사본. 쓰다가 중단돼도 깨지지 않도록 임시 파일을 바꿔치기
+                self.write_checkpoint_file(checkpoint_path, {**checkpoint, **self.stats})
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{line_no}줄 처리 / 등록 {self.stats['imported']}건 "
+                    f"({self.stats['imported'] / elapsed * 60:.0f}건/분)"
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 등록 {self.stats['imported']}건, 건너뜀 {self.stats['skipped']}건, "
+            f"미디어 없음 {self.stats['missing_media']}건"
+        ))
+
+    def load_checkpoint(self, checkpoint_path):
+        """DB의 체크포인트 (없으면 예전 실행이 남긴 파일)"""
+        saved = ImportCheckpoint.objects.filter(key=self.checkpoint_key).values('offset', 'line').first()
+        if saved is None and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                saved = json.load(f)
+        return saved
+
+    def write_checkpoint_file(self, checkpoint_path, checkpoint):
+        tmp_path = f'{checkpoint_path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, checkpoint_path)
+
+    def import_batch(self, batch, checkpoint):
+        records = []
+        for line_no, raw in batch:
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                self.stderr.write(f"{line_no}번째 줄: JSON 형식 오류")
+                self.stats['skipped'] += 1
+                continue
+            if record.get('type') not in IMPORT_TYPES:
+                self.stats['skipped'] += 1
+                continue
+            record.setdefault('author', self.default_author)
+            records.append((line_no, record))
+
+        self.resolve_authors({record['author'] for _, record in records if record['author']})
+
+        # 미디어 복사는 스레드로 병렬 처리 (파일 I/O라 GIL 영향 적음)
+        pending = []
+        for line_no, record in records:
+            if not self.authors.get(record['author']):
+                self.stderr.write(f"{line_no}번째 줄: 사용자 없음 ({record['author']})")
+                self.stats['skipped'] += 1
+                continue
+            model, _, file_fields, _ = IMPORT_TYPES[record['type']]
+            copies = {
+                name: self.executor.submit(self.copy_media, model._meta.get_field(name), record[name])
+                for name in file_fields if record.get(name)
+            }
+            pending.append((line_no, record, copies))
+
+        objects = {kind: [] for kind in IMPORT_TYPES}
+        for line_no, record, copies in pending:
+            model, fields, file_fields, required = IMPORT_TYPES[record['type']]
+            files = {}
+            for name, future in copies.items():
+                try:
+                    files[name] = future.result()
+                except OSError as exc:
+                    # 파일 하나를 못 읽거나 못 써도 전체를 멈추지 않고 미디어 없음으로 셈
+                    self.stderr.write(f"{line_no}번째 줄: 미디어 복사 실패 ({record[name]}: {exc})")
+                    files[name] = None
+            self.stats['missing_media'] += sum(1 for stored in files.values() if not stored)
+            if any(not files.get(name) for name in required):
+                self.stderr.write(f"{line_no}번째 줄: 필수 미디어 없음")
+                self.stats['skipped'] += 1
+                continue
+            values = {name: record[name] for name in fields if record.get(name) is not None}
+            values.update({name: stored for name, stored in files.items() if stored})
+            objects[record['type']].append(model(author_id=self.authors[record['author']], **values))
+
+        with transaction.atomic():
+            for kind, items in objects.items():
+                if items:
+                    IMPORT_TYPES[kind][0].objects.bulk_create(items)
+                    self.stats['imported'] += len(items)
+            # bulk_create는 signal을 보내지 않으므로 signal이 하던 일(장르 facet, 조각 캐시, 자동완성, 특징 추출)을 직접
+            bump_genre_facets(Counter(music.genre for music in objects['music']))
+            fragment_cache.bump('post', *(post.pk for post in objects['post']))
+            fragment_cache.bump('music', *(music.pk for music in objects['music']))
+            suggest.record([suggest.post_entry(post, 0) for post in objects['post']]
+                           + [suggest.music_entry(music, 0) for music in objects['music']])
+            if any(music.audio_file for music in objects['music']):
+                enqueue('recommendations.tasks.extract_audio_features', unique=True)
+            ImportCheckpoint.objects.update_or_create(
+                key=self.checkpoint_key, defaults={**checkpoint, 'stats': dict(self.stats)}
+            )
+
+    def resolve_authors(self, usernames):
+        """배치에 등장한 사용자명을 한 번의 IN 쿼리로 id로 바꿈"""
+        missing = [name for name in usernames if name not in self.authors]
+        if not missing:
+            return
+        found = dict(User.objects.filter(username__in=missing).values_list('username', 'id'))
+
+        new_names = [name for name in missing if name not in found]
+        if new_names and self.create_authors:
+            # bulk_create는 post_save를 보내지 않으므로 Profile도 직접 생성
+            unusable = make_password(None)
+            with transaction.atomic():
+                User.objects.bulk_create([User(username=name, password=unusable) for name in new_names])
+                created = dict(User.objects.filter(username__in=new_names).values_list('username', 'id'))
+                Profile.objects.bulk_create([Profile(user_id=user_id) for user_id in created.values()])
+                suggest.record([['user', user_id, name, 0] for name, user_id in created.items()])
+            found.update(created)
+
+        for name in missing:
+            self.authors[name] = found.get(name)
+
+    def copy_media(self, field, relative_path):
+        """
+        미디어 디렉터리의 파일을 storage로 복사하고 저장된 이름을 반환.
+        이름에 내용 해시를 붙이므로 --resume으로 같은 배치를 다시 돌려도 이미 복사된 파일은 다시 복사하지 않음
+        """
+        if not self.media_dir:
+            return None
+        path = os.path.join(self.media_dir, relative_path)
+        if not os.path.isfile(path):
+            return None
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        stem, ext = os.path.splitext(os.path.basename(path))
+        name = field.generate_filename(None, f'{stem}-{digest.hexdigest()[:16]}{ext}')
+        if field.storage.exists(name):
+            return name
+        with open(path, 'rb') as f:
+            return field.storage.save(name, File(f), max_length=field.max_length)
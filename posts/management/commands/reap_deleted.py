@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts.reaper import reap
+
+
+class Command(BaseCommand):
+    help = "삭제 표시된 게시물/음악/사용자를 작은 배치로 나눠 실제로 지우고 미디어 파일을 정리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="트랜잭션 하나에 지울 행 수")
+        parser.add_argument('--limit', type=int, default=100, help="한 번 실행에 정리할 최대 개수 (종류별)")
+        parser.add_argument('--loop', action='store_true', help="종료하지 않고 주기적으로 반복")
+        parser.add_argument('--interval', type=float, default=10.0, help="--loop 주기(초)")
+
+    def handle(self, *args, **options):
+        while True:
+            result = reap(batch_size=options['batch_size'], limit=options['limit'])
+            if any(result.values()) or not options['loop']:
+                self.stdout.write(
+                    f"게시물 {result['posts']}개, 음악 {result['music']}개, 사용자 {result['users']}명, "
+                    f"좋아요 {result['likes']}개 삭제 / 미디어 {result['bytes']}바이트 정리"
+                )
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.23 on 2026-10-19 08:00
+
+from django.db import migrations, models
+
+
+def fill_updated_at(apps, schema_editor):
+    # 기존 게시물은 작성일을 수정일로 둠
+    Post = apps.get_model('posts', 'Post')
+    Post.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0006_alter_post_options_post_deleted_at_postlike'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정일'),
+        ),
+        migrations.RunPython(fill_updated_at, migrations.RunPython.noop),
+    ]
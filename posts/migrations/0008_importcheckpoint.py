@@ -0,0 +1,28 @@
+# Generated by Django 4.2.23 on 2026-10-19 08:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0007_post_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=500, unique=True, verbose_name='체크포인트 이름')),
+                ('offset', models.BigIntegerField(default=0, verbose_name='파일 위치 (바이트)')),
+                ('line', models.IntegerField(default=0, verbose_name='처리한 줄 수')),
+                ('stats', models.JSONField(default=dict, verbose_name='누적 통계')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '가져오기 체크포인트',
+                'verbose_name_plural': '가져오기 체크포인트들',
+            },
+        ),
+    ]
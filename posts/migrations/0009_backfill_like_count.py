@@ -0,0 +1,25 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_like_count(apps, schema_editor):
+    # 예전 sync 모드는 like_count를 바꾸지 않았으므로 실제 좋아요 수로 한 번 맞춰둠
+    Post = apps.get_model('posts', 'Post')
+    PostLike = apps.get_model('posts', 'PostLike')
+    actual = (
+        PostLike.objects.filter(post=OuterRef('pk')).order_by()
+        .values('post').annotate(n=Count('id')).values('n')
+    )
+    Post.objects.update(like_count=Coalesce(Subquery(actual), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0008_importcheckpoint'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_like_count, migrations.RunPython.noop),
+    ]
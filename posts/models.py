@@ -1,5 +1,17 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from prototype.fragment_cache import fragment_cache
+from search import suggest
+
+
+class LiveManager(models.Manager):
+    """삭제 표시(deleted_at)된 행을 빼고 보여주는 기본 매니저"""
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 # ==================== 기존 Post 모델 + 추가 사항 ====================
@@ -8,10 +20,16 @@ class Post(models.Model):
     content = models.TextField()
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
     audio_file = models.FileField(upload_to='audio/', blank=True, null=True)
     image = models.ImageField(upload_to='images/', blank=True, null=True)
     view_count = models.IntegerField(default=0, verbose_name="조회수")
     like_count = models.IntegerField(default=0, verbose_name="좋아요 수")
+    deleted_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="삭제 요청일")
+
+    # 삭제 표시된 게시물은 reap_deleted가 좋아요/미디어와 함께 실제로 지움
+    objects = LiveManager()
+    all_objects = models.Manager()
 
     # ⭐ 여기서부터 추가!
     class Meta:
@@ -25,6 +43,20 @@ class Post(models.Model):
         """좋아요 개수"""
         return self.post_likes.count()
 
+    def soft_delete(self):
+        """
+        삭제 표시만 하고 실제 삭제(좋아요/미디어 포함)는 reap_deleted 작업에 맡김.
+        이미 삭제 표시된 게시물은 그대로 둠 (삭제 시각이 늦춰지지 않도록)
+        """
+        from tasks.queue import enqueue
+
+        deleted_at = timezone.now()
+        if Post.objects.filter(pk=self.pk).update(deleted_at=deleted_at):
+            self.deleted_at = deleted_at
+            fragment_cache.bump('post', self.pk)
+            suggest.forget('post', self.pk)
+            enqueue('posts.tasks.reap_deleted', unique=True)
+
 
 # ==================== 새로 추가되는 PostLike 모델 ====================
 class PostLike(models.Model):
@@ -41,3 +73,28 @@ class PostLike(models.Model):
     
     def __str__(self):
         return f"{self.user.username} likes {self.post.title}"
+
+
+# Signal: 내용이 바뀌면 직렬화 조각 캐시 버전을 올림
+@receiver(post_save, sender=Post)
+def bump_post_fragment(sender, instance, **kwargs):
+    fragment_cache.bump('post', instance.pk)
+
+
+class ImportCheckpoint(models.Model):
+    """
+    import_content 진행 위치. 배치를 등록하는 트랜잭션 안에서 함께 저장하므로
+    --resume은 커밋된 배치 바로 다음부터 시작함 (같은 배치를 두 번 등록하지 않음)
+    """
+    key = models.CharField(max_length=500, unique=True, verbose_name="체크포인트 이름")
+    offset = models.BigIntegerField(default=0, verbose_name="파일 위치 (바이트)")
+    line = models.IntegerField(default=0, verbose_name="처리한 줄 수")
+    stats = models.JSONField(default=dict, verbose_name="누적 통계")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "가져오기 체크포인트"
+        verbose_name_plural = "가져오기 체크포인트들"
+
+    def __str__(self):
+        return f"{self.key} ({self.line}줄)"
@@ -0,0 +1,106 @@
+# posts/reaper.py
+"""
+삭제 표시된 게시물/음악/사용자를 실제로 지우는 reaper.
+
+좋아요 같은 딸린 행은 batch_size씩 짧은 트랜잭션으로 나눠 지우므로
+인기 게시물이나 활동이 많은 사용자를 지워도 다른 쓰기 요청이 오래 막히지 않는다.
+본 행을 지운 뒤에는 더 이상 참조되지 않는 미디어 파일도 지운다.
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from accounts.models import Profile
+from mypage.models import Music, MusicLike
+from sync.models import record_tombstones
+from uploads.media import delete_unreferenced
+from .models import Post, PostLike
+
+
+# (모델, 좋아요 모델, 좋아요 FK 필드, 파일 필드들)
+REAP_TARGETS = [
+    (Post, PostLike, 'post', ['audio_file', 'image']),
+    (Music, MusicLike, 'music', ['audio_file', 'cover_image']),
+]
+
+
+def delete_in_batches(queryset, batch_size, tombstone=None):
+    """
+    pk를 batch_size씩 끊어서 지움 (트랜잭션 하나가 커지지 않도록)
+    tombstone: 좋아요를 지울 때 (삭제 기록 종류, 대상 FK 필드, 삭제 시각) - 누른 사람마다 삭제 기록을 남김
+    """
+    deleted = 0
+    while True:
+        if tombstone:
+            kind, field, deleted_at = tombstone
+            rows = list(queryset.order_by().values_list('pk', 'user_id', f'{field}_id')[:batch_size])
+        else:
+            rows = [(pk,) for pk in queryset.order_by().values_list('pk', flat=True)[:batch_size]]
+        if not rows:
+            return deleted
+        with transaction.atomic():
+            count, _ = queryset.model._base_manager.filter(pk__in=[row[0] for row in rows]).delete()
+            if tombstone:
+                record_tombstones(kind, [row[1:] for row in rows], deleted_at)
+        deleted += count
+
+
+def reap_items(model, like_model, like_field, file_fields, batch_size, limit):
+    stats = {'items': 0, 'likes': 0, 'bytes': 0}
+    pending = (
+        model.all_objects.filter(deleted_at__isnull=False)
+        .order_by('deleted_at').only('pk', 'author_id', 'deleted_at', *file_fields)[:limit]
+    )
+    for item in pending:
+        # 삭제 표시된 시각부터 목록에서 빠졌으므로 삭제 기록도 그 시각으로 남김
+        stats['likes'] += delete_in_batches(
+            like_model.objects.filter(**{f'{like_field}_id': item.pk}), batch_size,
+            tombstone=(f'{like_field}_like', like_field, item.deleted_at),
+        )
+        names = [getattr(item, field).name for field in file_fields]
+        with transaction.atomic():
+            model.all_objects.filter(pk=item.pk).delete()
+            record_tombstones(like_field, [(item.author_id, item.pk)], item.deleted_at)
+        stats['bytes'] += delete_unreferenced(names)
+        stats['items'] += 1
+    return stats
+
+
+def reap_users(batch_size, limit):
+    """탈퇴 표시된 사용자: 게시물/음악이 모두 정리된 뒤 좋아요와 사용자 행을 지움"""
+    stats = {'users': 0, 'deferred': 0, 'likes': 0, 'bytes': 0}
+    profiles = Profile.objects.filter(deleted_at__isnull=False).select_related('user')[:limit]
+    for profile in profiles:
+        user_id = profile.user_id
+        # 탈퇴 표시 이후에 만들어진 게시물/음악도 함께 삭제 표시
+        Post.objects.filter(author_id=user_id).update(deleted_at=profile.deleted_at)
+        for music in Music.objects.filter(author_id=user_id):
+            music.soft_delete()
+        if Post.all_objects.filter(author_id=user_id).exists() or \
+                Music.all_objects.filter(author_id=user_id).exists():
+            stats['deferred'] += 1
+            continue  # 다음 실행에서 마저 정리
+
+        stats['likes'] += delete_in_batches(PostLike.objects.filter(user_id=user_id), batch_size)
+        stats['likes'] += delete_in_batches(MusicLike.objects.filter(user_id=user_id), batch_size)
+        names = [profile.profile_image.name]
+        User.objects.filter(pk=user_id).delete()
+        stats['bytes'] += delete_unreferenced(names)
+        stats['users'] += 1
+    return stats
+
+
+def reap(batch_size=500, limit=100):
+    """한 번 실행에 종류별로 최대 limit개까지 정리. 정리한 개수를 반환 (deferred: 다음 실행으로 미룬 사용자 수)"""
+    result = {'posts': 0, 'music': 0, 'users': 0, 'deferred': 0, 'likes': 0, 'bytes': 0}
+    for (model, like_model, like_field, file_fields), key in zip(REAP_TARGETS, ['posts', 'music']):
+        stats = reap_items(model, like_model, like_field, file_fields, batch_size, limit)
+        result[key] += stats['items']
+        result['likes'] += stats['likes']
+        result['bytes'] += stats['bytes']
+
+    stats = reap_users(batch_size, limit)
+    result['users'] += stats['users']
+    result['deferred'] += stats['deferred']
+    result['likes'] += stats['likes']
+    result['bytes'] += stats['bytes']
+    return result
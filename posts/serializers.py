@@ -1,10 +1,15 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import Post, PostLike
+from .likes import is_liked
+from prototype.fieldsets import SparseFieldsetMixin
+from prototype.fragment_cache import FragmentCacheMixin, FragmentListSerializer, NestedFragmentMixin
 
 
 # ==================== 기존 PostSerializer (그대로 유지!) ====================
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(SparseFieldsetMixin, FragmentCacheMixin, serializers.ModelSerializer):
+    fragment_kind = 'post'
+
     author = serializers.CharField(source='author.username', read_only=True)
     postId = serializers.IntegerField(source='id', read_only=True)
 
@@ -13,6 +18,7 @@ class PostSerializer(serializers.ModelSerializer):
         fields = ['postId', 'title', 'content', 'author', 'created_at', 'audio_file', 'image', 
                   'view_count', 'like_count']
         read_only_fields = ['author', 'created_at', 'view_count', 'like_count']
+        list_serializer_class = FragmentListSerializer
 
 
 # ==================== 여기서부터 새로 추가! ====================
@@ -24,8 +30,11 @@ class PostAuthorSerializer(serializers.ModelSerializer):
         fields = ['id', 'username']
 
 
-class PostDetailSerializer(serializers.ModelSerializer):
+class PostDetailSerializer(SparseFieldsetMixin, FragmentCacheMixin, serializers.ModelSerializer):
     """게시물 상세 시리얼라이저 (MyPage용)"""
+    fragment_kind = 'post'
+    per_user_fields = ('is_liked',)
+
     author = PostAuthorSerializer(read_only=True)
     likes_count = serializers.IntegerField(read_only=True)
     is_liked = serializers.SerializerMethodField()
@@ -35,20 +44,26 @@ class PostDetailSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'content', 'author', 'audio_file', 'image',
                   'created_at', 'likes_count', 'is_liked', 'view_count', 'like_count']
         read_only_fields = ['id', 'created_at', 'author', 'view_count', 'like_count']
+        list_serializer_class = FragmentListSerializer
     
     def get_is_liked(self, obj):
         """현재 사용자가 좋아요 했는지 확인"""
+        liked = self.context.get('liked_ids')
+        if liked is not None:
+            return obj.pk in liked   # 뷰가 한 번에 조회해 둔 경우 (batch)
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return PostLike.objects.filter(user=request.user, post=obj).exists()
+            return is_liked('post', request.user, obj.pk)
         return False
 
 
-class FavoritePostSerializer(serializers.ModelSerializer):
+class FavoritePostSerializer(NestedFragmentMixin, serializers.ModelSerializer):
     """좋아요한 게시물 시리얼라이저"""
+    fragment_field = 'post'
     post = PostDetailSerializer(read_only=True)
     
     class Meta:
         model = PostLike
         fields = ['id', 'post', 'created_at']
         read_only_fields = ['id', 'created_at']
+        list_serializer_class = FragmentListSerializer
@@ -0,0 +1,46 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from prototype.fragment_cache import fragment_cache
+from tasks.queue import enqueue, task
+from . import like_queue
+from .models import Post, PostLike
+from .reaper import reap
+
+
+@task(lane='high', exclusive=True)
+def flush_likes(batch_size=500):
+    """queued 모드에서 쌓인 좋아요 의도를 DB에 반영 (like_queue.enqueue가 예약)"""
+    like_queue.flush(batch_size=batch_size)
+    if like_queue.has_pending():
+        # 실행 중에 들어온 의도 (그 사이 예약된 것이 있으면 unique로 그것을 씀)
+        like_queue.schedule_flush()
+
+
+@task(exclusive=True)
+def reconcile_like_counts(post_ids=None):
+    """Post.like_count를 실제 좋아요 수로 맞춤 (좋아요는 두 모드 모두 like_count를 같이 바꾸므로 수동 수정 등의 보정용)"""
+    actual = Coalesce(Subquery(
+        PostLike.objects.filter(post=OuterRef('pk')).order_by()
+        .values('post').annotate(count=Count('id')).values('count')
+    ), 0)
+    posts = Post.objects.all()
+    if post_ids is not None:
+        posts = posts.filter(pk__in=post_ids)
+
+    # 틀린 것만 골라 같은 값끼리 묶어서 UPDATE
+    by_count = {}
+    for pk, like_count, count in posts.annotate(actual=actual).values_list('pk', 'like_count', 'actual'):
+        if like_count != count:
+            by_count.setdefault(count, []).append(pk)
+    for count, ids in by_count.items():
+        Post.objects.filter(pk__in=ids).update(like_count=count)
+        fragment_cache.bump('post', *ids)
+
+
+@task(lane='low', exclusive=True)
+def reap_deleted(batch_size=500, limit=100):
+    """삭제 표시된 게시물/음악/사용자를 실제로 삭제 (soft_delete가 예약, 한 번에 다 못 하면 다시 예약)"""
+    result = reap(batch_size=batch_size, limit=limit)
+    if result['deferred'] or any(result[key] >= limit for key in ('posts', 'music', 'users')):
+        enqueue(reap_deleted, unique=True, batch_size=batch_size, limit=limit)
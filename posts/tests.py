@@ -1,3 +1,567 @@
-from django.test import TestCase
+import asyncio
+import fcntl
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from prototype import live, throttling
+from prototype.fragment_cache import LRUCache, fragment_cache
+from tasks.models import Task
+from tasks.queue import claim, run_task
+from . import like_queue, likes
+from .models import Post, PostLike
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'posts-tests'},
+    'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'posts-tests-fragments'},
+}
+
+
+class QueueDirMixin:
+    """테스트마다 빈 큐 디렉터리와 빈 캐시로 시작"""
+
+    def setUp(self):
+        super().setUp()
+        self.queue_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.queue_dir, ignore_errors=True)
+        settings_override = override_settings(
+            LIKE_INGESTION_MODE='queued', LIKE_QUEUE_DIR=self.queue_dir,
+            LIVE_SOCKET_DIR=os.path.join(self.queue_dir, 'live'),
+            CACHES=LOCMEM_CACHES, THROTTLE_ENABLED=False,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        for alias in LOCMEM_CACHES:
+            caches[alias].clear()
+        fragment_cache.local.clear()
+
+
+class LikeQueueFlushTests(QueueDirMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.users = [User.objects.create_user(f'fan{i}', password='pw12345!') for i in range(5)]
+        self.post = Post.objects.create(title='t', content='c', author=self.author)
+
+    def enqueue_likes(self, liked=True):
+        for user in self.users:
+            like_queue.enqueue('post', user.pk, self.post.pk, liked)
+
+    def test_flush_applies_each_intent_once(self):
+        self.enqueue_likes()
+        self.enqueue_likes()   # 같은 의도가 두 번 와도 한 번만 반영
+        result = like_queue.flush()
+        self.assertEqual((result['added'], result['removed']), (5, 0))
+        self.assertEqual(like_queue.flush()['files'], 0)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 5)
+        self.assertEqual(PostLike.objects.filter(post=self.post).count(), 5)
+
+    def test_skips_while_another_flush_holds_the_lock(self):
+        self.enqueue_likes()
+        with open(os.path.join(self.queue_dir, like_queue.FLUSH_LOCK_FILE), 'a') as held:
+            fcntl.flock(held, fcntl.LOCK_EX)
+            self.assertTrue(like_queue.flush()['busy'])
+        self.assertEqual(PostLike.objects.count(), 0)
+        self.assertEqual(like_queue.flush()['added'], 5)
+
+    def test_counts_only_rows_actually_changed(self):
+        # 큐를 거치지 않고 이미 들어간 좋아요는 like_count에 다시 더하지 않음
+        PostLike.objects.create(user=self.users[0], post=self.post)
+        self.enqueue_likes()
+        self.assertEqual(like_queue.flush()['added'], 4)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 4)
+
+        self.enqueue_likes(liked=False)
+        self.assertEqual(like_queue.flush()['removed'], 5)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, -1)
+
+    def test_soft_deleted_target_is_rejected(self):
+        self.post.soft_delete()
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+        for mode in ('queued', 'sync'):
+            with override_settings(LIKE_INGESTION_MODE=mode):
+                self.assertEqual(client.put(f'/api/posts/{self.post.pk}/like/').status_code, 404)
+                self.assertEqual(client.post(f'/api/posts/{self.post.pk}/like/').status_code, 404)
+        self.assertFalse(os.path.exists(os.path.join(self.queue_dir, like_queue.QUEUE_FILE)))
+        self.assertEqual(PostLike.objects.count(), 0)
+
+
+class ConcurrentFlushTests(QueueDirMixin, TransactionTestCase):
+    """여러 스레드가 동시에 flush해도 좋아요 수가 한 번만 더해짐 (각 스레드는 자기 DB 연결을 씀)"""
+
+    def test_concurrent_flushes_do_not_double_count(self):
+        author = User.objects.create_user('author', password='pw12345!')
+        post = Post.objects.create(title='t', content='c', author=author)
+        for i in range(30):
+            like_queue.enqueue('post', User.objects.create_user(f'fan{i}', password='x').pk, post.pk, True)
+
+        results = []
+
+        def flush():
+            try:
+                results.append(like_queue.flush(batch_size=7))
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=flush) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(result['added'] for result in results), 30)
+        post.refresh_from_db()
+        self.assertEqual(post.like_count, 30)
+
+
+# 응답 캐시는 끄고 조각 캐시만 봄
+@override_settings(CACHES=LOCMEM_CACHES, RESPONSE_CACHE_PATHS={})
+class FragmentVersionTests(TestCase):
+    def setUp(self):
+        for alias in LOCMEM_CACHES:
+            caches[alias].clear()
+        fragment_cache.local.clear()
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.post = Post.objects.create(title='first', content='c', author=self.author)
+        self.client = APIClient()
+
+    def listed(self):
+        return {item['postId']: item for item in self.client.get('/api/posts/list-posts/').json()}
+
+    def test_saving_a_post_replaces_its_fragment(self):
+        self.assertEqual(self.listed()[self.post.pk]['title'], 'first')
+        self.post.title = 'second'
+        self.post.save()
+        self.assertEqual(self.listed()[self.post.pk]['title'], 'second')
+
+    def test_bump_changes_only_the_given_objects(self):
+        other = Post.objects.create(title='other', content='c', author=self.author)
+        before = fragment_cache.versions('post', [self.post.pk, other.pk])
+        fragment_cache.bump('post', self.post.pk)
+        after = fragment_cache.versions('post', [self.post.pk, other.pk])
+        self.assertGreater(after[self.post.pk], before[self.post.pk])
+        self.assertEqual(after[other.pk], before[other.pk])
+
+    def test_renaming_the_author_replaces_fragments(self):
+        self.assertEqual(self.listed()[self.post.pk]['author'], 'author')
+        self.author.username = 'renamed'
+        self.author.save()
+        self.assertEqual(self.listed()[self.post.pk]['author'], 'renamed')
+
+    def test_login_does_not_bump_author_fragments(self):
+        before = fragment_cache.versions('post', [self.post.pk])
+        self.author.save(update_fields=['last_login'])
+        self.assertEqual(fragment_cache.versions('post', [self.post.pk]), before)
+
+    def test_local_entries_expire(self):
+        cache = LRUCache(10, timeout=5)
+        with mock.patch('prototype.fragment_cache.time.monotonic', return_value=100.0):
+            cache.set('key', {'title': 'old'})
+        with mock.patch('prototype.fragment_cache.time.monotonic', return_value=104.0):
+            self.assertEqual(cache.get('key'), {'title': 'old'})
+        with mock.patch('prototype.fragment_cache.time.monotonic', return_value=105.0):
+            self.assertIsNone(cache.get('key'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RESPONSE_CACHE_PATHS={})
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        for alias in LOCMEM_CACHES:
+            caches[alias].clear()
+        fragment_cache.local.clear()
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.post = Post.objects.create(title='t', content='long body', author=self.author)
+        PostLike.objects.create(user=self.author, post=self.post)
+        self.client = APIClient()
+        self.client.force_authenticate(self.author)
+
+    def get(self, url, **params):
+        """(응답 JSON, posts_post를 읽은 SELECT 문들)"""
+        with CaptureQueriesContext(connections['default']) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        selects = [q['sql'] for q in queries if q['sql'].startswith('SELECT') and '"posts_post"' in q['sql']]
+        return response.json(), selects
+
+    def test_fields_select_only_needed_columns(self):
+        data, selects = self.get('/api/posts/list-posts/', fields='postId,title,author')
+        self.assertEqual(data, [{'postId': self.post.pk, 'title': 't', 'author': 'author'}])
+        self.assertTrue(selects)
+        for sql in selects:
+            self.assertNotIn('"posts_post"."content"', sql)
+            self.assertNotIn('"auth_user"."password"', sql)
+
+    def test_omit_drops_field_and_column(self):
+        data, selects = self.get('/api/posts/list-posts/', omit='content,audio_file,image')
+        self.assertNotIn('content', data[0])
+        self.assertEqual(data[0]['title'], 't')
+        for sql in selects:
+            self.assertNotIn('"posts_post"."content"', sql)
+
+    def test_unknown_fields_fall_back_to_everything(self):
+        data, selects = self.get('/api/posts/list-posts/', fields='nope')
+        self.assertEqual(data[0]['content'], 'long body')
+        self.assertTrue(any('"posts_post"."content"' in sql for sql in selects))
+
+    def test_nested_projection_on_favorites(self):
+        data, selects = self.get('/api/posts/favorites/', fields='title')
+        self.assertEqual(data['results'][0]['post'], {'title': 't'})
+        for sql in selects:
+            self.assertNotIn('"posts_post"."content"', sql)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class BatchLookupTests(TestCase):
+    def setUp(self):
+        author = User.objects.create_user('author', password='pw12345!')
+        self.posts = [Post.objects.create(title=f'p{i}', content='c', author=author) for i in range(2)]
+        self.client = APIClient()
+
+    def test_results_follow_request_order(self):
+        first, second = (post.pk for post in self.posts)
+        response = self.client.get('/api/posts/batch/', {'ids': f'{second},999999,{first},{second}'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.json()['results']], [second, first])
+        self.assertEqual(response.json()['missing'], [999999])
+
+    def test_invalid_ids_are_rejected(self):
+        for ids in ('1,²', '0', '-1', '1.5', '٣', str(2 ** 63), ''):
+            response = self.client.get('/api/posts/batch/', {'ids': ids})
+            self.assertEqual(response.status_code, 400, ids)
+            self.assertIn('error', response.json())
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RESPONSE_CACHE_PATHS={'/api/posts/list-posts/': 60})
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        for alias in LOCMEM_CACHES:
+            caches[alias].clear()
+        fragment_cache.local.clear()
+        author = User.objects.create_user('author', password='pw12345!')
+        self.post = Post.objects.create(title='first', content='c', author=author)
+
+    def test_other_media_types_do_not_poison_json(self):
+        html = self.client.get('/api/posts/list-posts/', HTTP_ACCEPT='text/html')
+        self.assertTrue(html['Content-Type'].startswith('text/html'))
+
+        response = self.client.get('/api/posts/list-posts/', HTTP_ACCEPT='application/json')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()[0]['title'], 'first')
+        for header in ('Accept', 'Cookie'):
+            self.assertIn(header, response['Vary'])
+
+    def test_anonymous_json_is_served_from_cache(self):
+        first = self.client.get('/api/posts/list-posts/', HTTP_ACCEPT='application/json')
+        Post.objects.filter(pk=self.post.pk).update(title='second')
+        cached = self.client.get('/api/posts/list-posts/', HTTP_ACCEPT='application/json')
+        self.assertEqual(cached.json()[0]['title'], 'first')
+        self.assertEqual(cached['ETag'], first['ETag'])
+        self.assertIn('Accept', cached['Vary'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ImportContentTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=os.path.join(self.dir, 'media'))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        User.objects.create_user('author', password='pw12345!')
+        self.source = os.path.join(self.dir, 'content.ndjson')
+        with open(self.source, 'w') as f:
+            for i in range(5):
+                f.write(json.dumps({'type': 'post', 'title': f'p{i}', 'content': 'c', 'author': 'author',
+                                    'image': 'cover.png' if i == 0 else None}) + '\n')
+
+    def run_import(self, *args):
+        call_command('import_content', self.source, '--batch-size', '2', '--media-dir', self.dir,
+                     *args, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def test_resume_after_crash_does_not_import_twice(self):
+        # 첫 배치가 커밋된 직후(체크포인트 파일을 쓰기 전) 중단
+        with mock.patch('posts.management.commands.import_content.Command.write_checkpoint_file',
+                        side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.run_import()
+        self.assertEqual(Post.objects.count(), 2)
+
+        self.run_import('--resume')
+        self.assertEqual(sorted(Post.objects.values_list('title', flat=True)), [f'p{i}' for i in range(5)])
+        with open(f'{self.source}.checkpoint') as f:
+            self.assertEqual(json.load(f)['line'], 5)
+
+    def test_media_copy_error_counts_as_missing_media(self):
+        with open(os.path.join(self.dir, 'cover.png'), 'wb') as f:
+            f.write(b'png')
+        with mock.patch('django.core.files.storage.FileSystemStorage.save', side_effect=PermissionError('denied')):
+            self.run_import()
+        self.assertEqual(Post.objects.count(), 5)
+        self.assertFalse(Post.objects.get(title='p0').image)
+
+
+class TokenBucketTests(TestCase):
+    def setUp(self):
+        # 버킷 저장소는 프로세스 전역이므로 테스트마다 새로
+        self.addCleanup(setattr, throttling, '_store', None)
+        throttling._store = None
+
+    def test_bucket_refills_over_time(self):
+        store = throttling.LocalBucketStore()
+        capacity, per_second = throttling.parse_rate(('60/min', 2))
+        self.assertEqual((capacity, per_second), (2, 1.0))
+        with mock.patch('prototype.throttling.time.monotonic') as now:
+            now.return_value = 100.0
+            self.assertEqual([store.take('k', capacity, per_second) for _ in range(3)], [0.0, 0.0, 1.0])
+            self.assertEqual(store.take('other', capacity, per_second), 0.0)
+            now.return_value = 100.5
+            self.assertEqual(store.take('k', capacity, per_second), 0.5)
+            now.return_value = 101.0
+            self.assertEqual(store.take('k', capacity, per_second), 0.0)
+            # 오래 쉬어도 버킷 크기 이상으로는 쌓이지 않음
+            now.return_value = 1000.0
+            self.assertEqual([store.take('k', capacity, per_second) for _ in range(3)], [0.0, 0.0, 1.0])
+
+    def test_shared_store_is_shared_between_instances(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = os.path.join(directory, 'buckets')
+        first, second = (throttling.SharedBucketStore(path, slots=16) for _ in range(2))
+        for store in (first, second):
+            self.addCleanup(os.close, store.fd)
+            self.addCleanup(store.map.close)
+        with mock.patch('prototype.throttling.time.time', return_value=100.0):
+            self.assertEqual(first.take('k', 2, 1.0), 0.0)
+            self.assertEqual(second.take('k', 2, 1.0), 0.0)
+            self.assertEqual(first.take('k', 2, 1.0), 1.0)
+
+    @override_settings(CACHES=LOCMEM_CACHES, LIKE_INGESTION_MODE='sync', THROTTLE_ENABLED=True,
+                       THROTTLE_BUCKET_RATES={'like': {'user': ('60/min', 2)}},
+                       THROTTLE_BUCKET_STORE='prototype.throttling.LocalBucketStore')
+    def test_empty_bucket_returns_429_with_retry_after(self):
+        author = User.objects.create_user('author', password='pw12345!')
+        post = Post.objects.create(title='t', content='c', author=author)
+        client = APIClient()
+        client.force_authenticate(author)
+        url = f'/api/posts/{post.pk}/like/'
+
+        responses = [client.put(url) for _ in range(3)]
+        self.assertEqual([r.status_code for r in responses], [200, 200, 429])
+        self.assertEqual(responses[2]['Retry-After'], '1')
+        # 사용자마다 따로 셈
+        other = APIClient()
+        other.force_authenticate(User.objects.create_user('other', password='pw12345!'))
+        self.assertEqual(other.put(url).status_code, 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LIKE_INGESTION_MODE='sync', THROTTLE_ENABLED=False)
+class LikeWriteTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.fan = User.objects.create_user('fan', password='pw12345!')
+        self.post = Post.objects.create(title='t', content='c', author=self.author)
+
+    def test_like_is_one_insert(self):
+        with CaptureQueriesContext(connections['default']) as queries:
+            self.assertTrue(likes.add_like('post', self.fan, self.post.pk))
+        like_queries = [q['sql'] for q in queries if 'posts_postlike' in q['sql']]
+        self.assertEqual(len(like_queries), 1)
+        self.assertTrue(like_queries[0].startswith('INSERT'))
+
+    def test_like_is_idempotent(self):
+        self.assertTrue(likes.add_like('post', self.fan, self.post.pk))
+        self.assertFalse(likes.add_like('post', self.fan, self.post.pk))
+        self.assertEqual(PostLike.objects.count(), 1)
+        self.assertEqual(likes.remove_like('post', self.fan, self.post.pk), 1)
+        self.assertEqual(likes.remove_like('post', self.fan, self.post.pk), 0)
+
+    def test_missing_or_deleted_target(self):
+        with self.assertRaises(likes.LikeTargetMissing):
+            likes.add_like('post', self.fan, 999999)
+        likes.add_like('post', self.fan, self.post.pk)
+        self.post.soft_delete()
+        with self.assertRaises(likes.LikeTargetMissing):
+            likes.add_like('post', self.fan, self.post.pk)
+        self.assertEqual(PostLike.objects.count(), 1)
+
+    def test_put_and_delete_endpoints(self):
+        client = APIClient()
+        client.force_authenticate(self.fan)
+        url = f'/api/posts/{self.post.pk}/like/'
+        self.assertEqual([client.put(url).status_code for _ in range(2)], [200, 200])
+        self.assertTrue(client.put(url).json()['is_liked'])
+        self.assertEqual([client.delete(url).status_code for _ in range(2)], [200, 200])
+        self.assertEqual(client.post(url).status_code, 201)
+        self.assertEqual(PostLike.objects.count(), 1)
+
+
+class LikeCountTests(QueueDirMixin, TestCase):
+    """like_count는 유입 모드와 상관없이 같은 값"""
+
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.fans = [User.objects.create_user(f'fan{i}', password='pw12345!') for i in range(3)]
+        self.post = Post.objects.create(title='t', content='c', author=self.author)
+
+    def like_count(self):
+        self.post.refresh_from_db()
+        return self.post.like_count
+
+    def test_sync_mode_keeps_like_count(self):
+        with override_settings(LIKE_INGESTION_MODE='sync'):
+            for fan in self.fans:
+                likes.add_like('post', fan, self.post.pk)
+            likes.add_like('post', self.fans[0], self.post.pk)
+            likes.remove_like('post', self.fans[1], self.post.pk)
+        self.assertEqual(self.like_count(), 2)
+
+        # 모드를 바꿔도 이어서 맞게 셈
+        likes.remove_like('post', self.fans[2], self.post.pk)
+        like_queue.flush()
+        self.assertEqual(self.like_count(), 1)
+
+    def test_queued_like_schedules_one_flush_task(self):
+        for fan in self.fans:
+            likes.add_like('post', fan, self.post.pk)
+        scheduled = Task.objects.filter(name='posts.tasks.flush_likes')
+        self.assertEqual(scheduled.count(), 1)
+
+        Task.objects.update(run_at=timezone.now())
+        self.assertTrue(run_task(claim('w1'), 'w1'))
+        self.assertEqual(self.like_count(), 3)
+        self.assertFalse(like_queue.has_pending())
+
+
+@override_settings(CACHES=LOCMEM_CACHES, LIKE_INGESTION_MODE='sync', THROTTLE_ENABLED=False)
+class SoftDeleteTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.fan = User.objects.create_user('fan', password='pw12345!')
+        self.post = Post.objects.create(title='t', content='c', author=self.author)
+        likes.add_like('post', self.fan, self.post.pk)
+
+    def test_delete_schedules_reaper_once(self):
+        client = APIClient()
+        client.force_authenticate(self.author)
+        self.assertEqual(client.delete(f'/api/posts/delete-post/{self.post.pk}/').status_code, 200)
+        deleted_at = Post.all_objects.get(pk=self.post.pk).deleted_at
+
+        # 다시 지워도 삭제 시각이 바뀌지 않고 작업도 하나만
+        Post.all_objects.get(pk=self.post.pk).soft_delete()
+        self.assertEqual(Post.all_objects.get(pk=self.post.pk).deleted_at, deleted_at)
+        self.assertEqual(Task.objects.filter(name='posts.tasks.reap_deleted').count(), 1)
+
+        self.assertTrue(run_task(claim('w1'), 'w1'))
+        self.assertFalse(Post.all_objects.filter(pk=self.post.pk).exists())
+        self.assertFalse(PostLike.objects.exists())
+
+    def test_deleted_user_is_reaped_over_several_runs(self):
+        self.author.profile.soft_delete()
+        # 게시물을 먼저 지우고 다음 실행에서 사용자를 지움
+        for _ in range(5):
+            task = claim('w1')
+            if task is None:
+                break
+            self.assertTrue(run_task(task, 'w1'))
+        self.assertFalse(User.objects.filter(pk=self.author.pk).exists())
+        self.assertFalse(Post.all_objects.exists())
+
+
+class LiveCountsTests(TestCase):
+    """/api/live/ SSE를 ASGI 호출로 직접 확인"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        settings_override = override_settings(
+            LIVE_SOCKET_DIR=directory, LIVE_DEBOUNCE_SECONDS=0.01, LIVE_KEEPALIVE_SECONDS=60,
+            CACHES=LOCMEM_CACHES,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # 테스트마다 이벤트 루프가 다르므로 허브도 새로
+        self.hub = live.LiveHub()
+        patcher = mock.patch.object(live, 'hub', self.hub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(lambda: self.hub.sock and self.hub.sock.close())
+
+        self.author = User.objects.create_user('author', password='pw12345!')
+        self.fan = User.objects.create_user('fan', password='pw12345!')
+        self.post = Post.objects.create(title='t', content='c', author=self.author, view_count=3)
+
+    async def call(self, query, method='GET'):
+        """(보낸 메시지 목록, 연결 끊기, 앱 실행 태스크)"""
+        sent, incoming = [], asyncio.Queue()
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': method, 'path': '/api/live/', 'query_string': query.encode()}
+        task = asyncio.ensure_future(live.LiveCountsApp(None)(scope, incoming.get, send))
+        return sent, lambda: incoming.put_nowait({'type': 'http.disconnect'}), task
+
+    async def wait_for(self, sent, count):
+        for _ in range(200):
+            if len(sent) >= count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f'{count}번째 메시지가 오지 않음: {sent}')
+
+    async def test_snapshot_then_debounced_counts(self):
+        sent, disconnect, task = await self.call(f'posts={self.post.pk},{self.post.pk}')
+        await self.wait_for(sent, 2)
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn((b'content-type', b'text/event-stream'), sent[0]['headers'])
+        self.assertEqual(sent[1]['body'].decode(),
+                         f'event: snapshot\ndata: {{"posts":{{"{self.post.pk}":{{"likes":0,"views":3}}}}}}\n\n')
+
+        await sync_to_async(PostLike.objects.create)(user=self.fan, post=self.post)
+        # 커밋 뒤 notify가 보내는 것과 같은 알림 (다른 항목 알림은 무시됨)
+        live._send(json.dumps({'post': [self.post.pk, 999999]}).encode())
+        await self.wait_for(sent, 3)
+        body = sent[2]['body'].decode()
+        self.assertTrue(body.startswith('event: counts\n'))
+        self.assertEqual(json.loads(body.split('data: ', 1)[1]), {
+            'posts': {str(self.post.pk): {'likes': 1, 'views': 3, 'delta': {'likes': 1, 'views': 0}}},
+        })
+
+        disconnect()
+        await task
+        self.assertFalse(self.hub.subscribers)
+
+    async def test_bad_requests(self):
+        with override_settings(LIVE_MAX_IDS=2):
+            for query, method, status in [('', 'GET', 400), ('posts=a,²', 'GET', 400),
+                                          ('posts=1,2,3', 'GET', 400), ('posts=1', 'POST', 405)]:
+                sent, _, task = await self.call(query, method)
+                await task
+                self.assertEqual(sent[0]['status'], status, query)
+                self.assertIn('error', json.loads(sent[1]['body']))
+
+    def test_notify_without_asgi_workers_is_silent(self):
+        shutil.rmtree(settings.LIVE_SOCKET_DIR)
+        with self.captureOnCommitCallbacks(execute=True):
+            live.notify('post', self.post.pk)
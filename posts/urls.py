@@ -6,8 +6,11 @@ from .views import (
     PostUpdateView,
     MyPostsListView,
     FavoritePostsListView,
-    toggle_post_like
+    toggle_post_like,
+    record_post_view,
+    PostBatchView,
 )
+from recommendations.views import RelatedPostsView
 
 urlpatterns = [
     # ==================== 기존 URL (그대로 유지!) ====================
@@ -19,5 +22,8 @@ urlpatterns = [
     # ==================== 여기서부터 새로 추가! ====================
     path('my-posts/', MyPostsListView.as_view(), name='my-posts'),
     path('favorites/', FavoritePostsListView.as_view(), name='favorite-posts'),
+    path('batch/', PostBatchView.as_view(), name='post-batch'),
     path('<int:post_id>/like/', toggle_post_like, name='toggle-post-like'),
+    path('<int:post_id>/view/', record_post_view, name='post-view'),
+    path('<int:post_id>/related/', RelatedPostsView.as_view(), name='related-posts'),
 ]
@@ -1,16 +1,25 @@
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework import status, generics, filters
 from rest_framework.generics import ListAPIView
 from rest_framework.filters import OrderingFilter
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import Q, Count, F
 from .serializers import PostSerializer, PostDetailSerializer, FavoritePostSerializer
 from rest_framework.parsers import MultiPartParser, FormParser
 from .models import Post, PostLike
+from .likes import add_like, remove_like, toggle_like, liked_ids, LikeTargetMissing
+from analytics import rollups
+from prototype import live
+from prototype.batch import BatchLookupView
+from prototype.fieldsets import SparseFieldsetViewMixin
+from prototype.fragment_cache import fragment_cache
+from prototype.streaming import StreamingListMixin
+from prototype.throttling import TokenBucketThrottle
 
 
 # ==================== 기존 뷰들 (그대로 유지!) ====================
@@ -18,6 +27,7 @@ from .models import Post, PostLike
 class PostCreateView(APIView):
     permission_classes = [IsAuthenticated]
     parser_classes = (MultiPartParser, FormParser)
+    throttle_classes = [TokenBucketThrottle.scoped('post_create')]
 
     def post(self, request):
         serializer = PostSerializer(data=request.data)
@@ -27,7 +37,7 @@ class PostCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
 
-class PostListView(ListAPIView):
+class PostListView(SparseFieldsetViewMixin, StreamingListMixin, ListAPIView):
     queryset = Post.objects.all()
     serializer_class = PostSerializer
     filter_backends = [OrderingFilter]
@@ -73,7 +83,8 @@ class PostDeleteView(APIView):
             post = Post.objects.get(id=post_id)
             if (post.author != request.user) and (not request.user.is_staff) and (not request.user.is_superuser):
                 return Response({'error': '삭제 권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
-            post.delete()
+            # 좋아요/미디어 정리는 reap_deleted가 백그라운드에서 처리
+            post.soft_delete()
             return Response({'message': '게시글이 삭제되었습니다.'}, status=status.HTTP_200_OK)
         except Post.DoesNotExist:
             return Response({'error': '게시글을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
@@ -88,7 +99,7 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class MyPostsListView(generics.ListAPIView):
+class MyPostsListView(SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView):
     """내 게시물 목록 조회"""
     serializer_class = PostDetailSerializer
     permission_classes = [IsAuthenticated]
@@ -121,40 +132,82 @@ class MyPostsListView(generics.ListAPIView):
         return queryset
 
 
-class FavoritePostsListView(generics.ListAPIView):
-    """내가 좋아요한 게시물 목록 조회"""
+class FavoritePostsListView(SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView):
+    """내가 좋아요한 게시물 목록 조회 (?fields= / ?omit= 은 안쪽 post에 적용)"""
     serializer_class = FavoritePostSerializer
+    projection_field = 'post'
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
     
     def get_queryset(self):
         user = self.request.user
-        return PostLike.objects.filter(user=user).select_related('post', 'post__author')
+        return PostLike.objects.filter(
+            user=user, post__deleted_at__isnull=True
+        ).select_related('post', 'post__author')
 
 
-@api_view(['POST'])
+class PostBatchView(BatchLookupView):
+    """게시물 여러 개를 id로 한 번에 조회 (?ids=1,2,3, 요청 순서 유지, 없는 id는 missing)"""
+    serializer_class = PostDetailSerializer
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        return Post.objects.select_related('author')
+
+    def get_batch_context(self, objects):
+        if self.request.user.is_authenticated:
+            return {'liked_ids': liked_ids('post', self.request.user, list(objects))}
+        return {}
+
+
+@api_view(['POST', 'PUT', 'DELETE'])
 @permission_classes([IsAuthenticated])
+@throttle_classes([TokenBucketThrottle.scoped('like')])
 def toggle_post_like(request, post_id):
-    """게시물 좋아요 토글"""
+    """게시물 좋아요 토글 (POST) / 좋아요 (PUT) / 좋아요 취소 (DELETE)"""
+    user = request.user
+
     try:
-        post = Post.objects.get(id=post_id)
-    except Post.DoesNotExist:
+        if request.method == 'PUT':
+            add_like('post', user, post_id)
+            is_liked = True
+        elif request.method == 'DELETE':
+            remove_like('post', user, post_id)
+            is_liked = False
+        else:
+            is_liked = toggle_like('post', user, post_id)
+    except LikeTargetMissing:
         return Response(
             {"error": "게시물을 찾을 수 없습니다."},
             status=status.HTTP_404_NOT_FOUND
         )
     
-    user = request.user
-    like, created = PostLike.objects.get_or_create(user=user, post=post)
-    
-    if not created:
-        like.delete()
+    if not is_liked:
         return Response(
             {"message": "좋아요가 취소되었습니다.", "is_liked": False},
             status=status.HTTP_200_OK
         )
     else:
+        # PUT은 멱등이므로 항상 200, 토글로 새로 누른 경우만 201
         return Response(
             {"message": "좋아요를 눌렀습니다.", "is_liked": True},
-            status=status.HTTP_201_CREATED
+            status=status.HTTP_201_CREATED if request.method == 'POST' else status.HTTP_200_OK
         )
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@throttle_classes([TokenBucketThrottle.scoped('view')])
+def record_post_view(request, post_id):
+    """게시물 조회 기록 (조회수 +1, 작성자 대시보드 집계)"""
+    with transaction.atomic():
+        if not Post.objects.filter(pk=post_id).update(view_count=F('view_count') + 1):
+            return Response(
+                {"error": "게시물을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        rollups.bump('post', {post_id: {'views': 1}})
+    # 직렬화 조각에 view_count가 들어 있음
+    fragment_cache.bump('post', post_id)
+    live.notify('post', post_id)
+    return Response(status=status.HTTP_204_NO_CONTENT)
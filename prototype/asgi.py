@@ -13,4 +13,14 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'prototype.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# URL/시리얼라이저/JWT/DB 연결/검색 인덱스 등을 첫 요청 전에 미리 준비 (prototype/warmup.py)
+from prototype.warmup import warm_up_on_startup  # noqa: E402
+
+warm_up_on_startup(django_application)
+
+# /api/live/ (좋아요/조회수 SSE)만 직접 처리하고 나머지는 Django로
+from prototype.live import LiveCountsApp  # noqa: E402
+
+application = LiveCountsApp(django_application)
@@ -0,0 +1,78 @@
+# prototype/batch.py
+"""
+id 목록을 한 번에 조회하는 엔드포인트 (?ids=).
+
+    GET /api/posts/batch/?ids=5,3,9
+    -> {"results": [{...id 5}, {...id 9}], "missing": [3]}
+
+알림/딥링크/캐시된 피드처럼 id만 가진 클라이언트가 항목마다 요청하지 않도록
+IN 쿼리 한 번으로 읽어서 목록 API와 같은 시리얼라이저로 직렬화한다.
+results는 요청한 순서를 따르고(중복 id는 한 번만), 없거나 삭제된 id는 missing에 담는다.
+?fields= / ?omit= 도 목록 API와 같이 쓸 수 있다.
+"""
+from django.conf import settings
+from rest_framework import generics
+from rest_framework.response import Response
+
+from .fieldsets import SparseFieldsetViewMixin
+
+
+# DB 정수 컬럼(64비트)에 넣을 수 있는 최댓값. 넘으면 쿼리에서 OverflowError
+MAX_ID = 2 ** 63 - 1
+
+
+class InvalidIds(ValueError):
+    pass
+
+
+def parse_ids(value, limit):
+    """'5,3,9' -> [5, 3, 9] (순서 유지, 중복 제거)"""
+    ids = []
+    for part in (value or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        # isdigit()은 '²' 같은 문자도 받아서 int()가 실패하므로 ASCII 숫자만 허용
+        if not (part.isascii() and part.isdecimal()) or not 0 < int(part) <= MAX_ID:
+            raise InvalidIds(f"id는 양의 정수여야 합니다: {part}")
+        ids.append(int(part))
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        raise InvalidIds("ids를 쉼표로 구분해서 주세요. (예: ?ids=1,2,3)")
+    if len(ids) > limit:
+        raise InvalidIds(f"한 번에 최대 {limit}개까지 조회할 수 있습니다.")
+    return ids
+
+
+class BatchLookupView(SparseFieldsetViewMixin, generics.GenericAPIView):
+    """
+    get_queryset()에서 ?ids= 에 해당하는 행을 읽어 요청 순서대로 직렬화.
+    조회 범위(삭제 표시 제외 등)와 select_related는 get_queryset()이 정함
+    """
+    ids_query_param = 'ids'
+    pagination_class = None
+
+    def get_max_ids(self):
+        return settings.BATCH_MAX_IDS
+
+    def get_objects(self, ids):
+        queryset = self.filter_queryset(self.get_queryset()).filter(pk__in=ids)
+        return {obj.pk: obj for obj in queryset}
+
+    def get_batch_context(self, objects):
+        """찾은 객체 {pk: 객체}로 미리 계산해서 시리얼라이저 context에 더할 값 (좋아요 여부 등)"""
+        return {}
+
+    def get(self, request, *args, **kwargs):
+        try:
+            ids = parse_ids(request.query_params.get(self.ids_query_param), self.get_max_ids())
+        except InvalidIds as exc:
+            return Response({'error': str(exc)}, status=400)
+
+        found = self.get_objects(ids)
+        context = {**self.get_serializer_context(), **self.get_batch_context(found)}
+        serializer = self.get_serializer([found[pk] for pk in ids if pk in found], many=True, context=context)
+        return Response({
+            'results': serializer.data,
+            'missing': [pk for pk in ids if pk not in found],
+        })
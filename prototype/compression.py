@@ -0,0 +1,229 @@
+# prototype/compression.py
+"""
+응답 압축 + 익명 요청 응답 캐시 (CompressionMiddleware).
+
+- Accept-Encoding을 보고 br(brotli 패키지가 있을 때) > gzip 순으로 고른다.
+- 오디오/이미지/zip처럼 이미 압축된 형식, 작은 본문, Range(206) 응답, 이미 인코딩된 응답은 그대로 보낸다.
+- 스트리밍 응답(?stream=1, 내보내기)은 조각 단위로 압축하며 흘려보낸다.
+- RESPONSE_CACHE_PATHS에 적힌 경로의 익명 GET 응답은 RESPONSE_CACHE_ALIAS 캐시에 본문째 저장하고,
+  압축한 바이트도 그 옆에 (본문 ETag, 인코딩) 키로 저장한다. 그래서 인기 있는 응답은 뷰를 다시 실행하지도,
+  요청마다 다시 압축하지도 않으며, 본문이 바뀌면 ETag가 바뀌므로 예전 압축본은 쓰이지 않는다.
+  If-None-Match가 맞으면 본문 없이 304를 보낸다.
+  캐시 키에는 Accept 헤더가 들어가고, JSON 응답만 저장하며, 이 경로의 응답에는 Vary: Accept, Cookie를 붙인다.
+  한 번만 압축하므로 캐시되는 응답은 더 높은 압축 단계를 쓴다.
+
+익명 여부는 인증 전에 판단해야 하므로 Authorization 헤더와 세션 쿠키가 없는 요청을 익명으로 본다.
+"""
+import gzip
+import hashlib
+import re
+import zlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+
+# 압축하지 않는 Content-Type (이미 압축된 형식)
+SKIP_TYPES = ('audio/', 'image/', 'video/', 'application/zip', 'application/gzip', 'application/x-gzip')
+
+# 요청마다 압축할 때 / 캐시해 두고 여러 번 보낼 때의 압축 단계
+LEVELS = {
+    'gzip': {'dynamic': 6, 'cached': 9},
+    'br': {'dynamic': 4, 'cached': 9},
+}
+
+# 캐시에 넣지 않는 응답 헤더 (다시 계산하거나, 사용자에게 묶인 값)
+_UNCACHED_HEADERS = {'content-length', 'content-encoding', 'set-cookie', 'etag'}
+
+_accept_re = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*')
+
+
+def available_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def choose_encoding(accept_encoding):
+    """Accept-Encoding에서 쓸 인코딩 (없으면 None). q가 같으면 br을 먼저"""
+    weights = {}
+    for part in (accept_encoding or '').split(','):
+        match = _accept_re.fullmatch(part)
+        if not match:
+            continue
+        try:
+            weights[match.group(1).lower()] = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+    best, best_weight = None, 0.0
+    for encoding in available_encodings():
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(data, encoding, level='dynamic'):
+    if encoding == 'br':
+        return brotli.compress(data, quality=LEVELS['br'][level])
+    # mtime=0: 같은 본문은 항상 같은 바이트 (ETag/캐시에 안정적)
+    return gzip.compress(data, compresslevel=LEVELS['gzip'][level], mtime=0)
+
+
+def _stream_compressor(encoding):
+    """(조각 압축 함수, 마무리 함수)"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=LEVELS['br']['dynamic'])
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(LEVELS['gzip']['dynamic'], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    # 조각마다 flush해서 스트리밍 응답이 버퍼에 묶이지 않게 함
+    return (lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)), compressor.flush
+
+
+def compress_stream(chunks, encoding):
+    process, finish = _stream_compressor(encoding)
+    for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+async def acompress_stream(chunks, encoding):
+    process, finish = _stream_compressor(encoding)
+    async for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+def etag_for(body):
+    return '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _skip(response):
+    content_type = response.get('Content-Type', '').lower()
+    return (
+        response.has_header('Content-Encoding')
+        or response.status_code == 206
+        or response.has_header('Content-Range')
+        or content_type.startswith(SKIP_TYPES)
+    )
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    def cache(self):
+        return caches[settings.RESPONSE_CACHE_ALIAS]
+
+    def cache_timeout(self, request):
+        """이 요청의 응답을 캐시할 시간(초). 캐시하지 않으면 None"""
+        if request.method != 'GET':
+            return None
+        timeout = settings.RESPONSE_CACHE_PATHS.get(request.path_info)
+        if not timeout:
+            return None
+        if 'HTTP_AUTHORIZATION' in request.META or settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return None
+        return timeout
+
+    def cache_key(self, request):
+        # DRF는 Accept로 렌더러를 고르므로 Accept가 다르면 다른 응답 (?format=은 경로에 포함)
+        raw = f'{request.get_host()}|{request.get_full_path()}|{request.META.get("HTTP_ACCEPT", "")}'
+        return 'resp:' + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def process_request(self, request):
+        if self.cache_timeout(request) is None:
+            return None
+        entry = self.cache().get(self.cache_key(request))
+        if entry is None:
+            return None
+        status, headers, body, etag = entry
+        response = HttpResponse(body, status=status)
+        for name, value in headers:
+            response[name] = value
+        response['ETag'] = etag
+        response.cached_etag = etag
+        return response
+
+    def process_response(self, request, response):
+        if request.method == 'GET' and request.path_info in settings.RESPONSE_CACHE_PATHS:
+            # 캐시 여부와 내용이 Accept와 (세션) 쿠키에 따라 다름
+            patch_vary_headers(response, ('Accept', 'Cookie'))
+        timeout = self.cache_timeout(request)
+        etag = getattr(response, 'cached_etag', None)
+        if timeout is not None and etag is None and self.storable(request, response):
+            etag = etag_for(response.content)
+            response['ETag'] = etag
+            headers = [(name, value) for name, value in response.items() if name.lower() not in _UNCACHED_HEADERS]
+            self.cache().set(self.cache_key(request), (response.status_code, headers, response.content, etag), timeout)
+
+        if _skip(response):
+            return response
+        if response.streaming:
+            patch_vary_headers(response, ('Accept-Encoding',))
+            encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING'))
+            if encoding is None:
+                return response
+            if response.is_async:
+                response.streaming_content = acompress_stream(response.streaming_content, encoding)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response['Content-Length']
+            response['Content-Encoding'] = encoding
+            return response
+
+        if len(response.content) < settings.COMPRESSION_MIN_BYTES:
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if etag is not None and etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+            return self.not_modified(response, etag)
+
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING'))
+        if encoding is None:
+            return response
+        if etag is not None:
+            # 캐시된 응답: 압축본도 (ETag, 인코딩)으로 캐시에서 꺼내거나 한 번만 만들어 둠
+            key = f'resp-body:{encoding}:{etag}'
+            compressed = self.cache().get(key)
+            if compressed is None:
+                compressed = compress(response.content, encoding, 'cached')
+                self.cache().set(key, compressed, timeout)
+        else:
+            compressed = compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        if response.has_header('ETag'):
+            # 인코딩마다 바이트가 다르므로 약한 비교용으로 표시 (GZipMiddleware와 같음)
+            response['ETag'] = 'W/' + response['ETag'].removeprefix('W/')
+        return response
+
+    def storable(self, request, response):
+        user = getattr(request, 'user', None)   # DRF 인증을 거쳤으면 그 사용자 (다른 방식으로 인증된 요청은 저장하지 않음)
+        return (
+            not (user and user.is_authenticated)
+            and response.status_code == 200
+            and not response.streaming
+            # JSON만 저장 (Browsable API HTML 등은 매번 렌더링)
+            and response.get('Content-Type', '').startswith('application/json')
+            and not response.has_header('Set-Cookie')
+            and 'private' not in response.get('Cache-Control', '')
+            and 'no-store' not in response.get('Cache-Control', '')
+        )
+
+    def not_modified(self, response, etag):
+        not_modified = HttpResponseNotModified()
+        not_modified['ETag'] = etag
+        for name in ('Vary', 'Cache-Control', 'Content-Location', 'Expires'):
+            if response.has_header(name):
+                not_modified[name] = response[name]
+        return not_modified
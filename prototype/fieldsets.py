@@ -0,0 +1,122 @@
+# prototype/fieldsets.py
+"""
+목록 API의 ?fields= / ?omit= (sparse fieldset).
+
+    GET /api/posts/list-posts/?fields=postId,title,author
+    GET /api/music/?omit=description,audio_file
+
+시리얼라이저는 고른 필드만 직렬화하고, 뷰는 그 필드에 필요한 컬럼만 .only()로 SELECT한다.
+(긴 content/description을 디스크에서 읽지도, 응답으로 보내지도 않음)
+알 수 없는 필드 이름은 무시하며, fields에 유효한 이름이 하나도 없으면 전체 필드를 보낸다.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def parse_field_list(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    ModelSerializer용 믹스인. context['sparse_fields'] = (포함할 필드 set 또는 None, 뺄 필드 set)
+    중첩된 경우(좋아요 목록의 post 등)에도 루트의 context를 따름
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        include, omit = self.context.get('sparse_fields', (None, set()))
+        if include and include & fields.keys():
+            fields = {name: field for name, field in fields.items() if name in include}
+        return {name: field for name, field in fields.items() if name not in omit}
+
+
+def _select_related_paths(tree, prefix=''):
+    """query.select_related({'post': {'author': {}}}) -> ['post', 'post__author']"""
+    if not isinstance(tree, dict):
+        return []
+    paths = []
+    for name, children in tree.items():
+        path = f'{prefix}{name}'
+        paths.append(path)
+        paths.extend(_select_related_paths(children, f'{path}__'))
+    return paths
+
+
+def _related_model(model, path):
+    for name in path.split('__'):
+        model = model._meta.get_field(name).related_model
+    return model
+
+
+def _columns_for(serializer, prefix='', related=()):
+    """
+    직렬화할 필드에 필요한 모델 컬럼 이름. 전체가 필요하면 None
+    related: select_related로 함께 읽는 관계 경로 (중첩 시리얼라이저 컬럼까지 좁힘)
+    """
+    model = serializer.Meta.model
+    columns = {f'{prefix}{model._meta.pk.name}'}
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.SerializerMethodField):
+            continue  # pk만 있으면 됨 (필요한 건 메서드가 따로 조회)
+        root = field.source.split('.')[0]
+        if root == '*':
+            return None
+        try:
+            model_field = model._meta.get_field(root)
+        except FieldDoesNotExist:
+            continue  # property: pk만 있으면 됨
+        if not model_field.concrete:
+            continue
+        columns.add(f'{prefix}{root}')
+        if isinstance(field, serializers.BaseSerializer) and f'{prefix}{root}' in related:
+            nested = _columns_for(field, f'{prefix}{root}__', related)
+            if nested is not None:
+                columns |= nested
+    return columns
+
+
+class SparseFieldsetViewMixin:
+    """
+    ListAPIView용 믹스인. ?fields= / ?omit= 를 시리얼라이저 context로 넘기고 쿼리셋에 .only() 적용
+    projection_field: 목록 행이 다른 모델을 감싸는 경우 그 필드 이름 (좋아요 목록의 'post' 등)
+    """
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+    projection_field = None
+
+    def get_sparse_fields(self):
+        params = self.request.query_params
+        include = parse_field_list(params.get(self.fields_query_param)) or None
+        omit = parse_field_list(params.get(self.omit_query_param))
+        return include, omit
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['sparse_fields'] = self.get_sparse_fields()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        include, omit = self.get_sparse_fields()
+        if include is None and not omit:
+            return queryset
+        return self.project_queryset(queryset)
+
+    def project_queryset(self, queryset):
+        serializer = self.get_serializer()
+        related = _select_related_paths(queryset.query.select_related)
+        columns = _columns_for(serializer, related=related)
+        if columns is not None and self.projection_field:
+            nested = _columns_for(
+                serializer.fields[self.projection_field], f'{self.projection_field}__', related
+            )
+            columns = None if nested is None else columns | nested
+        if columns is None:
+            return queryset
+        # select_related로 따라가는 관계는 지연시킬 수 없으므로 항상 포함 (안 쓰는 관계는 pk만 읽음)
+        for path in related:
+            columns.add(path)
+            if not any(column.startswith(f'{path}__') for column in columns):
+                columns.add(f'{path}__{_related_model(queryset.model, path)._meta.pk.name}')
+        return queryset.only(*columns)
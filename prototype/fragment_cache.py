@@ -0,0 +1,228 @@
+# prototype/fragment_cache.py
+"""
+객체 단위 직렬화 조각(fragment) 캐시.
+
+게시물/음악 한 건을 직렬화한 결과 중 사용자와 무관한 부분만 저장해 두고,
+is_liked 같은 사용자별 필드는 응답 시점에 붙인다.
+키는 (종류, id, 버전)이며 버전은 저장/좋아요 변경 때마다 새로 매겨진다.
+
+2단 구성: 프로세스 안의 LRU -> settings.FRAGMENT_CACHE_ALIAS 캐시(워커 간 공유).
+버전은 항상 공유 캐시에서 읽으므로 다른 워커에서 바뀐 내용도 바로 반영된다.
+버전을 올리지 않는 변경도 있을 수 있으므로 로컬 LRU의 조각도 FRAGMENT_CACHE_TIMEOUT이 지나면 버린다.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+
+class LRUCache:
+    """스레드 안전한 간단한 LRU. timeout(초)을 주면 그보다 오래된 값은 없는 것으로 봄"""
+
+    def __init__(self, max_entries, timeout=None):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.timeout if self.timeout is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class FragmentCache:
+    def __init__(self):
+        self.local = LRUCache(getattr(settings, 'FRAGMENT_CACHE_LOCAL_ENTRIES', 5000), timeout=self.timeout)
+
+    @property
+    def shared(self):
+        return caches[getattr(settings, 'FRAGMENT_CACHE_ALIAS', 'default')]
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', 300)
+
+    @staticmethod
+    def _version_key(kind, pk):
+        return f'frag-ver:{kind}:{pk}'
+
+    def versions(self, kind, pks):
+        """pk -> 현재 버전. 없으면 새로 매김 (예전 버전으로 되돌아가지 않도록 시각 기반)"""
+        keys = {self._version_key(kind, pk): pk for pk in pks}
+        found = self.shared.get_many(list(keys))
+        result = {keys[key]: version for key, version in found.items()}
+        missing = [pk for pk in pks if pk not in result]
+        if missing:
+            version = time.time_ns()
+            self.shared.set_many({self._version_key(kind, pk): version for pk in missing}, None)
+            result.update((pk, version) for pk in missing)
+        return result
+
+    def bump(self, kind, *pks):
+        """내용이 바뀐 객체의 버전을 올림 (예전 조각은 더 이상 읽히지 않음)"""
+        if pks:
+            version = time.time_ns()
+            self.shared.set_many({self._version_key(kind, pk): version for pk in pks}, None)
+
+    def get_many(self, keys):
+        """조각 키 목록 -> {키: 조각}. 로컬 LRU를 먼저 보고 없는 것만 공유 캐시에서 한 번에 가져옴"""
+        result = {}
+        misses = []
+        for key in keys:
+            fragment = self.local.get(key)
+            if fragment is None:
+                misses.append(key)
+            else:
+                result[key] = fragment
+        if misses:
+            for key, fragment in self.shared.get_many(misses).items():
+                self.local.set(key, fragment)
+                result[key] = fragment
+        return result
+
+    def set_many(self, fragments):
+        for key, fragment in fragments.items():
+            self.local.set(key, fragment)
+        if fragments:
+            self.shared.set_many(fragments, self.timeout)
+
+
+fragment_cache = FragmentCache()
+
+
+class FragmentListSerializer(serializers.ListSerializer):
+    """페이지 전체의 조각을 get_many 한 번으로 미리 가져오는 ListSerializer"""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        self.child.prefetch_fragments(items)
+        try:
+            return [self.child.to_representation(item) for item in items]
+        finally:
+            self.child.flush_fragments()
+
+
+class FragmentCacheMixin:
+    """
+    ModelSerializer용 믹스인.
+    fragment_kind: 버전 키에 쓰는 종류 이름 ('post', 'music')
+    per_user_fields: 캐시하지 않고 매번 계산하는 필드
+    """
+    fragment_kind = None
+    per_user_fields = ()
+
+    def _fragment_state(self):
+        if not hasattr(self, '_fragment_prefetched'):
+            self._fragment_prefetched = {}
+            self._fragment_pending = {}
+        return self._fragment_prefetched, self._fragment_pending
+
+    def _fragment_prefix(self):
+        """직렬화 모양(시리얼라이저, 필드 구성, 호스트)이 다르면 다른 조각"""
+        request = self.context.get('request')
+        host = request.build_absolute_uri('/') if request else ''
+        fields = ','.join(
+            field.field_name for field in self._readable_fields
+            if field.field_name not in self.per_user_fields
+        )
+        shape = hashlib.md5(f'{type(self).__name__}|{fields}|{host}'.encode()).hexdigest()[:12]
+        return f'frag:{self.fragment_kind}:{shape}'
+
+    def _fragment_keys(self, pks):
+        prefix = self._fragment_prefix()
+        versions = fragment_cache.versions(self.fragment_kind, pks)
+        return {pk: f'{prefix}:{pk}:{versions[pk]}' for pk in pks}
+
+    def prefetch_fragments(self, instances):
+        prefetched, _ = self._fragment_state()
+        keys = self._fragment_keys([instance.pk for instance in instances])
+        found = fragment_cache.get_many(list(keys.values()))
+        for pk, key in keys.items():
+            prefetched[pk] = (key, found.get(key))
+
+    def flush_fragments(self):
+        prefetched, pending = self._fragment_state()
+        fragment_cache.set_many(pending)
+        prefetched.clear()
+        pending.clear()
+
+    def _render_fields(self, instance, fields):
+        ret = {}
+        for field in fields:
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            ret[field.field_name] = None if check_for_none is None else field.to_representation(attribute)
+        return ret
+
+    def to_representation(self, instance):
+        prefetched, pending = self._fragment_state()
+        entry = prefetched.get(instance.pk)
+        if entry is None:
+            key = self._fragment_keys([instance.pk])[instance.pk]
+            entry = (key, fragment_cache.get_many([key]).get(key))
+        key, fragment = entry
+
+        fields = list(self._readable_fields)
+        if fragment is None:
+            fragment = self._render_fields(
+                instance, [f for f in fields if f.field_name not in self.per_user_fields]
+            )
+            if instance.pk in prefetched:
+                pending[key] = fragment
+            else:
+                fragment_cache.set_many({key: fragment})
+
+        per_user = self._render_fields(
+            instance, [f for f in fields if f.field_name in self.per_user_fields]
+        )
+        # 원래 필드 순서대로 합침
+        return {
+            field.field_name: per_user[field.field_name] if field.field_name in per_user
+            else fragment[field.field_name]
+            for field in fields
+            if field.field_name in per_user or field.field_name in fragment
+        }
+
+
+class NestedFragmentMixin:
+    """
+    다른 객체를 감싸는 시리얼라이저(좋아요 목록 등)용.
+    fragment_field가 가리키는 안쪽 시리얼라이저의 조각을 페이지 단위로 미리 가져옴
+    """
+    fragment_field = None
+
+    def prefetch_fragments(self, instances):
+        field = self.fields[self.fragment_field]
+        field.prefetch_fragments([getattr(instance, field.source) for instance in instances])
+
+    def flush_fragments(self):
+        self.fields[self.fragment_field].flush_fragments()
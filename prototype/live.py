@@ -0,0 +1,356 @@
+# prototype/live.py
+"""
+좋아요/조회수 실시간 푸시 (ASGI Server-Sent Events).
+
+    GET /api/live/?posts=1,2,3&music=4,5
+
+처음에 구독한 항목의 현재 값을 snapshot 이벤트로 보내고,
+이후 좋아요가 커밋될 때마다 LIVE_DEBOUNCE_SECONDS 단위로 모아서 counts 이벤트(현재 값 + 증감)를 보낸다.
+
+- 알림: 좋아요를 쓰는 쪽(WSGI/ASGI 워커, 작업 큐, flush_likes)은 notify()로 "이 항목이 바뀜"만 알린다.
+  커밋된 뒤 LIVE_SOCKET_DIR 안의 각 ASGI 워커 Unix 소켓으로 datagram을 보낸다 (브로커 없는 pub/sub 대용).
+- 집계: 각 ASGI 워커의 LiveHub가 바뀐 항목 중 구독자가 있는 것만 모아서 한 번에 다시 센다.
+- 구독: 연결마다 작은 큐 하나와 연결 종료 감시 코루틴 하나만 두고,
+  keep-alive는 허브가 한 번에 모든 큐에 넣으므로 연결별 타이머가 없다.
+"""
+import asyncio
+import errno
+import json
+import logging
+import os
+import socket
+from collections import defaultdict
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Count
+
+
+logger = logging.getLogger(__name__)
+
+
+# datagram 하나에 담는 최대 id 수
+NOTIFY_CHUNK = 1000
+
+
+def _socket_dir():
+    path = settings.LIVE_SOCKET_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+# 보내는 쪽에서 본 소켓 디렉터리: (경로, mtime) -> 소켓 경로 목록
+_targets_cache = (None, None, ())
+
+
+def _targets():
+    """ASGI 워커 소켓 경로 목록. 디렉터리 mtime이 그대로면 다시 읽지 않음 (소켓이 생기거나 지워지면 mtime이 바뀜)"""
+    global _targets_cache
+    directory = str(settings.LIVE_SOCKET_DIR)
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        # ASGI 워커가 한 번도 뜨지 않음 = 구독자 없음 (보내는 쪽은 디렉터리를 만들지 않음)
+        return ()
+    cached_dir, cached_mtime, paths = _targets_cache
+    if (cached_dir, cached_mtime) == (directory, mtime):
+        return paths
+    paths = tuple(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.sock')
+    )
+    _targets_cache = (directory, mtime, paths)
+    return paths
+
+
+def _send(message):
+    """
+    모든 ASGI 워커 소켓으로 전송. 죽은 워커의 소켓 파일은 지움
+    on_commit에서 불리므로 실패해도 예외를 올리지 않음 (좋아요는 이미 커밋됨, 알림만 버림)
+    """
+    try:
+        paths = _targets()
+        if not paths:
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            for path in paths:
+                try:
+                    sock.sendto(message, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                except OSError as exc:
+                    # 받는 쪽 버퍼가 가득 참: 이번 알림은 버림 (다음 변경 때 다시 셈)
+                    if exc.errno not in (errno.EAGAIN, errno.ENOBUFS):
+                        logger.warning("live notify to %s failed: %s", path, exc)
+    except OSError as exc:
+        logger.warning("live notify failed: %s", exc)
+
+
+def notify(kind, *pks):
+    """kind('post'/'music') 항목의 좋아요/조회수가 바뀌었음을 알림. 트랜잭션 안이면 커밋된 뒤 전송"""
+    if not pks:
+        return
+    pks = [int(pk) for pk in pks]
+
+    def send():
+        for start in range(0, len(pks), NOTIFY_CHUNK):
+            _send(json.dumps({kind: pks[start:start + NOTIFY_CHUNK]}).encode())
+
+    transaction.on_commit(send)
+
+
+def _fetch_counts(keys):
+    """{(kind, pk): {'likes': n, 'views': n}} - 구독 중인 항목만 한 번에 셈"""
+    from mypage.models import MusicLike
+    from posts.models import Post, PostLike
+
+    close_old_connections()
+    by_kind = defaultdict(list)
+    for kind, pk in keys:
+        by_kind[kind].append(pk)
+
+    counts = {}
+    if by_kind['post']:
+        ids = by_kind['post']
+        likes = dict(
+            PostLike.objects.filter(post_id__in=ids).order_by()
+            .values('post_id').annotate(n=Count('id')).values_list('post_id', 'n')
+        )
+        views = dict(Post.objects.filter(pk__in=ids).values_list('pk', 'view_count'))
+        for pk in ids:
+            counts[('post', pk)] = {'likes': likes.get(pk, 0), 'views': views.get(pk, 0)}
+    if by_kind['music']:
+        ids = by_kind['music']
+        likes = dict(
+            MusicLike.objects.filter(music_id__in=ids).order_by()
+            .values('music_id').annotate(n=Count('id')).values_list('music_id', 'n')
+        )
+        for pk in ids:
+            counts[('music', pk)] = {'likes': likes.get(pk, 0)}
+    return counts
+
+
+def _group(values):
+    """{(kind, pk): 값} -> {'posts': {pk: 값}, 'music': {pk: 값}}"""
+    grouped = {}
+    for (kind, pk), value in values.items():
+        grouped.setdefault('posts' if kind == 'post' else 'music', {})[str(pk)] = value
+    return grouped
+
+
+def _event(name, data):
+    return f'event: {name}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'.encode()
+
+
+KEEPALIVE = b': keep-alive\n\n'
+
+
+class Subscriber:
+    __slots__ = ('keys', 'queue')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.queue = asyncio.Queue(maxsize=settings.LIVE_QUEUE_SIZE)
+
+    def push(self, chunk):
+        # 느린 클라이언트: 오래된 것을 버림 (counts 이벤트에 현재 값이 함께 있어 다음 이벤트로 복구됨)
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(chunk)
+
+
+class LiveHub:
+    """ASGI 워커(이벤트 루프)마다 하나. 구독 관리와 알림 수신, 디바운스 집계를 맡음"""
+
+    def __init__(self):
+        self.subscribers = defaultdict(set)   # (kind, pk) -> {Subscriber}
+        self.counts = {}                      # 구독 중인 항목의 마지막으로 보낸 값
+        self.dirty = set()
+        self.changed = None
+        self.loop = None
+        self.sock = None
+
+    def start(self):
+        if self.loop is not None:
+            return
+        self.loop = asyncio.get_running_loop()
+        self.changed = asyncio.Event()
+
+        path = os.path.join(_socket_dir(), f'{os.getpid()}.sock')
+        if os.path.exists(path):
+            os.remove(path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(path)
+        self.sock.setblocking(False)
+        self.loop.add_reader(self.sock.fileno(), self._on_readable)
+
+        self.loop.create_task(self._flush_loop())
+        self.loop.create_task(self._keepalive_loop())
+
+    def _on_readable(self):
+        while True:
+            try:
+                message = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            try:
+                data = json.loads(message)
+            except ValueError:
+                continue
+            for kind, pks in data.items():
+                for pk in pks:
+                    if (kind, pk) in self.subscribers:
+                        self.dirty.add((kind, pk))
+        if self.dirty:
+            self.changed.set()
+
+    async def subscribe(self, keys):
+        """구독을 등록하고 (구독자, 현재 값) 반환"""
+        self.start()
+        missing = [key for key in keys if key not in self.counts]
+        if missing:
+            self.counts.update(await sync_to_async(_fetch_counts)(missing))
+        subscriber = Subscriber(keys)
+        for key in keys:
+            self.subscribers[key].add(subscriber)
+        return subscriber, {key: self.counts[key] for key in keys if key in self.counts}
+
+    def unsubscribe(self, subscriber):
+        for key in subscriber.keys:
+            subscribers = self.subscribers.get(key)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self.subscribers[key]
+                self.counts.pop(key, None)
+                self.dirty.discard(key)
+
+    async def _flush_loop(self):
+        while True:
+            await self.changed.wait()
+            # 디바운스: 잠시 더 모았다가 한 번에 셈
+            await asyncio.sleep(settings.LIVE_DEBOUNCE_SECONDS)
+            self.changed.clear()
+            keys = [key for key in self.dirty if key in self.subscribers]
+            self.dirty = set()
+            if not keys:
+                continue
+            try:
+                fresh = await sync_to_async(_fetch_counts)(keys)
+            except Exception:
+                continue
+
+            updates = defaultdict(dict)
+            for key, values in fresh.items():
+                previous = self.counts.get(key)
+                if key not in self.subscribers or values == previous:
+                    continue
+                self.counts[key] = values
+                change = {**values, 'delta': {
+                    name: value - (previous or {}).get(name, 0) for name, value in values.items()
+                }}
+                for subscriber in self.subscribers[key]:
+                    updates[subscriber][key] = change
+            for subscriber, changes in updates.items():
+                subscriber.push(_event('counts', _group(changes)))
+
+    async def _keepalive_loop(self):
+        while True:
+            await asyncio.sleep(settings.LIVE_KEEPALIVE_SECONDS)
+            for subscriber in {s for group in self.subscribers.values() for s in group}:
+                subscriber.push(KEEPALIVE)
+
+
+hub = LiveHub()
+
+
+def _parse_ids(value):
+    ids = []
+    for part in (value or '').split(','):
+        part = part.strip()
+        # isdigit()은 '²' 같은 문자도 받아서 int()가 실패하므로 ASCII 숫자만
+        if part.isascii() and part.isdecimal() and 0 < int(part) < 2 ** 63:
+            ids.append(int(part))
+    return ids
+
+
+class LiveCountsApp:
+    """settings.LIVE_PATH 요청은 SSE로 직접 처리하고, 나머지는 Django ASGI 앱으로 넘김"""
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+        if scope['type'] == 'http' and scope['path'] == settings.LIVE_PATH:
+            return await self.stream(scope, receive, send)
+        return await self.application(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def respond_error(self, send, status, message):
+        body = json.dumps({'error': message}, ensure_ascii=False).encode()
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def stream(self, scope, receive, send):
+        if scope['method'] != 'GET':
+            return await self.respond_error(send, 405, '허용되지 않은 메서드입니다.')
+
+        query = parse_qs(scope.get('query_string', b'').decode())
+        keys = [('post', pk) for pk in _parse_ids(query.get('posts', [''])[0])]
+        keys += [('music', pk) for pk in _parse_ids(query.get('music', [''])[0])]
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return await self.respond_error(send, 400, 'posts 또는 music 파라미터가 필요합니다.')
+        if len(keys) > settings.LIVE_MAX_IDS:
+            return await self.respond_error(send, 400, f'한 번에 최대 {settings.LIVE_MAX_IDS}개까지 구독할 수 있습니다.')
+
+        subscriber, snapshot = await hub.subscribe(keys)
+        try:
+            headers = [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ]
+            if getattr(settings, 'CORS_ALLOW_ALL_ORIGINS', False):
+                headers.append((b'access-control-allow-origin', b'*'))
+            await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': _event('snapshot', _group(snapshot)),
+                        'more_body': True})
+
+            disconnected = asyncio.ensure_future(self.wait_disconnect(receive))
+            try:
+                while True:
+                    next_chunk = asyncio.ensure_future(subscriber.queue.get())
+                    done, _ = await asyncio.wait(
+                        {next_chunk, disconnected}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if disconnected in done:
+                        next_chunk.cancel()
+                        break
+                    await send({'type': 'http.response.body', 'body': next_chunk.result(),
+                                'more_body': True})
+            finally:
+                disconnected.cancel()
+        finally:
+            hub.unsubscribe(subscriber)
+
+    async def wait_disconnect(self, receive):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
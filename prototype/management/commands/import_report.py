@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# 새 프로세스에서 서버 진입점을 import하고 예열 단계별 시간을 마지막 줄에 JSON으로 출력
+# (WARMUP_ON_STARTUP이 꺼져 있으면 진입점을 불러온 뒤 따로 예열해서 잼)
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import {module}
+loaded = time.perf_counter() - started
+from prototype import warmup
+timings = warmup.last_timings or warmup.warm_up()
+print(json.dumps({{'entry_seconds': loaded, 'warmup': timings}}))
+"""
+
+
+def parse_importtime(stderr):
+    """python -X importtime 출력 -> {모듈: (자체 us, 누적 us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue   # 머리글 줄
+        modules[parts[2].strip()] = (self_us, cumulative_us)
+    return modules
+
+
+class Command(BaseCommand):
+    help = (
+        "새 프로세스에서 서버 진입점(prototype.wsgi/asgi)을 python -X importtime으로 불러와 "
+        "오래 걸린 import와 예열(prototype/warmup.py) 단계별 시간을 보여줍니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entry', choices=['wsgi', 'asgi'], default='wsgi')
+        parser.add_argument('--top', type=int, default=25, help="보여줄 모듈 수")
+        parser.add_argument('--sort', choices=['cumulative', 'self'], default='cumulative')
+        parser.add_argument('--json', action='store_true', help="JSON으로 출력")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ)
+        env['DJANGO_SETTINGS_MODULE'] = settings.SETTINGS_MODULE
+        env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _PROBE.format(module=f'prototype.{options["entry"]}')],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            tail = '\n'.join(line for line in completed.stderr.splitlines()
+                             if not line.startswith('import time:'))[-2000:]
+            raise CommandError(f"진입점을 불러오지 못했습니다:\n{tail}")
+
+        probe = json.loads(completed.stdout.strip().splitlines()[-1])
+        modules = parse_importtime(completed.stderr)
+        index = 1 if options['sort'] == 'cumulative' else 0
+        top = sorted(modules.items(), key=lambda item: item[1][index], reverse=True)[:options['top']]
+
+        result = {
+            'entry': f'prototype.{options["entry"]}',
+            'entry_seconds': round(probe['entry_seconds'], 4),
+            'modules_imported': len(modules),
+            'warmup_ms': {name: round(seconds * 1000, 2) for name, seconds in probe['warmup']},
+            'top_imports': [
+                {'module': name, 'self_ms': round(self_us / 1000, 2), 'cumulative_ms': round(cumulative_us / 1000, 2)}
+                for name, (self_us, cumulative_us) in top
+            ],
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(result, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(
+            f"{result['entry']}: {result['entry_seconds'] * 1000:.1f}ms, 모듈 {result['modules_imported']}개"
+        )
+        self.stdout.write("\n예열 단계")
+        for name, ms in result['warmup_ms'].items():
+            self.stdout.write(f"  {name:<14} {ms:>9.2f}ms")
+        self.stdout.write(f"\n오래 걸린 import ({options['sort']})")
+        self.stdout.write(f"  {'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+        for item in result['top_imports']:
+            self.stdout.write(f"  {item['cumulative_ms']:>10.2f} {item['self_ms']:>10.2f}  {item['module']}")
@@ -0,0 +1,72 @@
+# prototype/paginators.py
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimate_row_count(model, using='default'):
+    """
+    테이블 전체 행 수의 추정치 (COUNT(*) 없이). 알 수 없으면 None.
+    PostgreSQL은 통계(reltuples), SQLite는 ANALYZE 통계나 MAX(rowid)를 사용
+    """
+    connection = connections[using]
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                           [model._meta.db_table])
+        elif connection.vendor == 'mysql':
+            cursor.execute('SELECT table_rows FROM information_schema.tables '
+                           'WHERE table_schema = DATABASE() AND table_name = %s', [model._meta.db_table])
+        elif connection.vendor == 'sqlite':
+            try:
+                cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s AND idx IS NULL',
+                               [model._meta.db_table])
+                row = cursor.fetchone()
+                if row:
+                    return int(row[0].split()[0])
+            except Exception:
+                pass  # ANALYZE를 한 번도 안 했으면 sqlite_stat1이 없음
+            # rowid 인덱스의 끝만 보므로 바로 끝남 (삭제된 행만큼 크게 나올 수 있음)
+            cursor.execute(f'SELECT MAX(rowid) FROM {table}')
+        else:
+            return None
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    큰 테이블에서는 전체 COUNT(*) 대신 추정치를 쓰는 Paginator.
+    추정치가 exact_threshold보다 작으면 정확한 count를 그대로 씀
+    """
+    exact_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        model = getattr(queryset, 'model', None)
+        if model is not None:
+            estimate = estimate_row_count(model, queryset.db)
+            if estimate is not None and estimate >= self.exact_threshold:
+                return estimate
+        return super().count
+
+
+class EstimatedCountAdminMixin:
+    """
+    필터/검색 없이 전체 목록을 볼 때만 추정 count를 쓰는 ModelAdmin 믹스인.
+    (필터가 걸리면 결과 수가 달라지므로 정확한 count 사용)
+    """
+    show_full_result_count = False
+    # 페이지/정렬 파라미터는 결과 수에 영향 없음
+    count_neutral_params = {'p', 'o', 'all', '_changelist_filters'}
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if set(request.GET) - self.count_neutral_params:
+            paginator_class = Paginator
+        else:
+            paginator_class = EstimatedCountPaginator
+        return paginator_class(queryset, per_page, orphans, allow_empty_first_page)
@@ -39,16 +39,25 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework_simplejwt',
+    'prototype',  # 공용 관리 커맨드 (import_report)
     'accounts',
     'corsheaders',
     'posts',
     'mypage',  # ⭐ 이 줄 추가!
+    'uploads',
+    'recommendations',
+    'tasks',
+    'sync',
+    'search',
+    'analytics',
+    'loadtest',
     'rest_framework_simplejwt.token_blacklist',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'prototype.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -146,3 +155,168 @@ MEDIA_URL = '/media/'
 
 # 미디어 파일이 저장될 실제 경로
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# 좋아요 유입 모드: 'sync'(요청마다 바로 DB 반영) / 'queued'(로컬 큐에 쌓고 flush_likes로 일괄 반영)
+LIKE_INGESTION_MODE = 'sync'
+
+# queued 모드에서 좋아요 의도를 쌓아두는 디렉터리
+LIKE_QUEUE_DIR = BASE_DIR / 'var' / 'like_queue'
+
+# 반영 전 본인의 is_liked를 맞춰주는 overlay 보관 시간(초)
+# 워커가 여러 개면 공유되는 캐시(FileBasedCache 등)를 LIKE_OVERLAY_CACHE로 지정
+LIKE_OVERLAY_CACHE = 'default'
+LIKE_OVERLAY_TIMEOUT = 600
+
+# queued 모드에서 좋아요를 받은 뒤 flush_likes 작업을 실행하기까지 기다리는 시간(초). 이 간격으로 모아서 반영
+LIKE_FLUSH_DELAY = 1
+
+# 분할 업로드: 받는 중인 조각을 모아두는 디렉터리 (MEDIA_ROOT 밖)
+UPLOAD_TEMP_DIR = BASE_DIR / 'var' / 'uploads'
+
+# 분할 업로드로 받을 수 있는 최대 파일 크기(바이트)
+UPLOAD_MAX_SIZE = 500 * 1024 * 1024
+
+# 이 시간(시간 단위) 동안 조각이 오지 않은 분할 업로드는 세션과 부분 파일을 지움 (gc_media, expire_uploads 작업)
+UPLOAD_EXPIRE_HOURS = 24
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # 직렬화 조각 캐시: 워커끼리 공유되도록 파일 기반
+    'fragments': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'var' / 'cache' / 'fragments',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+# 게시물/음악 직렬화 조각 캐시 (prototype/fragment_cache.py)
+# 저장/좋아요 변경은 버전으로 바로 반영되고, 작성자 정보 등 나머지는 TIMEOUT(초) 안에 반영됨
+FRAGMENT_CACHE_ALIAS = 'fragments'
+FRAGMENT_CACHE_TIMEOUT = 300
+# 워커마다 메모리에 들고 있는 조각 수
+FRAGMENT_CACHE_LOCAL_ENTRIES = 5000
+
+# 함께 좋아한 항목 추천 인덱스 (build_recommendations 커맨드로 생성)
+RECOMMENDATION_INDEX_DIR = BASE_DIR / 'var' / 'recommendations'
+# 항목별로 저장하는 이웃 수
+RECOMMENDATION_TOP_K = 20
+# /related/, /similar/ 의 ?limit= 최댓값
+RECOMMENDATION_MAX_LIMIT = 50
+
+# 오디오 특징 벡터(memmap)와 추출 상태 파일 (extract_audio_features 커맨드로 생성)
+AUDIO_INDEX_DIR = BASE_DIR / 'var' / 'audio_index'
+# 비슷한 음악 검색 방식 (같은 형태의 ANN 구현으로 교체 가능)
+AUDIO_SIMILARITY_BACKEND = 'recommendations.audio_index.BruteForceIndex'
+# 특징 추출에 실패한 음악의 재시도 간격(초, 실패할 때마다 두 배)과 최대 시도 횟수
+AUDIO_EXTRACT_RETRY_SECONDS = 600
+AUDIO_EXTRACT_MAX_ATTEMPTS = 5
+
+# DB 작업 큐 (run_workers 커맨드로 처리)
+# 워커가 작업을 임대하는 시간(초). 실행 중에는 1/3마다 연장되고, 워커가 죽으면 이 시간 뒤 다른 워커가 가져감
+TASK_LEASE_SECONDS = 300
+# 실패 시 재시도 대기 시간의 기준(초), 시도마다 두 배
+TASK_RETRY_BASE_SECONDS = 30
+# 완료된 작업을 남겨두는 기간(일)
+TASK_KEEP_DONE_DAYS = 7
+# run_workers가 주기적으로 넣는 작업: {작업 이름: 간격(초)}
+# (마지막으로 들어온 지 간격이 지났을 때만 넣음. 간격은 TASK_KEEP_DONE_DAYS보다 짧아야 함)
+TASK_SCHEDULE = {
+    # 놓친 예약 대비 (보통은 좋아요/삭제/음악 저장 때 바로 예약됨)
+    'posts.tasks.flush_likes': 5 * 60,
+    'posts.tasks.reap_deleted': 60 * 60,
+    'recommendations.tasks.extract_audio_features': 60 * 60,
+    'uploads.tasks.expire_uploads': 60 * 60,
+    'recommendations.tasks.build_recommendations': 60 * 60,
+    'search.tasks.build_search_index': 6 * 60 * 60,
+    'posts.tasks.reconcile_like_counts': 24 * 60 * 60,
+    'mypage.tasks.rebuild_genre_facets': 24 * 60 * 60,
+    'sync.tasks.prune_tombstones': 24 * 60 * 60,
+    'analytics.tasks.prune_hourly_engagement': 24 * 60 * 60,
+}
+
+# 좋아요/조회수 실시간 푸시 (ASGI에서만 동작, prototype/live.py)
+LIVE_PATH = '/api/live/'
+# ASGI 워커마다 알림을 받는 Unix 소켓을 두는 디렉터리
+LIVE_SOCKET_DIR = BASE_DIR / 'var' / 'live'
+# 변경을 모아서 보내는 간격(초)
+LIVE_DEBOUNCE_SECONDS = 1.0
+LIVE_KEEPALIVE_SECONDS = 20
+# 연결 하나가 구독할 수 있는 최대 항목 수 / 보내지 못하고 쌓아둘 최대 이벤트 수
+LIVE_MAX_IDS = 200
+LIVE_QUEUE_SIZE = 16
+
+# 모바일 델타 동기화 (/api/sync/)
+# 늦게 커밋되는 행을 놓치지 않도록 새 토큰을 앞당기는 시간(초)
+SYNC_OVERLAP_SECONDS = 5
+# 삭제 기록 보관 기간(일). 이보다 오래된 토큰은 reset
+SYNC_TOMBSTONE_DAYS = 30
+# 한 응답에 종류별로 보내는 최대 변경 수. 넘으면 reset
+SYNC_MAX_CHANGES = 500
+
+# 검색어 자동완성 (/api/search/suggest/, search/suggest.py)
+# 스냅샷(build_search_index 커맨드로 생성)과 변경 로그를 두는 디렉터리
+SEARCH_INDEX_DIR = BASE_DIR / 'var' / 'search'
+# 다른 워커의 변경(로그)과 새 스냅샷을 확인하는 간격(초)
+SEARCH_REFRESH_SECONDS = 1.0
+SEARCH_SUGGEST_LIMIT = 10
+SEARCH_SUGGEST_MAX_LIMIT = 20
+
+# 작성자 대시보드 반응 집계 (/api/users/me/analytics/, analytics/rollups.py)
+# 시간별 버킷을 남겨두는 기간(일). 일별 버킷은 계속 남음
+ANALYTICS_HOURLY_KEEP_DAYS = 14
+
+# 워커 예열 (prototype/warmup.py, wsgi.py/asgi.py에서 실행)
+WARMUP_ON_STARTUP = True
+# 첫 요청에서야 읽히는 모듈. numpy/scipy(추천)는 무거워서 빼둠
+WARMUP_IMPORTS = [
+    'PIL.Image',              # 이미지 업로드 검증
+    'PIL.JpegImagePlugin',
+    'PIL.PngImagePlugin',
+    'rest_framework.parsers',
+    'django.core.files.uploadhandler',
+    'prototype.streaming',
+]
+# 미들웨어부터 렌더러까지 한 번 지나가도록 예열 때 보내는 GET 요청
+WARMUP_URLS = [
+    '/api/music/?limit=1',
+    '/api/search/suggest/?q=a',
+]
+
+# 토큰 버킷 요청 제한 (prototype/throttling.py)
+THROTTLE_ENABLED = True
+# scope별, 키 종류(user: 로그인한 사용자, ip: 클라이언트 IP)별 속도. 'n/period' 또는 ('n/period', 버킷 크기)
+THROTTLE_BUCKET_RATES = {
+    'login': {'ip': ('30/min', 10)},
+    'register': {'ip': ('20/hour', 10)},
+    'like': {'user': ('120/min', 30), 'ip': '600/min'},   # 게시물/음악 좋아요가 함께 씀
+    'post_create': {'user': ('30/hour', 10)},
+    'view': {'ip': ('120/min', 30)},   # 게시물/음악 조회 기록이 함께 씀 (로그인 없이 부를 수 있음)
+}
+# 버킷 저장소. 워커가 여러 개면 'prototype.throttling.SharedBucketStore' (같은 머신의 워커끼리 공유)
+THROTTLE_BUCKET_STORE = 'prototype.throttling.LocalBucketStore'
+THROTTLE_SHARED_PATH = BASE_DIR / 'var' / 'throttle' / 'buckets'
+THROTTLE_SHARED_SLOTS = 65536
+
+# 비밀번호 해시 풀 (accounts/passwords.py)
+# 해시를 계산하는 스레드 수 (None이면 CPU 코어 수) / 그 밖에 기다릴 수 있는 요청 수. 넘으면 503
+PASSWORD_HASH_WORKERS = None
+PASSWORD_HASH_QUEUE = 64
+# login/, register/ 를 async 뷰로 처리 (ASGI로 띄울 때만 켤 것)
+ACCOUNTS_ASYNC_AUTH_VIEWS = False
+
+# id 목록 일괄 조회 (/api/posts/batch/, /api/music/batch/, /api/users/batch/, prototype/batch.py)
+# 한 요청에 받을 수 있는 최대 id 수
+BATCH_MAX_IDS = 100
+
+# 응답 압축과 익명 응답 캐시 (prototype/compression.py)
+# 이보다 작은 본문은 압축하지 않음 (바이트)
+COMPRESSION_MIN_BYTES = 512
+# 익명 GET 응답을 본문/압축본째 캐시할 경로와 시간(초). 이 시간만큼은 예전 목록이 보일 수 있음
+RESPONSE_CACHE_PATHS = {
+    '/api/posts/list-posts/': 5,
+    '/api/music/': 5,
+    '/api/search/suggest/': 10,
+}
+RESPONSE_CACHE_ALIAS = 'default'
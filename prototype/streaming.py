@@ -0,0 +1,149 @@
+# prototype/streaming.py
+from django.core.paginator import InvalidPage
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+    import json
+
+
+_encoder = JSONEncoder()
+
+
+def dumps(data):
+    """가능하면 orjson으로, 아니면 표준 json으로 bytes 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_encoder.default)
+    return json.dumps(
+        data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """JSON 배열을 한 번에 만들지 않고 조각(bytes) 단위로 내보내는 렌더러"""
+    # 이 크기만큼 모이면 한 번에 내보냄 (너무 잘게 쪼개면 write 호출만 늘어남)
+    buffer_size = 64 * 1024
+
+    def render_stream(self, items, envelope=None):
+        """
+        items: 직렬화된 dict를 하나씩 내주는 iterable
+        envelope: 페이지네이션 정보 (있으면 {"count":..., "results": [...]} 형태로 감쌈)
+        """
+        buffer = bytearray()
+        if envelope is not None:
+            # {"count":..,"next":..,"previous":..} 의 닫는 괄호를 떼고 results를 이어 붙임
+            buffer += dumps(envelope)[:-1]
+            buffer += b',"results":['
+        else:
+            buffer += b'['
+
+        first = True
+        for item in items:
+            if not first:
+                buffer += b','
+            buffer += dumps(item)
+            first = False
+            if len(buffer) >= self.buffer_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b']}' if envelope is not None else b']'
+        yield bytes(buffer)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """StreamingJSONRenderer로 본문을 흘려보내는 응답"""
+
+    def __init__(self, items, envelope=None, renderer=None, **kwargs):
+        renderer = renderer or StreamingJSONRenderer()
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(renderer.render_stream(items, envelope), **kwargs)
+
+
+class StreamingListMixin:
+    """
+    ListAPIView용 믹스인.
+    ?stream=1 이면 쿼리셋을 .iterator(chunk_size=...)로 순회하며 한 건씩 직렬화해서
+    응답을 스트리밍한다. (페이지 전체를 list로 만들지 않으므로 메모리 사용량이 일정함)
+    """
+    stream_query_param = 'stream'
+    stream_chunk_size = 100
+
+    def should_stream(self, request):
+        value = request.query_params.get(self.stream_query_param, '')
+        return value.lower() in ('1', 'true', 'yes')
+
+    def list(self, request, *args, **kwargs):
+        if not self.should_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset, envelope = self.paginate_queryset_lazily(queryset)
+        envelope = self.get_stream_envelope(envelope)
+
+        # 필드 구성은 한 번만 하고, 행마다 to_representation만 호출
+        serializer = self.get_serializer()
+        if hasattr(serializer, 'prefetch_fragments'):
+            items = self.iter_with_fragments(serializer, queryset)
+        else:
+            items = (
+                serializer.to_representation(obj)
+                for obj in queryset.iterator(chunk_size=self.stream_chunk_size)
+            )
+        return StreamingJSONResponse(items, envelope=envelope)
+
+    def get_stream_envelope(self, envelope):
+        """스트리밍 응답의 results 앞에 붙일 값 (페이지 정보 외에 더할 것이 있으면 뷰에서 재정의)"""
+        return envelope
+
+    def iter_with_fragments(self, serializer, queryset):
+        """chunk 단위로 직렬화 조각 캐시를 한 번에 조회/저장하며 직렬화"""
+        chunk = []
+        for obj in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= self.stream_chunk_size:
+                yield from self._serialize_chunk(serializer, chunk)
+                chunk = []
+        if chunk:
+            yield from self._serialize_chunk(serializer, chunk)
+
+    def _serialize_chunk(self, serializer, chunk):
+        serializer.prefetch_fragments(chunk)
+        try:
+            return [serializer.to_representation(obj) for obj in chunk]
+        finally:
+            serializer.flush_fragments()
+
+    def paginate_queryset_lazily(self, queryset):
+        """페이지 범위만 잘라낸 쿼리셋(평가 전)과 페이지 정보를 돌려줌"""
+        paginator = self.paginator
+        if not isinstance(paginator, PageNumberPagination):
+            return queryset, None
+
+        request = self.request
+        page_size = paginator.get_page_size(request)
+        if not page_size:
+            return queryset, None
+
+        paginator.request = request
+        django_paginator = paginator.django_paginator_class(queryset, page_size)
+        page_number = paginator.get_page_number(request, django_paginator)
+        try:
+            paginator.page = django_paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(paginator.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            ))
+
+        envelope = {
+            'count': django_paginator.count,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+        }
+        return paginator.page.object_list, envelope
@@ -0,0 +1,167 @@
+# prototype/throttling.py
+"""
+토큰 버킷 요청 제한 (DRF throttle).
+
+    class LoginView(APIView):
+        throttle_classes = [TokenBucketThrottle.scoped('login')]
+
+THROTTLE_BUCKET_RATES[scope] 에 키 종류별 속도를 적는다.
+    'user': 로그인한 사용자마다 (익명 요청은 건너뜀)
+    'ip':   클라이언트 IP마다 (DRF NUM_PROXIES 설정을 따름)
+속도는 'n/period' (버킷 크기 n) 또는 ('n/period', 버킷 크기). 버킷은 시간에 비례해 다시 차고,
+요청 하나가 토큰 하나를 쓴다. 비어 있으면 429와 함께 다음 토큰까지의 Retry-After를 보낸다.
+
+DB나 캐시를 거치지 않고 버킷 하나를 O(1)로 확인한다.
+    LocalBucketStore:  프로세스 메모리의 dict (워커마다 따로 셈)
+    SharedBucketStore: 같은 머신의 워커들이 함께 쓰는 mmap 파일 (슬롯 단위 파일 잠금)
+어느 쪽을 쓸지는 THROTTLE_BUCKET_STORE로 정한다.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework.throttling import BaseThrottle
+
+
+# 잠금 줄무늬 수 (같은 줄무늬의 키끼리만 서로 기다림)
+LOCK_STRIPES = 64
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'n/period' 또는 ('n/period', 버킷 크기) -> (버킷 크기, 초당 보충량)"""
+    burst = None
+    if isinstance(rate, (tuple, list)):
+        rate, burst = rate
+    num, period = rate.split('/')
+    per_second = int(num) / PERIODS[period.strip()[0]]
+    return (int(burst) if burst is not None else int(num)), per_second
+
+
+def _take(tokens, updated, capacity, per_second, now):
+    """버킷을 now까지 채우고 토큰 하나를 씀. 반환: (남은 토큰, 기다릴 초). 기다릴 초가 0이면 허용"""
+    tokens = min(capacity, tokens + (now - updated) * per_second)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / per_second
+
+
+class LocalBucketStore:
+    """프로세스 안의 버킷들. 키마다 [토큰, 마지막 갱신 시각]"""
+
+    # 이보다 많아지면 가득 찬(= 없는 것과 같은) 버킷을 정리
+    max_keys = 100_000
+
+    def __init__(self):
+        self.buckets = {}
+        self.locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def take(self, key, capacity, per_second):
+        now = time.monotonic()
+        with self.locks[hash(key) % LOCK_STRIPES]:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                if len(self.buckets) >= self.max_keys:
+                    self.prune(now)
+                bucket = self.buckets[key] = [float(capacity), now]
+            bucket[0], wait = _take(bucket[0], bucket[1], capacity, per_second, now)
+            bucket[1] = now
+        return wait
+
+    def prune(self, now):
+        # 한 시간 넘게 요청이 없던 버킷은 지움 (시간당 1개보다 느리게 차는 버킷은 이때 다시 가득 찬 것으로 봄)
+        for key, (_, updated) in list(self.buckets.items()):
+            if now - updated > 3600:
+                self.buckets.pop(key, None)
+
+
+class SharedBucketStore:
+    """
+    THROTTLE_SHARED_PATH 파일을 mmap해서 여러 워커 프로세스가 함께 쓰는 버킷들.
+    고정 크기 슬롯 배열(키 해시, 토큰, 갱신 시각)이라 파일이 커지지 않는다.
+    다른 키가 같은 슬롯에 오면 새 버킷으로 덮어쓰므로 충돌한 키는 잠깐 더 허용될 수 있다.
+    """
+
+    slot = struct.Struct('<Qdd')
+
+    def __init__(self, path=None, slots=None):
+        path = str(path or settings.THROTTLE_SHARED_PATH)
+        self.slots = slots or settings.THROTTLE_SHARED_SLOTS
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = self.slots * self.slot.size
+        if os.fstat(self.fd).st_size < size:
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+        # fcntl 잠금은 프로세스 단위라 같은 프로세스의 스레드끼리는 따로 막아야 함
+        self.locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def take(self, key, capacity, per_second):
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little') or 1
+        index = digest % self.slots
+        offset = index * self.slot.size
+        with self.locks[index % LOCK_STRIPES]:
+            fcntl.lockf(self.fd, fcntl.LOCK_EX, self.slot.size, offset)
+            try:
+                now = time.time()
+                tag, tokens, updated = self.slot.unpack_from(self.map, offset)
+                if tag != digest:
+                    tokens, updated = float(capacity), now
+                tokens, wait = _take(tokens, updated, capacity, per_second, now)
+                self.slot.pack_into(self.map, offset, digest, tokens, now)
+            finally:
+                fcntl.lockf(self.fd, fcntl.LOCK_UN, self.slot.size, offset)
+        return wait
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = import_string(settings.THROTTLE_BUCKET_STORE)()
+    return _store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """scope별 THROTTLE_BUCKET_RATES에 적힌 키 종류(user/ip)마다 버킷을 확인"""
+    scope = None
+
+    @classmethod
+    def scoped(cls, scope):
+        return type(f'{cls.__name__}[{scope}]', (cls,), {'scope': scope})
+
+    def get_keys(self, request, view):
+        """(키, 속도) 목록"""
+        scope = self.scope or getattr(view, 'throttle_scope', None)
+        rates = settings.THROTTLE_BUCKET_RATES.get(scope) or {}
+        keys = []
+        if 'user' in rates and request.user and request.user.is_authenticated:
+            keys.append((f'{scope}:user:{request.user.pk}', rates['user']))
+        if 'ip' in rates:
+            keys.append((f'{scope}:ip:{self.get_ident(request)}', rates['ip']))
+        return keys
+
+    def allow_request(self, request, view):
+        self.wait_seconds = 0.0
+        if not settings.THROTTLE_ENABLED:
+            return True
+        store = get_store()
+        for key, rate in self.get_keys(request, view):
+            capacity, per_second = parse_rate(rate)
+            self.wait_seconds = max(self.wait_seconds, store.take(key, capacity, per_second))
+        return self.wait_seconds == 0
+
+    def wait(self):
+        return self.wait_seconds
@@ -26,6 +26,9 @@ urlpatterns = [
     path('api/posts/', include('posts.urls')),        # posts 앱 분리
     path('api/music/', include('mypage.urls')), # 추가
     path('api/users/', include('accounts.urls')), # 추가22
+    path('api/uploads/', include('uploads.urls')),
+    path('api/sync/', include('sync.urls')),
+    path('api/search/', include('search.urls')),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,237 @@
+# prototype/warmup.py
+"""
+워커 예열.
+
+Django는 URL resolver, DRF 시리얼라이저 필드, simplejwt 서명 키, DB 연결, 미들웨어 체인 등을
+첫 요청이 올 때 만든다. 롤링 재시작 직후의 요청이 느리지 않도록 prototype.wsgi / prototype.asgi 가
+application을 만든 직후 warm_up()으로 이것들을 미리 만들어 둔다.
+(AppConfig.ready는 manage.py 커맨드마다 불리므로 거기서는 하지 않음)
+
+단계별 소요 시간은 'prototype.warmup' 로거로 남기고, import_report 커맨드로도 볼 수 있다.
+"""
+import asyncio
+import importlib
+import io
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+# 마지막 예열의 [(단계, 초), ...] (import_report 커맨드가 읽음)
+last_timings = []
+
+
+def _iter_patterns(patterns):
+    for pattern in patterns:
+        if hasattr(pattern, 'url_patterns'):
+            yield from _iter_patterns(pattern.url_patterns)
+        else:
+            yield pattern
+
+
+def warm_urls():
+    """URLconf와 모든 뷰 모듈을 읽고, reverse()용 테이블까지 만듦"""
+    from django.urls import get_resolver
+
+    resolver = get_resolver()
+    resolver.reverse_dict
+    return list(_iter_patterns(resolver.url_patterns))
+
+
+def warm_serializers(patterns):
+    """뷰의 시리얼라이저를 한 번씩 만들어 필드(모델 메타 정보, 중첩 시리얼라이저 포함)를 채움"""
+    from rest_framework.serializers import BaseSerializer
+
+    seen = set()
+    for pattern in patterns:
+        view_class = getattr(pattern.callback, 'cls', None) or getattr(pattern.callback, 'view_class', None)
+        serializer_class = getattr(view_class, 'serializer_class', None)
+        if not (isinstance(serializer_class, type) and issubclass(serializer_class, BaseSerializer)):
+            continue
+        if serializer_class in seen:
+            continue
+        seen.add(serializer_class)
+        serializer_class(context={}).fields
+
+
+def warm_drf():
+    """DRF 설정에 문자열로 적힌 클래스들(인증, 렌더러, 파서 등)을 미리 import"""
+    from rest_framework.settings import api_settings
+
+    for name in ('DEFAULT_AUTHENTICATION_CLASSES', 'DEFAULT_PERMISSION_CLASSES', 'DEFAULT_RENDERER_CLASSES',
+                 'DEFAULT_PARSER_CLASSES', 'DEFAULT_THROTTLE_CLASSES', 'DEFAULT_CONTENT_NEGOTIATION_CLASS',
+                 'DEFAULT_PAGINATION_CLASS', 'DEFAULT_FILTER_BACKENDS'):
+        getattr(api_settings, name)
+
+
+def warm_jwt():
+    """simplejwt 토큰 백엔드(서명 키, 알고리즘)를 준비하고 토큰을 한 번 만들고 검증"""
+    from rest_framework_simplejwt.state import token_backend
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    token_backend.decode(str(AccessToken()), verify=True)
+
+
+def warm_database():
+    """DB 연결을 미리 열어 둠"""
+    for alias in connections:
+        connection = connections[alias]
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+
+def warm_caches():
+    from django.core.cache import caches
+
+    for alias in settings.CACHES:
+        caches[alias].get('warmup')
+
+
+def warm_imports():
+    """첫 요청에서야 읽히는 모듈들 (settings.WARMUP_IMPORTS)"""
+    for name in getattr(settings, 'WARMUP_IMPORTS', []):
+        importlib.import_module(name)
+
+
+def warm_search():
+    from search.suggest import warm
+
+    warm()
+
+
+def _wsgi_get(handler, environ):
+    statuses = []
+    response = handler(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    for _ in response:
+        pass
+    response.close()
+    return statuses[0] if statuses else ''
+
+
+async def _asgi_get(handler, environ):
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'scheme': 'http',
+        'method': 'GET', 'path': environ['PATH_INFO'], 'raw_path': environ['PATH_INFO'].encode(),
+        'query_string': environ['QUERY_STRING'].encode(), 'root_path': '',
+        'headers': [(b'host', environ['HTTP_HOST'].encode())],
+        'server': (environ['SERVER_NAME'], int(environ['SERVER_PORT'])), 'client': ('127.0.0.1', 0),
+    }
+    body_sent = False
+    statuses = []
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await asyncio.Event().wait()   # 연결 끊김은 오지 않음 (응답이 끝나면 취소됨)
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            statuses.append(str(message['status']))
+
+    await handler(scope, receive, send)
+    return statuses[0] if statuses else ''
+
+
+def warm_requests(handler=None):
+    """
+    미들웨어부터 뷰, 렌더러까지 한 번 통과하도록 settings.WARMUP_URLS에 GET 요청을 보냄.
+    handler는 서버가 실제로 쓰는 WSGIHandler/ASGIHandler (없으면 새 WSGIHandler)
+    """
+    from django.core.handlers.asgi import ASGIHandler
+    from django.core.handlers.wsgi import WSGIHandler
+    from wsgiref.util import setup_testing_defaults
+
+    handler = handler or WSGIHandler()
+    host = next((host for host in settings.ALLOWED_HOSTS if host and '*' not in host and not host.startswith('.')),
+                'localhost')
+    for url in getattr(settings, 'WARMUP_URLS', []):
+        path, _, query = url.partition('?')
+        environ = {'PATH_INFO': path, 'QUERY_STRING': query, 'REQUEST_METHOD': 'GET',
+                   'HTTP_HOST': host, 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr}
+        setup_testing_defaults(environ)
+        if isinstance(handler, ASGIHandler):
+            status = asyncio.run(_asgi_get(handler, environ))
+        else:
+            status = _wsgi_get(handler, environ)
+        if not status.startswith('2'):
+            logger.warning("warm-up request %s returned %s", url, status)
+
+
+def _forget_connections_in_child():
+    # gunicorn --preload 처럼 예열 후 fork하면 자식이 부모의 DB 연결을 같이 쓰지 않도록 버림 (닫지는 않음)
+    for connection in connections.all(initialized_only=True):
+        connection.connection = None
+
+
+os.register_at_fork(after_in_child=_forget_connections_in_child)
+
+
+STEPS = [
+    ('urls', None),
+    ('serializers', None),
+    ('drf_settings', warm_drf),
+    ('jwt', warm_jwt),
+    ('imports', warm_imports),
+    ('database', warm_database),
+    ('caches', warm_caches),
+    ('search_index', warm_search),
+    ('requests', None),
+]
+
+
+def warm_up(handler=None):
+    """예열을 실행하고 [(단계, 초), ...] 를 반환. 실패한 단계는 기록만 하고 넘어감 (첫 요청 때 다시 만들어짐)"""
+    timings = []
+    patterns = []
+    for name, step in STEPS:
+        started = time.perf_counter()
+        try:
+            if name == 'urls':
+                patterns = warm_urls()
+            elif name == 'serializers':
+                warm_serializers(patterns)
+            elif name == 'requests':
+                warm_requests(handler)
+            else:
+                step()
+        except Exception:
+            logger.exception("warm-up step %s failed", name)
+        timings.append((name, time.perf_counter() - started))
+
+    last_timings[:] = timings
+    logger.info("warm-up done: %s", ', '.join(f'{name} {seconds * 1000:.1f}ms' for name, seconds in timings))
+    return timings
+
+
+def _warm_up_in_thread(handler):
+    try:
+        return warm_up(handler)
+    finally:
+        # DB 연결은 스레드마다 따로라 이 스레드에서 연 연결은 요청이 쓰지 않음. 남겨 두지 않고 닫음
+        connections.close_all()
+
+
+def warm_up_on_startup(handler=None):
+    """
+    서버 진입점(wsgi.py / asgi.py)에서 application을 넘겨 호출.
+    settings.WARMUP_ON_STARTUP이 꺼져 있으면 아무것도 안 함
+    """
+    if not getattr(settings, 'WARMUP_ON_STARTUP', True):
+        return []
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return warm_up(handler)
+    # ASGI 서버(uvicorn 등)는 이벤트 루프 안에서 앱을 불러오므로, DB를 쓰는 예열은 별도 스레드에서 끝날 때까지 기다림
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_warm_up_in_thread, handler).result()
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'prototype.settings')
 
 application = get_wsgi_application()
+
+# URL/시리얼라이저/JWT/DB 연결/검색 인덱스 등을 첫 요청 전에 미리 준비 (prototype/warmup.py)
+from prototype.warmup import warm_up_on_startup  # noqa: E402
+
+warm_up_on_startup(application)
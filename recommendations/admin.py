@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import AudioFeature
+
+
+@admin.register(AudioFeature)
+class AudioFeatureAdmin(admin.ModelAdmin):
+    list_display = ['music', 'row', 'source', 'attempts', 'retry_at', 'extracted_at']
+    search_fields = ['music__title', 'source']
+    readonly_fields = ['extracted_at']
+    list_select_related = ['music']
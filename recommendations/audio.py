@@ -0,0 +1,169 @@
+# recommendations/audio.py
+"""
+음악 파일의 스펙트럼 특징 벡터 추출.
+
+모노 AUDIO_SAMPLE_RATE로 디코딩한 뒤 프레임으로 나눠 FFT를 하고,
+멜 밴드 에너지와 그 DCT(MFCC 비슷한 값), 스펙트럼 중심/롤오프, 영교차율의
+평균·표준편차를 이어 붙여 FEATURE_DIM 길이 벡터로 만든다.
+여러 곡의 프레임을 한 번의 rfft로 처리한다.
+
+디코딩: WAV는 표준 라이브러리 wave로, 그 밖의 형식은 ffmpeg가 있을 때만 가능.
+"""
+import shutil
+import subprocess
+import wave
+
+import numpy as np
+
+
+SAMPLE_RATE = 22050
+FRAME_SIZE = 2048
+HOP_SIZE = 1024
+N_BANDS = 32
+N_COEFFS = 13
+# 앞부분 몇 초만 분석
+MAX_SECONDS = 90
+ROLLOFF = 0.85
+# 한 번의 rfft에 넣는 최대 프레임 수 (약 64MB)
+FFT_BATCH_FRAMES = 8192
+
+# 밴드 평균/표준편차 + 계수 평균/표준편차 + (중심, 롤오프, 영교차율) 평균/표준편차
+FEATURE_DIM = 2 * N_BANDS + 2 * N_COEFFS + 2 * 3
+
+
+class DecodeError(Exception):
+    """오디오를 읽을 수 없음"""
+
+
+def _decode_wav(path):
+    try:
+        with wave.open(path, 'rb') as f:
+            channels, width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+            raw = f.readframes(min(f.getnframes(), rate * MAX_SECONDS))
+    except (wave.Error, EOFError) as exc:
+        raise DecodeError(str(exc))
+
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648
+    else:
+        raise DecodeError(f'지원하지 않는 샘플 크기: {width}')
+
+    samples = samples[:len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE and len(samples):
+        # 선형 보간으로 리샘플 (특징 요약용이라 이 정도면 충분)
+        positions = np.arange(0, len(samples) - 1, rate / SAMPLE_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+    return samples
+
+
+def _decode_ffmpeg(path):
+    ffmpeg = shutil.which('ffmpeg')
+    if not ffmpeg:
+        raise DecodeError('ffmpeg가 없어 WAV 이외의 형식은 읽을 수 없습니다.')
+    result = subprocess.run(
+        [ffmpeg, '-v', 'error', '-i', path, '-t', str(MAX_SECONDS),
+         '-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE), '-'],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        raise DecodeError(result.stderr.decode('utf-8', 'replace').strip()[:500])
+    return np.frombuffer(result.stdout, dtype='<i2').astype(np.float32) / 32768
+
+
+def decode(path):
+    """파일 -> 모노 float32 샘플 (SAMPLE_RATE, 최대 MAX_SECONDS초)"""
+    with open(path, 'rb') as f:
+        header = f.read(12)
+    if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+        samples = _decode_wav(path)
+    else:
+        samples = _decode_ffmpeg(path)
+    if not len(samples):
+        raise DecodeError('오디오가 비어 있습니다.')
+    return samples
+
+
+def _mel_filterbank():
+    """(N_BANDS, FRAME_SIZE // 2 + 1) 삼각 필터"""
+    def to_mel(hz):
+        return 2595 * np.log10(1 + hz / 700)
+
+    def to_hz(mel):
+        return 700 * (10 ** (mel / 2595) - 1)
+
+    edges = to_hz(np.linspace(0, to_mel(SAMPLE_RATE / 2), N_BANDS + 2))
+    bins = np.fft.rfftfreq(FRAME_SIZE, 1 / SAMPLE_RATE)
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0, np.minimum(rising, falling)).astype(np.float32)
+
+
+def _dct_matrix():
+    """(N_COEFFS, N_BANDS) DCT-II"""
+    k = np.arange(N_COEFFS)[:, None]
+    n = np.arange(N_BANDS)[None, :]
+    return np.cos(np.pi * k * (2 * n + 1) / (2 * N_BANDS)).astype(np.float32)
+
+
+MEL_FILTERS = _mel_filterbank()
+DCT = _dct_matrix()
+WINDOW = np.hanning(FRAME_SIZE).astype(np.float32)
+FREQUENCIES = np.fft.rfftfreq(FRAME_SIZE, 1 / SAMPLE_RATE).astype(np.float32)
+
+
+def _frames(samples):
+    if len(samples) < FRAME_SIZE:
+        samples = np.pad(samples, (0, FRAME_SIZE - len(samples)))
+    return np.lib.stride_tricks.sliding_window_view(samples, FRAME_SIZE)[::HOP_SIZE]
+
+
+def _summary(values):
+    return np.concatenate([values.mean(axis=0), values.std(axis=0)])
+
+
+def _extract_group(frames):
+    """프레임 묶음 목록 -> 곡별 특징. 모든 곡의 프레임을 한 번에 FFT"""
+    stacked = np.concatenate(frames)
+    power = np.abs(np.fft.rfft(stacked * WINDOW, axis=1)) ** 2
+    bands = np.log(power @ MEL_FILTERS.T + 1e-10)
+    coeffs = bands @ DCT.T
+
+    total = power.sum(axis=1) + 1e-10
+    centroid = (power @ FREQUENCIES) / total
+    cumulative = np.cumsum(power, axis=1)
+    rolloff = FREQUENCIES[np.argmax(cumulative >= ROLLOFF * cumulative[:, -1:], axis=1)]
+    zcr = np.count_nonzero(np.diff(np.signbit(stacked), axis=1), axis=1) / FRAME_SIZE
+    # Hz 단위 값은 다른 값들과 크기를 맞춤
+    scalars = np.stack([centroid / SAMPLE_RATE, rolloff / SAMPLE_RATE, zcr], axis=1)
+
+    features = []
+    start = 0
+    for count in map(len, frames):
+        part = slice(start, start + count)
+        features.append(np.concatenate([
+            _summary(bands[part]), _summary(coeffs[part]), _summary(scalars[part]),
+        ]))
+        start += count
+    return features
+
+
+def extract_features(tracks):
+    """샘플 배열 목록 -> (len(tracks), FEATURE_DIM) 특징 행렬"""
+    features = []
+    group, group_frames = [], 0
+    for samples in tracks:
+        frames = _frames(samples)
+        # 한 번에 FFT할 프레임 수를 제한해 메모리 사용량을 묶어 둠
+        if group and group_frames + len(frames) > FFT_BATCH_FRAMES:
+            features.extend(_extract_group(group))
+            group, group_frames = [], 0
+        group.append(frames)
+        group_frames += len(frames)
+    if group:
+        features.extend(_extract_group(group))
+    return np.array(features, dtype=np.float32).reshape(-1, FEATURE_DIM)
@@ -0,0 +1,250 @@
+# recommendations/audio_index.py
+"""
+음악 특징 벡터 저장소와 최근접 이웃 검색.
+
+AUDIO_INDEX_DIR/features.npy: (용량, FEATURE_DIM) float32 행렬, memmap으로 읽고 씀
+AUDIO_INDEX_DIR/ids.npy: 행별 음악 pk (빈 행은 -1)
+AUDIO_INDEX_DIR/meta.json: 사용 중인 행 수. 배치를 쓸 때마다 교체되며, 읽는 쪽은 이게 바뀌면 다시 읽음
+
+음악이 몇 번째 행인지, 어떤 파일로 추출했는지는 AudioFeature에 기록한다.
+검색 방식은 AUDIO_SIMILARITY_BACKEND로 바꿀 수 있다 (기본: 전수 비교).
+"""
+import fcntl
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Max, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from mypage.models import Music
+from .audio import FEATURE_DIM, DecodeError, decode, extract_features
+from .models import AudioFeature
+
+
+MIN_CAPACITY = 1024
+
+_loaded = None
+_loaded_lock = threading.Lock()
+
+
+def _path(name):
+    os.makedirs(settings.AUDIO_INDEX_DIR, exist_ok=True)
+    return os.path.join(settings.AUDIO_INDEX_DIR, name)
+
+
+def _read_meta():
+    try:
+        with open(_path('meta.json')) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'rows': 0}
+
+
+def _open_arrays(capacity):
+    """capacity 행 이상을 담을 수 있는 (features, ids) memmap. 모자라면 두 배씩 늘려 새로 만듦"""
+    features_path, ids_path = _path('features.npy'), _path('ids.npy')
+    if os.path.exists(features_path):
+        features = np.load(features_path, mmap_mode='r+')
+        ids = np.load(ids_path, mmap_mode='r+')
+        if len(features) >= capacity:
+            return features, ids
+    else:
+        features = ids = None
+
+    size = max(MIN_CAPACITY, len(features) if features is not None else 0)
+    while size < capacity:
+        size *= 2
+    new_features = np.lib.format.open_memmap(f'{features_path}.tmp', mode='w+', dtype=np.float32,
+                                             shape=(size, FEATURE_DIM))
+    new_ids = np.lib.format.open_memmap(f'{ids_path}.tmp', mode='w+', dtype=np.int64, shape=(size,))
+    new_ids[:] = -1
+    if features is not None:
+        new_features[:len(features)] = features
+        new_ids[:len(ids)] = ids
+    new_features.flush()
+    new_ids.flush()
+    # 읽는 쪽이 열어 둔 예전 파일은 그대로 유효함
+    os.replace(f'{ids_path}.tmp', ids_path)
+    os.replace(f'{features_path}.tmp', features_path)
+    return new_features, new_ids
+
+
+def write_rows(rows, ids, vectors):
+    """rows 위치에 (음악 pk, 벡터)를 기록하고 meta.json을 갱신"""
+    if not len(rows):
+        return
+    meta = _read_meta()
+    features, id_array = _open_arrays(max(rows) + 1)
+    features[rows] = vectors
+    id_array[rows] = ids
+    features.flush()
+    id_array.flush()
+
+    meta = {'rows': max(meta['rows'], max(rows) + 1), 'updated_at': time.time()}
+    with open(_path('meta.json.tmp'), 'w') as f:
+        json.dump(meta, f)
+    os.replace(_path('meta.json.tmp'), _path('meta.json'))
+
+
+class BruteForceIndex:
+    """
+    특징마다 표준화한 뒤 단위 길이로 맞추고, 행렬-벡터 곱 한 번으로 코사인 유사도를 구함.
+    다른 검색 방식(ANN 등)도 같은 생성자/ query 형태로 만들면 AUDIO_SIMILARITY_BACKEND로 교체 가능
+    """
+
+    def __init__(self, ids, vectors):
+        valid = ids >= 0
+        self.ids = np.asarray(ids[valid])
+        vectors = np.asarray(vectors[valid], dtype=np.float32)
+        if len(vectors):
+            vectors = (vectors - vectors.mean(axis=0)) / (vectors.std(axis=0) + 1e-6)
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+        self.vectors = vectors
+        self.row_of = np.full(int(self.ids.max()) + 1 if len(self.ids) else 0, -1, dtype=np.int64)
+        self.row_of[self.ids] = np.arange(len(self.ids))
+
+    def query(self, pk, k):
+        """[(음악 pk, 점수), ...] 점수 내림차순. 인덱스에 없으면 빈 목록"""
+        if not 0 <= pk < len(self.row_of) or self.row_of[pk] < 0:
+            return []
+        row = self.row_of[pk]
+        sims = self.vectors @ self.vectors[row]
+        sims[row] = -np.inf
+        k = min(k, len(sims) - 1)
+        if k <= 0:
+            return []
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.lexsort((self.ids[top], -sims[top]))]
+        return [(int(self.ids[i]), float(sims[i])) for i in top]
+
+
+def load_index():
+    """현재 검색 인덱스 (아직 없으면 None). meta.json이 바뀌었을 때만 다시 만듦"""
+    global _loaded
+    try:
+        mtime = os.stat(_path('meta.json')).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _loaded and _loaded[0] == mtime:
+        return _loaded[1]
+
+    with _loaded_lock:
+        rows = _read_meta()['rows']
+        features = np.load(_path('features.npy'), mmap_mode='r')
+        ids = np.load(_path('ids.npy'), mmap_mode='r')
+        backend = import_string(settings.AUDIO_SIMILARITY_BACKEND)
+        index = backend(ids[:rows], features[:rows])
+        _loaded = (mtime, index)
+    return index
+
+
+def pending_music():
+    """아직 추출하지 않았거나, 추출 뒤 오디오 파일이 바뀌었거나, 실패 후 재시도 시각이 된 음악"""
+    return (
+        Music.objects.exclude(audio_file='')
+        .filter(
+            Q(audio_feature__isnull=True)
+            | ~Q(audio_feature__source=F('audio_file'))
+            | Q(audio_feature__retry_at__lte=timezone.now())
+        )
+        .order_by('pk')
+    )
+
+
+def next_retry():
+    """가장 이른 재시도 시각 (없으면 None)"""
+    return (
+        AudioFeature.objects.filter(retry_at__isnull=False, music__deleted_at__isnull=True)
+        .order_by('retry_at').values_list('retry_at', flat=True).first()
+    )
+
+
+def _failure(music, exc, previous, now):
+    """실패 기록. 같은 파일로 다시 실패하면 간격을 두 배로 늘리고, 횟수를 다 쓰면 더 시도하지 않음"""
+    prev_source, prev_attempts = previous.get(music.pk, ('', 0))
+    attempts = (prev_attempts if prev_source == music.audio_file.name else 0) + 1
+    retry_at = None
+    if attempts < settings.AUDIO_EXTRACT_MAX_ATTEMPTS:
+        retry_at = now + timedelta(seconds=settings.AUDIO_EXTRACT_RETRY_SECONDS * 2 ** (attempts - 1))
+    return AudioFeature(music=music, row=None, source=music.audio_file.name, error=str(exc),
+                        attempts=attempts, retry_at=retry_at)
+
+
+def _decode_music(music):
+    try:
+        try:
+            return decode(music.audio_file.path)
+        except NotImplementedError:
+            # 로컬 경로가 없는 storage는 임시 파일로 받아서 읽음
+            with music.audio_file.open('rb') as src, tempfile.NamedTemporaryFile() as tmp:
+                shutil.copyfileobj(src, tmp)
+                tmp.flush()
+                return decode(tmp.name)
+    except (DecodeError, OSError) as exc:
+        return exc
+
+
+def extract_batch(music_list, workers=4):
+    """음악 목록의 특징을 추출해 저장. 반환: (성공 수, 실패 수)"""
+    # 디코딩(파일 I/O, ffmpeg)은 스레드로, FFT는 모아서 한 번에
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        decoded = list(executor.map(_decode_music, music_list))
+
+    ok = [(music, samples) for music, samples in zip(music_list, decoded) if not isinstance(samples, Exception)]
+    failed = [(music, exc) for music, exc in zip(music_list, decoded) if isinstance(exc, Exception)]
+    vectors = extract_features([samples for _, samples in ok])
+
+    rows, previous = {}, {}
+    for music_id, row, source, attempts in AudioFeature.objects.filter(music__in=music_list).values_list(
+            'music_id', 'row', 'source', 'attempts'):
+        if row is not None:
+            rows[music_id] = row
+        previous[music_id] = (source, attempts)
+    next_row = (AudioFeature.objects.aggregate(last=Max('row'))['last'] or -1) + 1
+    for music, _ in ok:
+        if music.pk not in rows:
+            rows[music.pk] = next_row
+            next_row += 1
+
+    # 실패한 음악의 예전 행은 비워서 더 이상 검색되지 않게 함
+    cleared = [rows[music.pk] for music, _ in failed if music.pk in rows]
+    write_rows(
+        [rows[music.pk] for music, _ in ok] + cleared,
+        [music.pk for music, _ in ok] + [-1] * len(cleared),
+        np.concatenate([vectors, np.zeros((len(cleared), FEATURE_DIM), dtype=np.float32)]),
+    )
+
+    now = timezone.now()
+    AudioFeature.objects.bulk_create(
+        [AudioFeature(music=music, row=rows[music.pk], source=music.audio_file.name) for music, _ in ok]
+        + [_failure(music, exc, previous, now) for music, exc in failed],
+        update_conflicts=True, unique_fields=['music'],
+        update_fields=['row', 'source', 'error', 'attempts', 'retry_at', 'extracted_at'],
+    )
+    return len(ok), len(failed)
+
+
+def extract_pending(batch_size=16, workers=4, limit=None):
+    """추출이 필요한 음악을 배치로 처리. 한 번에 하나의 프로세스만 실행됨. 반환: (성공 수, 실패 수)"""
+    done = failed = 0
+    with open(_path('lock'), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        while limit is None or done + failed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - done - failed)
+            batch = list(pending_music()[:size])
+            if not batch:
+                break
+            ok, bad = extract_batch(batch, workers)
+            done += ok
+            failed += bad
+    return done, failed
@@ -0,0 +1,229 @@
+# recommendations/colike.py
+"""
+"이 항목을 좋아한 사람들이 좋아한 다른 항목" 인덱스.
+
+좋아요 테이블을 사용자×항목 희소 행렬(0/1)로 읽어 항목 간 코사인 유사도를 구하고,
+항목마다 상위 K개 이웃만 배열로 저장한다.
+요청 시에는 pk -> 행 번호 배열(row_of)로 바로 찾으므로 좋아요 테이블을 읽지 않는다.
+
+저장: RECOMMENDATION_INDEX_DIR/<kind>-<빌드 시각>/*.npy (mmap으로 읽음)
+현재 인덱스는 <kind>.json 이 가리키고, 교체는 이 파일을 os.replace 하는 것으로 끝난다.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from itertools import chain
+
+import numpy as np
+from django.conf import settings
+from scipy import sparse
+
+from posts.likes import LIKE_TARGETS
+
+
+ARRAYS = ('item_ids', 'row_of', 'neighbors', 'scores', 'counts')
+
+# 유사도를 한 번에 계산하는 항목 수 (메모리 사용량 조절)
+BLOCK_SIZE = 1024
+
+_loaded = {}
+_loaded_lock = threading.Lock()
+
+
+def index_dir():
+    path = settings.RECOMMENDATION_INDEX_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _pointer_path(kind):
+    return os.path.join(index_dir(), f'{kind}.json')
+
+
+class CoLikeIndex:
+    """
+    item_ids: 인덱스에 있는 항목 pk (오름차순)
+    row_of: pk -> 행 번호 (없으면 -1)
+    neighbors / scores: 행마다 상위 K개 이웃 pk와 점수 (모자라면 -1 / 0)
+    counts: 항목별 좋아요 수 (증분 빌드 때 바뀐 항목을 찾는 데 씀)
+    """
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        for name in ARRAYS:
+            setattr(self, name, np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r'))
+
+    def neighbors_of(self, pk, limit=None):
+        """[(pk, 점수), ...] 점수 내림차순. 인덱스에 없으면 빈 목록"""
+        if not 0 <= pk < len(self.row_of):
+            return []
+        row = self.row_of[pk]
+        if row < 0:
+            return []
+        ids = self.neighbors[row][:limit]
+        scores = self.scores[row][:limit]
+        return [(int(i), float(s)) for i, s in zip(ids, scores) if i >= 0]
+
+
+def load_index(kind):
+    """현재 인덱스 (아직 없으면 None). 포인터 파일이 바뀌었을 때만 다시 읽음"""
+    pointer = _pointer_path(kind)
+    try:
+        mtime = os.stat(pointer).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _loaded.get(kind)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _loaded_lock:
+        with open(pointer) as f:
+            meta = json.load(f)
+        index = CoLikeIndex(os.path.join(index_dir(), meta['dir']), meta)
+        _loaded[kind] = (mtime, index)
+    return index
+
+
+def read_likes(kind):
+    """좋아요 (id, 사용자 id, 항목 id)를 (n, 3) 배열로. 삭제 표시된 항목은 제외"""
+    model, field = LIKE_TARGETS[kind]
+    rows = (
+        model.objects.filter(**{f'{field}__deleted_at__isnull': True})
+        .values_list('id', 'user_id', f'{field}_id')
+    )
+    flat = np.fromiter(chain.from_iterable(rows.iterator(chunk_size=10000)), dtype=np.int64)
+    return flat.reshape(-1, 3)
+
+
+def _top_neighbors(matrix, counts, items, cols, k):
+    """cols(열 번호)마다 코사인 유사도 상위 k개의 (이웃 pk, 점수)"""
+    neighbors = np.full((len(cols), k), -1, dtype=np.int64)
+    scores = np.zeros((len(cols), k), dtype=np.float32)
+    by_column = matrix.tocsc()
+
+    for start in range(0, len(cols), BLOCK_SIZE):
+        block = cols[start:start + BLOCK_SIZE]
+        # (블록 항목 × 전체 항목) 공통 좋아요 수
+        common = (by_column[:, block].T @ matrix).tocsr()
+        for offset, col in enumerate(block):
+            lo, hi = common.indptr[offset], common.indptr[offset + 1]
+            others = common.indices[lo:hi]
+            keep = others != col
+            others = others[keep]
+            if not len(others):
+                continue
+            # float64로 계산한 뒤 저장 정밀도(float32)로 맞춰야 같은 점수가 같게 비교됨
+            sims = (common.data[lo:hi][keep] / np.sqrt(counts[col] * counts[others])).astype(np.float32)
+            # 점수 내림차순, 같으면 pk 오름차순 (경계에서 동점이어도 결과가 매번 같도록 전체 정렬)
+            order = np.lexsort((items[others], -sims))[:k]
+            row = start + offset
+            neighbors[row, :len(order)] = items[others[order]]
+            scores[row, :len(order)] = sims[order]
+    return neighbors, scores
+
+
+def _changed_columns(old, items, counts, likes, matrix):
+    """
+    이전 인덱스와 비교해 이웃을 다시 계산해야 하는 열 번호.
+    바뀐 항목(새 좋아요, 좋아요 수 변화, 사라짐)과 같은 사용자가 좋아한 항목,
+    그리고 이전 이웃 목록에 바뀐 항목이 들어 있던 항목
+    """
+    new_items = np.unique(likes[likes[:, 0] > old.meta['last_like_id'], 2])
+
+    old_rows = np.full(len(items), -1, dtype=np.int64)
+    known = items < len(old.row_of)
+    old_rows[known] = old.row_of[items[known]]
+    old_counts = np.where(old_rows >= 0, np.asarray(old.counts)[old_rows], 0)
+    dirty = np.union1d(new_items, items[old_counts != counts])
+    dirty = np.union1d(dirty, np.setdiff1d(old.item_ids, items))
+    if not len(dirty):
+        return np.array([], dtype=np.int64)
+
+    dirty_cols = np.searchsorted(items, np.intersect1d(dirty, items))
+    users = np.unique(matrix.tocsc()[:, dirty_cols].indices)
+    cols = np.unique(matrix[users].indices)
+
+    stale = np.asarray(old.item_ids)[np.isin(old.neighbors, dirty).any(axis=1)]
+    stale = np.intersect1d(stale, items)
+    return np.union1d(cols, np.searchsorted(items, stale)).astype(np.int64)
+
+
+def _save(kind, arrays, meta):
+    name = f'{kind}-{time.time_ns()}'
+    path = os.path.join(index_dir(), name)
+    os.makedirs(path)
+    for key in ARRAYS:
+        np.save(os.path.join(path, f'{key}.npy'), arrays[key])
+
+    pointer = _pointer_path(kind)
+    tmp = f'{pointer}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({**meta, 'dir': name}, f)
+    os.replace(tmp, pointer)
+
+    # 방금 것과 직전 것만 남김 (직전 것은 아직 읽고 있는 워커가 있을 수 있음)
+    builds = sorted(
+        entry for entry in os.listdir(index_dir())
+        if entry.startswith(f'{kind}-') and os.path.isdir(os.path.join(index_dir(), entry))
+    )
+    for old in builds[:-2]:
+        shutil.rmtree(os.path.join(index_dir(), old), ignore_errors=True)
+
+
+def build_index(kind, k=None, full=False):
+    """
+    인덱스를 만들어 교체. 이전 인덱스가 있고 K가 같으면 바뀐 항목의 이웃만 다시 계산함.
+    반환: 메타 정보 (items, likes, recomputed 등)
+    """
+    k = k or settings.RECOMMENDATION_TOP_K
+    likes = read_likes(kind)
+
+    items, item_cols = np.unique(likes[:, 2], return_inverse=True)
+    users, user_rows = np.unique(likes[:, 1], return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(likes), dtype=np.float32), (user_rows, item_cols)),
+        shape=(len(users), len(items)),
+    )
+    counts = np.bincount(item_cols, minlength=len(items))
+
+    old = None if full else load_index(kind)
+    if old is not None and old.meta['k'] != k:
+        old = None
+
+    if old is None:
+        cols = np.arange(len(items))
+        neighbors, scores = _top_neighbors(matrix, counts, items, cols, k)
+    else:
+        cols = _changed_columns(old, items, counts, likes, matrix)
+        # 바뀌지 않은 항목은 이전 행을 그대로 복사
+        old_rows = old.row_of[items[items < len(old.row_of)]]
+        neighbors = np.full((len(items), k), -1, dtype=np.int64)
+        scores = np.zeros((len(items), k), dtype=np.float32)
+        present = np.flatnonzero(items < len(old.row_of))[old_rows >= 0]
+        neighbors[present] = old.neighbors[old_rows[old_rows >= 0]]
+        scores[present] = old.scores[old_rows[old_rows >= 0]]
+        if len(cols):
+            neighbors[cols], scores[cols] = _top_neighbors(matrix, counts, items, cols, k)
+
+    row_of = np.full(int(items[-1]) + 1 if len(items) else 0, -1, dtype=np.int32)
+    row_of[items] = np.arange(len(items), dtype=np.int32)
+
+    meta = {
+        'kind': kind,
+        'k': k,
+        'last_like_id': int(likes[:, 0].max()) if len(likes) else 0,
+        'built_at': time.time(),
+        'items': len(items),
+        'likes': len(likes),
+        'recomputed': len(cols),
+        'incremental': old is not None,
+    }
+    _save(kind, {
+        'item_ids': items, 'row_of': row_of, 'neighbors': neighbors,
+        'scores': scores, 'counts': counts.astype(np.int32),
+    }, meta)
+    return meta
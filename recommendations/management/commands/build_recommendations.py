@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts.likes import LIKE_TARGETS
+from recommendations.colike import build_index
+
+
+class Command(BaseCommand):
+    help = (
+        "좋아요로 '함께 좋아한 항목' 추천 인덱스를 만듭니다. "
+        "이전 인덱스가 있으면 바뀐 항목의 이웃만 다시 계산합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=sorted(LIKE_TARGETS), action='append',
+                            help="대상 종류 (생략하면 전부)")
+        parser.add_argument('--top-k', type=int, help="항목별 이웃 수 (기본: RECOMMENDATION_TOP_K)")
+        parser.add_argument('--full', action='store_true', help="이전 인덱스를 무시하고 전부 다시 계산")
+
+    def handle(self, *args, **options):
+        for kind in options['kind'] or sorted(LIKE_TARGETS):
+            started = time.monotonic()
+            meta = build_index(kind, k=options['top_k'], full=options['full'])
+            mode = '증분' if meta['incremental'] else '전체'
+            self.stdout.write(self.style.SUCCESS(
+                f"{kind}: {mode} 빌드 완료 - 항목 {meta['items']}개, 좋아요 {meta['likes']}건, "
+                f"다시 계산 {meta['recomputed']}개 ({time.monotonic() - started:.1f}초)"
+            ))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from recommendations.audio_index import extract_pending
+
+
+class Command(BaseCommand):
+    help = (
+        "아직 특징을 뽑지 않은(또는 파일이 바뀐) 음악의 오디오를 디코딩해 스펙트럼 특징 벡터를 저장합니다. "
+        "--loop로 계속 실행할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=16, help="한 번에 FFT할 곡 수")
+        parser.add_argument('--workers', type=int, default=4, help="디코딩 스레드 수")
+        parser.add_argument('--limit', type=int, help="이번 실행에서 처리할 최대 곡 수")
+        parser.add_argument('--loop', action='store_true', help="끝나지 않고 주기적으로 반복")
+        parser.add_argument('--interval', type=float, default=30.0, help="--loop 시 대기 시간(초)")
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            done, failed = extract_pending(options['batch_size'], options['workers'], options['limit'])
+            if done or failed or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(
+                    f"추출 {done}곡, 실패 {failed}곡 ({time.monotonic() - started:.1f}초)"
+                ))
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.23 on 2026-10-19 07:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('mypage', '0003_music_deleted_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AudioFeature',
+            fields=[
+                ('music', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='audio_feature', serialize=False, to='mypage.music', verbose_name='음악')),
+                ('row', models.IntegerField(blank=True, null=True, unique=True, verbose_name='행 번호')),
+                ('source', models.CharField(max_length=255, verbose_name='추출한 파일')),
+                ('error', models.TextField(blank=True, verbose_name='오류')),
+                ('extracted_at', models.DateTimeField(auto_now=True, verbose_name='추출일')),
+            ],
+            options={
+                'verbose_name': '오디오 특징',
+                'verbose_name_plural': '오디오 특징들',
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.23 on 2026-10-19 08:57
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def retry_failed(apps, schema_editor):
+    """이전에 실패해서 다시 시도되지 않던 음악은 한 번 더 시도"""
+    AudioFeature = apps.get_model('recommendations', 'AudioFeature')
+    AudioFeature.objects.exclude(error='').update(attempts=1, retry_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiofeature',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, verbose_name='연속 실패 횟수'),
+        ),
+        migrations.AddField(
+            model_name='audiofeature',
+            name='retry_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='재시도 시각'),
+        ),
+        migrations.RunPython(retry_failed, migrations.RunPython.noop),
+    ]
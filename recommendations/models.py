@@ -0,0 +1,36 @@
+from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from mypage.models import Music
+
+
+class AudioFeature(models.Model):
+    """음악별 특징 벡터 추출 상태 (벡터 자체는 AUDIO_INDEX_DIR의 memmap 행렬에 있음)"""
+    music = models.OneToOneField(Music, on_delete=models.CASCADE, primary_key=True,
+                                 related_name='audio_feature', verbose_name="음악")
+    row = models.IntegerField(blank=True, null=True, unique=True, verbose_name="행 번호")
+    source = models.CharField(max_length=255, verbose_name="추출한 파일")
+    error = models.TextField(blank=True, verbose_name="오류")
+    # 실패하면 같은 파일로 연속 실패한 횟수와 다시 시도할 시각 (횟수를 다 쓰면 파일이 바뀔 때까지 시도하지 않음)
+    attempts = models.PositiveIntegerField(default=0, verbose_name="연속 실패 횟수")
+    retry_at = models.DateTimeField(blank=True, null=True, db_index=True, verbose_name="재시도 시각")
+    extracted_at = models.DateTimeField(auto_now=True, verbose_name="추출일")
+
+    class Meta:
+        verbose_name = "오디오 특징"
+        verbose_name_plural = "오디오 특징들"
+
+    def __str__(self):
+        return f"{self.music_id} -> {self.row}"
+
+
+# Signal: 새 음악이거나 오디오 파일이 바뀌었을 때만 특징 추출 작업을 넣음 (이미 대기 중이면 그대로)
+@receiver(post_save, sender=Music)
+def enqueue_audio_features(sender, instance, created, **kwargs):
+    if instance.deleted_at or not instance.audio_file:
+        return
+    if not created and getattr(instance, '_previous_audio_file', None) == instance.audio_file.name:
+        return
+    from tasks.queue import enqueue
+    enqueue('recommendations.tasks.extract_audio_features', unique=True)
@@ -0,0 +1,26 @@
+from django.utils import timezone
+
+from tasks.queue import enqueue, task
+
+# numpy/scipy를 쓰는 모듈은 작업이 실행될 때 읽음 (autodiscover로 모든 프로세스가 이 파일을 읽으므로)
+
+
+@task(lane='low', exclusive=True)
+def build_recommendations(kind=None, full=False):
+    """함께 좋아한 항목 인덱스 갱신 (kind를 생략하면 게시물/음악 모두)"""
+    from .colike import build_index
+
+    for target in [kind] if kind else ['post', 'music']:
+        build_index(target, full=full)
+
+
+@task(lane='low', max_attempts=5, exclusive=True)
+def extract_audio_features(limit=None):
+    """특징을 아직 뽑지 않은 음악 처리. 실패해서 재시도를 기다리는 음악이 있으면 그 시각에 다시 예약"""
+    from .audio_index import extract_pending, next_retry
+
+    extract_pending(limit=limit)
+    retry_at = next_retry()
+    if retry_at:
+        enqueue(extract_audio_features, unique=True,
+                delay=max(0, (retry_at - timezone.now()).total_seconds()))
@@ -0,0 +1,165 @@
+import math
+import os
+import shutil
+import struct
+import tempfile
+import wave
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from mypage.models import Music
+from posts.models import Post, PostLike
+from tasks.models import Task
+from . import audio_index, colike
+from .models import AudioFeature
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'recommendations-tests'},
+    'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'recommendations-tests'},
+}
+
+
+class TempDirMixin:
+    """테스트마다 빈 MEDIA_ROOT / 인덱스 디렉터리로 시작"""
+
+    def setUp(self):
+        super().setUp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        settings_override = override_settings(
+            MEDIA_ROOT=self.root, AUDIO_INDEX_DIR=os.path.join(self.root, 'audio_index'),
+            RECOMMENDATION_INDEX_DIR=os.path.join(self.root, 'recommendations'),
+            CACHES=LOCMEM_CACHES, THROTTLE_ENABLED=False, LIKE_INGESTION_MODE='sync',
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        colike._loaded.clear()
+        self.author = User.objects.create_user('author', password='pw12345!')
+
+
+def write_tone(path, freq, seconds=1, rate=8000):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(b''.join(
+            struct.pack('<h', int(12000 * math.sin(2 * math.pi * freq * i / rate))) for i in range(rate * seconds)
+        ))
+
+
+class CoLikeTests(TempDirMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = [User.objects.create_user(f'fan{i}', password='pw12345!') for i in range(4)]
+        self.posts = [Post.objects.create(title=f'p{i}', content='c', author=self.author) for i in range(4)]
+        # p0: 세 명, p1: p0을 좋아한 두 명, p2: p0을 좋아한 한 명, p3: 따로
+        for user, post in [(0, 0), (0, 1), (1, 0), (1, 1), (2, 0), (2, 2), (3, 3)]:
+            self.like(user, post)
+
+    def like(self, user, post):
+        PostLike.objects.create(user=self.users[user], post=self.posts[post])
+
+    def neighbors(self):
+        index = colike.load_index('post')
+        return {post.pk: [(pk, round(score, 4)) for pk, score in index.neighbors_of(post.pk)] for post in self.posts}
+
+    def test_cosine_neighbours(self):
+        colike.build_index('post', k=5)
+        p0, p1, p2, p3 = (post.pk for post in self.posts)
+        self.assertEqual(self.neighbors()[p0], [(p1, round(2 / 6 ** 0.5, 4)), (p2, round(1 / 3 ** 0.5, 4))])
+        self.assertEqual(self.neighbors()[p3], [])
+        self.assertEqual(colike.load_index('post').neighbors_of(999999), [])
+
+    def test_incremental_build_matches_full_build(self):
+        colike.build_index('post', k=5)
+        self.like(3, 1)
+        PostLike.objects.filter(user=self.users[2], post=self.posts[2]).delete()
+        self.like(2, 3)
+
+        meta = colike.build_index('post', k=5)
+        self.assertTrue(meta['incremental'])
+        incremental = self.neighbors()
+        self.assertFalse(colike.build_index('post', k=5, full=True)['incremental'])
+        self.assertEqual(incremental, self.neighbors())
+
+    def test_related_endpoint_skips_deleted_items(self):
+        colike.build_index('post', k=5)
+        p0, p1, p2, _ = self.posts
+        p1.soft_delete()
+        client = APIClient()
+        response = client.get(f'/api/posts/{p0.pk}/related/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['postId'] for item in response.json()['results']], [p2.pk])
+        self.assertEqual(client.get(f'/api/posts/{p1.pk}/related/').status_code, 404)
+
+
+class AudioIndexTests(TempDirMixin, TestCase):
+    def music(self, name, freq=None):
+        if freq is not None:
+            write_tone(os.path.join(self.root, 'music', 'audio', name), freq)
+        else:
+            path = os.path.join(self.root, 'music', 'audio', name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b'not audio' * 10)
+        return Music.objects.create(title=name, author=self.author, audio_file=f'music/audio/{name}')
+
+    def test_similar_tones_are_neighbours(self):
+        low, low2, high = self.music('low.wav', 220), self.music('low2.wav', 230), self.music('high.wav', 3000)
+        self.assertEqual(audio_index.extract_pending(), (3, 0))
+        self.assertFalse(audio_index.pending_music().exists())
+
+        neighbours = audio_index.load_index().query(low.pk, 2)
+        self.assertEqual([pk for pk, _ in neighbours], [low2.pk, high.pk])
+        self.assertEqual(audio_index.load_index().query(999999, 2), [])
+
+    def test_only_audio_changes_schedule_extraction(self):
+        music = self.music('a.wav', 440)
+        scheduled = Task.objects.filter(name='recommendations.tasks.extract_audio_features')
+        self.assertEqual(scheduled.count(), 1)
+        scheduled.delete()
+
+        music.title = 'renamed'
+        music.save()
+        self.assertFalse(scheduled.exists())
+
+        write_tone(os.path.join(self.root, 'music', 'audio', 'b.wav'), 880)
+        music.audio_file = 'music/audio/b.wav'
+        music.save()
+        self.assertEqual(scheduled.count(), 1)
+
+    @override_settings(AUDIO_EXTRACT_RETRY_SECONDS=60, AUDIO_EXTRACT_MAX_ATTEMPTS=3)
+    def test_failures_are_retried_with_backoff(self):
+        music = self.music('broken.wav')
+        self.assertEqual(audio_index.extract_pending(), (0, 1))
+        feature = AudioFeature.objects.get()
+        self.assertEqual(feature.attempts, 1)
+        self.assertTrue(feature.error)
+        self.assertFalse(audio_index.pending_music().exists())
+        self.assertEqual(audio_index.next_retry(), feature.retry_at)
+
+        delays = []
+        for _ in range(2):
+            AudioFeature.objects.update(retry_at=timezone.now() - timedelta(seconds=1))
+            before = timezone.now()
+            self.assertEqual(audio_index.extract_pending(), (0, 1))
+            feature.refresh_from_db()
+            delays.append(feature.retry_at and round((feature.retry_at - before).total_seconds()))
+        # 두 번째 실패는 두 배 뒤, 세 번째(최대)에서는 더 시도하지 않음
+        self.assertEqual(delays, [120, None])
+        self.assertEqual(feature.attempts, 3)
+        self.assertIsNone(audio_index.next_retry())
+
+        # 파일을 고치면 처음부터 다시
+        write_tone(os.path.join(self.root, 'music', 'audio', 'fixed.wav'), 440)
+        music.audio_file = 'music/audio/fixed.wav'
+        music.save()
+        self.assertEqual(audio_index.extract_pending(), (1, 0))
+        feature.refresh_from_db()
+        self.assertEqual((feature.attempts, feature.retry_at, feature.error), (0, None, ''))
@@ -0,0 +1,87 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from mypage.models import Music
+from mypage.serializers import MusicSerializer
+from posts.models import Post
+from posts.serializers import PostSerializer
+
+
+class RelatedItemsView(APIView):
+    """
+    이 항목을 좋아한 사람들이 함께 좋아한 항목 (build_recommendations로 만든 인덱스 사용)
+    ?limit= 으로 개수 지정 (최대 RECOMMENDATION_MAX_LIMIT)
+    """
+    permission_classes = [AllowAny]
+    kind = None
+    model = None
+    serializer_class = None
+    lookup_url_kwarg = None
+    not_found_message = None
+    default_limit = 10
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = self.default_limit
+        return max(1, min(limit, settings.RECOMMENDATION_MAX_LIMIT))
+
+    def get_neighbors(self, pk):
+        """[(pk, 점수), ...] 점수 내림차순"""
+        # numpy/scipy는 무거워서 이 엔드포인트가 처음 불릴 때 읽음 (워커 시작 시간 단축)
+        from .colike import load_index
+
+        index = load_index(self.kind)
+        return index.neighbors_of(pk) if index else []
+
+    def get(self, request, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg]
+        if not self.model.objects.filter(pk=pk).exists():
+            return Response({'error': self.not_found_message}, status=status.HTTP_404_NOT_FOUND)
+
+        pairs = self.get_neighbors(pk)
+
+        # 인덱스를 만든 뒤 삭제된 항목은 건너뜀
+        objects = self.model.objects.select_related('author').in_bulk([other for other, _ in pairs])
+        pairs = [(other, score) for other, score in pairs if other in objects][:self.get_limit()]
+
+        serializer = self.serializer_class(
+            [objects[other] for other, _ in pairs], many=True, context={'request': request}
+        )
+        results = serializer.data
+        for item, (_, score) in zip(results, pairs):
+            item['score'] = round(score, 4)
+        return Response({'results': results})
+
+
+class RelatedPostsView(RelatedItemsView):
+    kind = 'post'
+    model = Post
+    serializer_class = PostSerializer
+    lookup_url_kwarg = 'post_id'
+    not_found_message = '게시글을 찾을 수 없습니다.'
+
+
+class RelatedMusicView(RelatedItemsView):
+    kind = 'music'
+    model = Music
+    serializer_class = MusicSerializer
+    lookup_url_kwarg = 'music_id'
+    not_found_message = '음악을 찾을 수 없습니다.'
+
+
+class SimilarMusicView(RelatedMusicView):
+    """
+    소리가 비슷한 음악 (extract_audio_features로 뽑은 스펙트럼 특징 기준)
+    좋아요가 없는 새 음악도 찾을 수 있음
+    """
+    def get_neighbors(self, pk):
+        from . import audio_index
+
+        index = audio_index.load_index()
+        # 삭제된 음악이 빠져도 limit만큼 남도록 여유 있게 가져옴
+        return index.query(pk, self.get_limit() * 2 + 10) if index else []
@@ -0,0 +1,19 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from search.suggest import build_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "검색어 자동완성 스냅샷을 DB 전체로 다시 만듭니다. "
+        "인기도(좋아요 수)는 이때 갱신되고, 이전 변경 로그는 정리됩니다."
+    )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        count = build_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            f"자동완성 스냅샷 완료 - 항목 {count}개 ({time.monotonic() - started:.1f}초)"
+        ))
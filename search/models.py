@@ -0,0 +1,47 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mypage.models import Music
+from posts.models import Post
+from . import suggest
+
+
+# 모델은 없고, 자동완성 인덱스(search/suggest.py)를 갱신하는 신호만 둠
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    if instance.deleted_at:
+        suggest.forget('post', instance.pk)
+    else:
+        suggest.record([suggest.post_entry(instance)])
+
+
+@receiver(post_save, sender=Music)
+def index_music(sender, instance, **kwargs):
+    if instance.deleted_at:
+        suggest.forget('music', instance.pk)
+    else:
+        suggest.record([suggest.music_entry(instance)])
+
+
+# 로그인 시각, 비밀번호 재해시처럼 update_fields로 다른 필드만 저장할 때는 건너뜀
+USER_INDEX_FIELDS = {'username', 'is_active'}
+
+
+@receiver(post_save, sender=User)
+def index_user(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not USER_INDEX_FIELDS & set(update_fields):
+        return
+    if instance.is_active:
+        suggest.record([suggest.user_entry(instance)])
+    else:
+        suggest.forget('user', instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=Music)
+@receiver(post_delete, sender=User)
+def unindex_deleted(sender, instance, **kwargs):
+    kind = {Post: 'post', Music: 'music', User: 'user'}[sender]
+    suggest.forget(kind, instance.pk)
@@ -0,0 +1,391 @@
+# search/suggest.py
+"""
+검색어 자동완성용 메모리 접두어 인덱스.
+
+게시물 제목, 음악 제목, 아티스트, 사용자 이름을 정규화(NFKC + casefold)한 키를 정렬된 배열에 두고
+bisect로 접두어 범위를 찾는다. 단어 중간부터도 찾을 수 있도록 단어마다 그 단어부터 끝까지를 키로 넣는다.
+범위 안에서 인기순(좋아요 수) 상위 N개를 고르고, 같은 접두어의 결과는 바뀌기 전까지 메모해 둔다.
+
+- 스냅샷: build_search_index가 DB에서 전체를 읽어 SEARCH_INDEX_DIR/snapshot.json 으로 저장
+  (인기도는 이때 실제 좋아요 행 수로 갱신되고, 저장 신호는 제목 등만 바꾸고 인기도는 그대로 둠)
+- 변경 로그: 저장/삭제 신호가 커밋된 뒤 journal-<세대>.log 에 한 줄씩 추가
+  각 프로세스는 조회할 때 파일 크기만 확인해서 새로 붙은 줄만 반영하므로 워커끼리 따로 알릴 필요가 없다.
+  스냅샷을 만들 때 새 세대의 로그로 바꾸고, 스냅샷 세대 이후의 로그만 다시 적용한다.
+"""
+import bisect
+import fcntl
+import heapq
+import json
+import os
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+from django.db import transaction
+
+from prototype.fragment_cache import LRUCache
+
+
+SNAPSHOT_FILE = 'snapshot.json'
+POINTER_FILE = 'journal'
+LOCK_FILE = 'journal.lock'
+
+# 키를 만드는 최대 단어 수 / 같은 접두어 결과를 메모해 두는 개수
+MAX_WORDS = 8
+MEMO_ENTRIES = 10000
+
+# 키의 끝 (이 문자로 끝나는 범위까지가 접두어 범위)
+_END = '\U0010ffff'
+
+
+def index_dir():
+    path = settings.SEARCH_INDEX_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def normalize(text):
+    return ' '.join(unicodedata.normalize('NFKC', text or '').casefold().split())
+
+
+def _keys_for(text):
+    words = normalize(text).split(' ')[:MAX_WORDS]
+    return {' '.join(words[i:]) for i in range(len(words)) if words[i]}
+
+
+class SuggestIndex:
+    """
+    keys / owners: 정렬된 키 배열과 같은 위치의 항목 (종류, id)
+    items: (종류, id) -> [표시 문자열, 인기도]
+    아티스트는 음악마다 따로 두지 않고 이름 하나로 모으며, 인기도는 그 아티스트 음악들의 합
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.owners = []
+        self.items = {}
+        self.artists = {}   # 아티스트 키 -> {음악 id: 인기도}
+        self.music_artist = {}   # 음악 id -> 아티스트 키
+        self.memo = LRUCache(MEMO_ENTRIES)
+        self.lock = threading.Lock()
+
+    # ---------- 변경 ----------
+
+    def _insert_keys(self, owner, text):
+        for key in _keys_for(text):
+            position = bisect.bisect_left(self.keys, key)
+            self.keys.insert(position, key)
+            self.owners.insert(position, owner)
+
+    def _remove_keys(self, owner, text):
+        for key in _keys_for(text):
+            position = bisect.bisect_left(self.keys, key)
+            while position < len(self.keys) and self.keys[position] == key:
+                if self.owners[position] == owner:
+                    del self.keys[position]
+                    del self.owners[position]
+                    break
+                position += 1
+
+    def _set_item(self, owner, text, score):
+        previous = self.items.get(owner)
+        if score is None:
+            score = previous[1] if previous else 0
+        if previous and previous[0] != text:
+            self._remove_keys(owner, previous[0])
+        if not previous or previous[0] != text:
+            self._insert_keys(owner, text)
+        self.items[owner] = [text, score]
+
+    def _remove_item(self, owner):
+        previous = self.items.pop(owner, None)
+        if previous:
+            self._remove_keys(owner, previous[0])
+
+    def _set_artist(self, music_id, artist, score):
+        name = normalize(artist)
+        previous = self.music_artist.pop(music_id, None)
+        if previous is not None:
+            members = self.artists[previous]
+            old_score = members.pop(music_id, 0)
+            if score is None:
+                score = old_score
+            if not members:
+                del self.artists[previous]
+                self._remove_item(('artist', previous))
+            else:
+                self.items[('artist', previous)][1] = sum(members.values())
+        if not name:
+            return
+        members = self.artists.setdefault(name, {})
+        members[music_id] = score or 0
+        self.music_artist[music_id] = name
+        owner = ('artist', name)
+        text = self.items[owner][0] if owner in self.items else ' '.join(artist.split())
+        self._set_item(owner, text, sum(members.values()))
+
+    def apply(self, entry):
+        """
+        변경 한 건 반영.
+        ['post'|'user', id, 문자열, 인기도] / ['music', id, 제목, 인기도, 아티스트]: 추가 또는 수정
+        (인기도가 None이면 기존 값 유지)
+        [종류, id, None]: 삭제
+        """
+        kind, pk, text = entry[0], entry[1], entry[2]
+        with self.lock:
+            if text is None:
+                self._remove_item((kind, pk))
+                if kind == 'music':
+                    self._set_artist(pk, '', 0)
+            else:
+                score = entry[3]
+                self._set_item((kind, pk), text, score)
+                if kind == 'music':
+                    self._set_artist(pk, entry[4] or '', score)
+            self.memo.clear()
+
+    def load(self, entries):
+        """빈 인덱스에 한꺼번에 넣음 (하나씩 insort하지 않고 마지막에 한 번 정렬)"""
+        pairs = []
+        for entry in entries:
+            kind, pk, text, score = entry[:4]
+            self.items[(kind, pk)] = [text, score]
+            pairs.extend((key, (kind, pk)) for key in _keys_for(text))
+            if kind == 'music' and normalize(entry[4]):
+                name = normalize(entry[4])
+                self.artists.setdefault(name, {})[pk] = score
+                self.music_artist[pk] = name
+                owner = ('artist', name)
+                if owner not in self.items:
+                    self.items[owner] = [' '.join(entry[4].split()), 0]
+                    pairs.extend((key, owner) for key in _keys_for(entry[4]))
+        for name, members in self.artists.items():
+            self.items[('artist', name)][1] = sum(members.values())
+        pairs.sort(key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.owners = [owner for _, owner in pairs]
+
+    # ---------- 조회 ----------
+
+    def suggest(self, query, limit):
+        """[(종류, id, 표시 문자열, 인기도), ...] 인기도 내림차순"""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        limit = min(limit, settings.SEARCH_SUGGEST_MAX_LIMIT)
+        found = self.memo.get(prefix)
+        if found is None:
+            with self.lock:
+                lo = bisect.bisect_left(self.keys, prefix)
+                hi = bisect.bisect_right(self.keys, prefix + _END, lo)
+                owners = set(self.owners[lo:hi])
+                found = heapq.nlargest(
+                    settings.SEARCH_SUGGEST_MAX_LIMIT, owners,
+                    key=lambda owner: (self.items[owner][1], owner[0], str(owner[1])),
+                )
+                found = [(kind, pk, *self.items[(kind, pk)]) for kind, pk in found]
+                self.memo.set(prefix, found)
+        return found[:limit]
+
+
+# ==================== 스냅샷 / 변경 로그 ====================
+
+def _journal_path(generation):
+    return os.path.join(index_dir(), f'journal-{generation}.log')
+
+
+def _journal_generations(since):
+    """since 세대 이후의 로그 세대들 (오래된 것부터)"""
+    generations = []
+    for name in os.listdir(index_dir()):
+        if name.startswith('journal-') and name.endswith('.log'):
+            generation = int(name[len('journal-'):-len('.log')])
+            if generation >= since:
+                generations.append(generation)
+    return sorted(generations)
+
+
+def _current_generation():
+    try:
+        with open(os.path.join(index_dir(), POINTER_FILE)) as f:
+            return int(f.read())
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _append(entries):
+    lines = ''.join(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n' for entry in entries)
+    directory = index_dir()
+    # 스냅샷을 만들며 세대를 바꾸는 동안에는 쓰지 않도록 공유 잠금
+    with open(os.path.join(directory, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_SH)
+        fd = os.open(_journal_path(_current_generation()), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, lines.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+
+def record(entries):
+    """변경을 로그에 남김. 트랜잭션 안이면 커밋된 뒤에 씀 (스냅샷이 아직 못 본 변경을 놓치지 않도록)"""
+    entries = list(entries)
+    if entries:
+        transaction.on_commit(lambda: _append(entries))
+
+
+def forget(kind, *pks):
+    """삭제(삭제 표시 포함)된 항목을 자동완성에서 뺌"""
+    record([kind, pk, None] for pk in pks)
+
+
+def post_entry(post, score=None):
+    return ['post', post.pk, post.title, score]
+
+
+def music_entry(music, score=None):
+    return ['music', music.pk, music.title, score, music.artist or '']
+
+
+def user_entry(user, score=None):
+    return ['user', user.pk, user.username, score]
+
+
+def _read_entries():
+    """DB 전체를 읽어 항목 목록으로 (인기도: 게시물/음악 좋아요 수, 사용자가 게시물/음악으로 받은 좋아요 합)"""
+    from django.contrib.auth.models import User
+    from django.db.models import Count
+    from mypage.models import Music, MusicLike
+    from posts.models import Post, PostLike
+
+    post_likes = dict(
+        PostLike.objects.filter(post__deleted_at__isnull=True).order_by()
+        .values('post_id').annotate(n=Count('id')).values_list('post_id', 'n')
+    )
+    music_likes = dict(
+        MusicLike.objects.filter(music__deleted_at__isnull=True).order_by()
+        .values('music_id').annotate(n=Count('id')).values_list('music_id', 'n')
+    )
+    received = {}
+    entries = []
+    for pk, title, author_id in Post.objects.order_by().values_list('pk', 'title', 'author_id').iterator():
+        score = post_likes.get(pk, 0)
+        received[author_id] = received.get(author_id, 0) + score
+        entries.append(['post', pk, title, score])
+    for pk, title, artist, author_id in Music.objects.order_by().values_list(
+            'pk', 'title', 'artist', 'author_id').iterator():
+        score = music_likes.get(pk, 0)
+        received[author_id] = received.get(author_id, 0) + score
+        entries.append(['music', pk, title, score, artist or ''])
+    for pk, username in User.objects.filter(is_active=True).order_by().values_list('pk', 'username').iterator():
+        entries.append(['user', pk, username, received.get(pk, 0)])
+    return entries
+
+
+def build_snapshot():
+    """새 세대로 로그를 바꾸고 DB 전체를 스냅샷으로 저장. 반환: 항목 수"""
+    directory = index_dir()
+    generation = time.time_ns()
+    with open(os.path.join(directory, LOCK_FILE), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        # 이후 커밋되는 변경은 새 로그로 가고, 이전 변경은 아래에서 읽는 DB에 이미 있음
+        tmp = os.path.join(directory, f'{POINTER_FILE}.tmp')
+        with open(tmp, 'w') as f:
+            f.write(str(generation))
+        os.replace(tmp, os.path.join(directory, POINTER_FILE))
+
+    entries = _read_entries()
+    tmp = os.path.join(directory, f'{SNAPSHOT_FILE}.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'generation': generation, 'entries': entries}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, os.path.join(directory, SNAPSHOT_FILE))
+
+    # 새 스냅샷에 반영된 이전 세대 로그 정리
+    for old in _journal_generations(0):
+        if old < generation:
+            try:
+                os.remove(_journal_path(old))
+            except FileNotFoundError:
+                pass
+    return len(entries)
+
+
+class _Loaded:
+    """프로세스에 올라온 인덱스와 어디까지 읽었는지"""
+
+    def __init__(self, index, generation, snapshot_mtime):
+        self.index = index
+        self.generation = generation
+        self.snapshot_mtime = snapshot_mtime
+        self.offsets = {}   # 로그 세대 -> 읽은 바이트 수
+
+    def catch_up(self):
+        """스냅샷 세대 이후 로그에 새로 붙은 줄만 반영"""
+        for generation in _journal_generations(self.generation):
+            path = _journal_path(generation)
+            offset = self.offsets.get(generation, 0)
+            try:
+                if os.stat(path).st_size <= offset:
+                    continue
+                with open(path, 'rb') as f:
+                    f.seek(offset)
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            # 쓰는 중인 마지막 줄은 다음에 읽음
+            complete = data.rfind(b'\n') + 1
+            for line in data[:complete].splitlines():
+                try:
+                    self.index.apply(json.loads(line))
+                except (ValueError, IndexError, KeyError, TypeError):
+                    continue
+            self.offsets[generation] = offset + complete
+
+
+_loaded = None
+_loaded_lock = threading.Lock()
+_checked_at = 0.0
+
+
+def _load():
+    path = os.path.join(index_dir(), SNAPSHOT_FILE)
+    index = SuggestIndex()
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+        generation = snapshot['generation']
+        index.load(snapshot['entries'])
+    except FileNotFoundError:
+        # 스냅샷이 아직 없으면 DB에서 바로 만들고, 이 프로세스에서만 씀 (로그는 처음부터 적용)
+        mtime, generation = None, 0
+        index.load(_read_entries())
+    return _Loaded(index, generation, mtime)
+
+
+def get_index():
+    """
+    현재 인덱스. SEARCH_REFRESH_SECONDS마다 스냅샷이 바뀌었는지와 로그에 새 변경이 있는지 확인
+    (그 사이의 조회는 파일을 전혀 보지 않음)
+    """
+    global _loaded, _checked_at
+    loaded = _loaded
+    if loaded is not None and time.monotonic() - _checked_at < settings.SEARCH_REFRESH_SECONDS:
+        return loaded.index
+
+    with _loaded_lock:
+        try:
+            mtime = os.stat(os.path.join(index_dir(), SNAPSHOT_FILE)).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if _loaded is None or (mtime is not None and mtime != _loaded.snapshot_mtime):
+            _loaded = _load()
+        _loaded.catch_up()
+        _checked_at = time.monotonic()
+        return _loaded.index
+
+
+def warm():
+    """서버 시작 시 스냅샷을 미리 읽어 둠 (스냅샷이 없으면 첫 조회 때 DB에서 만듦)"""
+    if os.path.exists(os.path.join(index_dir(), SNAPSHOT_FILE)):
+        get_index()
@@ -0,0 +1,8 @@
+from tasks.queue import task
+from .suggest import build_snapshot
+
+
+@task(lane='low', exclusive=True)
+def build_search_index():
+    """자동완성 스냅샷 다시 만들기 (인기도 갱신 + 변경 로그 정리)"""
+    build_snapshot()
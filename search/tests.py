@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from mypage.models import Music, MusicLike
+from posts.models import Post, PostLike
+from . import suggest
+
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'search-tests'},
+    'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'search-tests'},
+}
+
+
+class SuggestTests(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        settings_override = override_settings(
+            SEARCH_INDEX_DIR=directory, SEARCH_REFRESH_SECONDS=0, CACHES=LOCMEM_CACHES,
+            RESPONSE_CACHE_PATHS={}, THROTTLE_ENABLED=False,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        suggest._loaded = None
+        self.addCleanup(setattr, suggest, '_loaded', None)
+
+        self.author = User.objects.create_user('helen', password='pw12345!')
+        self.fans = [User.objects.create_user(f'fan{i}', password='pw12345!') for i in range(3)]
+        self.popular = Post.objects.create(title='Hello World', content='c', author=self.author)
+        self.quiet = Post.objects.create(title='Hello there', content='c', author=self.author)
+        self.song = Music.objects.create(title='Help me', author=self.author, artist='The Band')
+        for fan in self.fans[:2]:
+            PostLike.objects.create(user=fan, post=self.popular)
+        PostLike.objects.create(user=self.fans[0], post=self.quiet)
+        MusicLike.objects.create(user=self.fans[0], music=self.song)
+
+    def results(self, query):
+        response = APIClient().get('/api/search/suggest/', {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [(row['type'], row['id'], row['score']) for row in response.json()['results']]
+
+    def test_ranked_by_real_like_count(self):
+        # 카운터가 어긋나 있어도 실제 좋아요 행 수로 순위를 매김
+        Post.objects.filter(pk=self.quiet.pk).update(like_count=100)
+        suggest.build_snapshot()
+        self.assertEqual(self.results('hel'), [
+            ('user', self.author.pk, 4),
+            ('post', self.popular.pk, 2),
+            ('post', self.quiet.pk, 1),
+            ('music', self.song.pk, 1),
+        ])
+
+    def test_prefix_lookup(self):
+        suggest.build_snapshot()
+        # 단어 중간부터, 대소문자/전각 문자 구분 없이
+        self.assertEqual(self.results('wor'), [('post', self.popular.pk, 2)])
+        self.assertEqual(self.results('ＨＥＬＬＯ　Ｗ'), [('post', self.popular.pk, 2)])
+        self.assertEqual(self.results('band'), [('artist', 'the band', 1)])
+        self.assertEqual(self.results('the b'), [('artist', 'the band', 1)])
+        self.assertEqual(self.results('xyz'), [])
+        self.assertEqual(self.results(''), [])
+
+    def test_changes_are_applied_from_the_journal(self):
+        suggest.build_snapshot()
+        self.assertEqual(self.results('wor'), [('post', self.popular.pk, 2)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.popular.title = 'Goodbye World'
+            self.popular.save()
+            self.quiet.soft_delete()
+        # 저장 신호는 인기도를 바꾸지 않음
+        self.assertEqual(self.results('good'), [('post', self.popular.pk, 2)])
+        self.assertEqual(self.results('hello'), [])
+
+    def test_user_is_not_reindexed_for_unrelated_fields(self):
+        with mock.patch.object(suggest, 'record') as record:
+            self.author.save(update_fields=['last_login'])
+            self.author.save(update_fields=['password'])
+            self.assertFalse(record.called)
+            self.author.username = 'helena'
+            self.author.save(update_fields=['username'])
+            self.assertTrue(record.called)
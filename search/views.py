@@ -0,0 +1,33 @@
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.conf import settings
+
+from .suggest import get_index
+
+
+class SuggestView(APIView):
+    """
+    검색어 자동완성. GET /api/search/suggest/?q=<접두어>&limit=
+    게시물 제목, 음악 제목, 아티스트, 사용자 이름 중 접두어(단어 시작 포함)가 맞는 것을 인기순으로
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []  # 키 입력마다 오는 요청이라 토큰 검사 생략 (사용자별 결과 없음)
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', settings.SEARCH_SUGGEST_LIMIT))
+        except ValueError:
+            limit = settings.SEARCH_SUGGEST_LIMIT
+        return max(1, min(limit, settings.SEARCH_SUGGEST_MAX_LIMIT))
+
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        results = get_index().suggest(query, self.get_limit())
+        return Response({
+            'query': query,
+            'results': [
+                {'type': kind, 'id': pk, 'text': text, 'score': score}
+                for kind, pk, text, score in results
+            ],
+        })
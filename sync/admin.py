@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'object_id', 'user_id', 'deleted_at']
+    list_filter = ['kind']
+    search_fields = ['object_id', 'user_id']
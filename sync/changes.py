@@ -0,0 +1,120 @@
+# sync/changes.py
+"""
+델타 동기화: 토큰 이후에 생기거나 바뀌거나 지워진 내 게시물/음악/좋아요만 모은다.
+
+- 게시물/음악: 내가 쓴 것 + 내가 좋아요한 것 중 updated_at/deleted_at이 토큰 이후인 것,
+  그리고 토큰 이후에 새로 좋아요한 것 (favorites에 본문이 필요하므로)
+  좋아요 수/조회수만 바뀐 것은 오지 않음 (실시간 값은 /api/live/)
+- 좋아요: 토큰 이후에 누른 것과, 취소/삭제된 것(Tombstone)
+
+토큰은 마지막 동기화 시각(마이크로초)이다. 시각이 매겨진 뒤 늦게 커밋되는 행을 놓치지 않도록
+새 토큰은 SYNC_OVERLAP_SECONDS 만큼 앞당겨서 주며, 그 사이의 행은 다음 응답에 한 번 더 올 수 있다
+(클라이언트는 id 기준으로 덮어쓰면 됨).
+토큰이 삭제 기록 보관 기간(SYNC_TOMBSTONE_DAYS)보다 오래됐거나 바뀐 것이 SYNC_MAX_CHANGES를 넘으면
+reset으로 알려서 목록 API로 전체를 다시 받게 한다.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+from mypage.models import Music, MusicLike
+from mypage.serializers import MusicSerializer
+from posts.models import Post, PostLike
+from posts.serializers import PostDetailSerializer
+from .models import Tombstone
+
+
+class InvalidToken(Exception):
+    """해석할 수 없는 since 토큰"""
+
+
+class TooManyChanges(Exception):
+    """한 번에 보내기에는 바뀐 것이 너무 많음"""
+
+
+# 종류별 (모델, 좋아요 모델, 좋아요 FK 필드, 시리얼라이저, 응답 키)
+SYNC_TARGETS = [
+    (Post, PostLike, 'post', PostDetailSerializer, 'posts'),
+    (Music, MusicLike, 'music', MusicSerializer, 'music'),
+]
+
+
+def encode_token(moment):
+    micros = int(moment.timestamp() * 1_000_000)
+    return urlsafe_base64_encode(str(micros).encode())
+
+
+def decode_token(token):
+    try:
+        micros = int(urlsafe_base64_decode(token).decode())
+        return datetime.fromtimestamp(micros / 1_000_000, tz=dt_timezone.utc)
+    except (ValueError, OverflowError, OSError, UnicodeDecodeError):
+        raise InvalidToken(token)
+
+
+def next_token():
+    return encode_token(timezone.now() - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS))
+
+
+def is_expired(since):
+    """삭제 기록이 이미 정리됐을 수 있는 오래된 토큰"""
+    return since < timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+
+
+def _limited(queryset):
+    rows = list(queryset[:settings.SYNC_MAX_CHANGES + 1])
+    if len(rows) > settings.SYNC_MAX_CHANGES:
+        raise TooManyChanges()
+    return rows
+
+
+def _collect_kind(user, since, model, like_model, field, serializer_class, context):
+    likes = like_model.objects.filter(user=user)
+    new_likes = _limited(
+        likes.filter(created_at__gt=since, **{f'{field}__deleted_at__isnull': True})
+        .order_by('created_at').values_list(f'{field}_id', 'created_at')
+    )
+    new_like_ids = [target_id for target_id, _ in new_likes]
+
+    changed = Q(updated_at__gt=since) | Q(deleted_at__gt=since)
+    mine = Q(author=user) | Q(pk__in=likes.values(f'{field}_id'))
+    items = _limited(
+        model.all_objects.filter((mine & changed) | Q(pk__in=new_like_ids))
+        .select_related('author').order_by('pk')
+    )
+    live = [item for item in items if item.deleted_at is None]
+    deleted = {item.pk for item in items if item.deleted_at is not None}
+
+    tombstones = _limited(
+        Tombstone.objects.filter(
+            user_id=user.pk, deleted_at__gt=since,
+            kind__in=[field, f'{field}_like'],
+        ).values_list('kind', 'object_id')
+    )
+    deleted.update(object_id for kind, object_id in tombstones if kind == field)
+    # 취소 후 다시 누른 좋아요는 지금 있는 쪽만 보냄
+    unliked = {object_id for kind, object_id in tombstones if kind != field} - set(new_like_ids)
+
+    return {
+        'updated': serializer_class(live, many=True, context=context).data,
+        'deleted': sorted(deleted),
+    }, {
+        'created': [{field: target_id, 'created_at': created_at} for target_id, created_at in new_likes],
+        'deleted': sorted(unliked),
+    }
+
+
+def collect_changes(user, since, context):
+    """
+    since 이후의 변경. 응답 키별로 {'updated'/'created': [...], 'deleted': [id, ...]}
+    너무 많으면 TooManyChanges
+    """
+    changes = {}
+    for model, like_model, field, serializer_class, key in SYNC_TARGETS:
+        items, likes = _collect_kind(user, since, model, like_model, field, serializer_class, context)
+        changes[key] = items
+        changes[f'{field}_likes'] = likes
+    return changes
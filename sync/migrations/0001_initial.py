@@ -0,0 +1,30 @@
+# Generated by Django 4.2.23 on 2026-10-19 08:00
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('post', '게시물'), ('music', '음악'), ('post_like', '게시물 좋아요'), ('music_like', '음악 좋아요')], max_length=20, verbose_name='종류')),
+                ('object_id', models.BigIntegerField(verbose_name='대상 id')),
+                ('user_id', models.BigIntegerField(verbose_name='사용자 id')),
+                ('deleted_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='삭제일')),
+            ],
+            options={
+                'verbose_name': '삭제 기록',
+                'verbose_name_plural': '삭제 기록들',
+                'indexes': [models.Index(fields=['user_id', 'deleted_at'], name='tombstone_user_deleted_idx')],
+            },
+        ),
+    ]
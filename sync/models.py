@@ -0,0 +1,46 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    델타 동기화(/api/sync/)용 삭제 기록.
+    행이 실제로 지워진 경우(좋아요 취소, reaper의 삭제)만 남김.
+    삭제 표시(deleted_at)만 된 게시물/음악은 행의 deleted_at으로 알 수 있으므로 따로 남기지 않음
+    """
+    KIND_POST = 'post'
+    KIND_MUSIC = 'music'
+    KIND_POST_LIKE = 'post_like'
+    KIND_MUSIC_LIKE = 'music_like'
+    KIND_CHOICES = [
+        (KIND_POST, '게시물'),
+        (KIND_MUSIC, '음악'),
+        (KIND_POST_LIKE, '게시물 좋아요'),
+        (KIND_MUSIC_LIKE, '음악 좋아요'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="종류")
+    # 게시물/음악은 그 id, 좋아요는 대상 게시물/음악 id
+    object_id = models.BigIntegerField(verbose_name="대상 id")
+    # 이 삭제를 받아야 하는 사용자 (게시물/음악은 작성자, 좋아요는 누른 사람). 사용자가 지워져도 남도록 FK가 아님
+    user_id = models.BigIntegerField(verbose_name="사용자 id")
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True, verbose_name="삭제일")
+
+    class Meta:
+        verbose_name = "삭제 기록"
+        verbose_name_plural = "삭제 기록들"
+        indexes = [
+            models.Index(fields=['user_id', 'deleted_at'], name='tombstone_user_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} (user {self.user_id})"
+
+
+def record_tombstones(kind, pairs, deleted_at=None):
+    """[(user_id, object_id), ...] 의 삭제를 기록"""
+    deleted_at = deleted_at or timezone.now()
+    Tombstone.objects.bulk_create([
+        Tombstone(kind=kind, user_id=user_id, object_id=object_id, deleted_at=deleted_at)
+        for user_id, object_id in pairs
+    ])
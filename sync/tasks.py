@@ -0,0 +1,14 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from tasks.queue import task
+from .models import Tombstone
+
+
+@task(lane='low')
+def prune_tombstones():
+    """보관 기간(SYNC_TOMBSTONE_DAYS)이 지난 삭제 기록 정리 (그보다 오래된 토큰은 reset을 받음)"""
+    cutoff = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+    Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
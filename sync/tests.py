@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from mypage.models import Music
+from posts import likes
+from posts.models import Post
+from .changes import encode_token
+
+
+@override_settings(
+    SYNC_OVERLAP_SECONDS=0, LIKE_INGESTION_MODE='sync', THROTTLE_ENABLED=False,
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'sync-tests'},
+        'fragments': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'sync-tests'},
+    },
+)
+class SyncTokenTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.user = User.objects.create_user('phone', password='pw12345!')
+        self.other = User.objects.create_user('other', password='pw12345!')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def sync(self, since=None):
+        response = self.client.get('/api/sync/', {'since': since} if since else {})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_without_since_asks_for_reset(self):
+        body = self.sync()
+        self.assertTrue(body['reset'])
+        self.assertTrue(body['token'])
+
+    def test_changes_after_token(self):
+        old = Post.objects.create(title='old', content='c', author=self.user)
+        token = encode_token(timezone.now())
+        Post.objects.filter(pk=old.pk).update(updated_at=timezone.now() - timedelta(minutes=1))
+
+        mine = Post.objects.create(title='mine', content='c', author=self.user)
+        theirs = Post.objects.create(title='theirs', content='c', author=self.other)
+        music = Music.objects.create(title='song', author=self.other)
+        likes.add_like('post', self.user, theirs.pk)
+        likes.add_like('music', self.user, music.pk)
+        likes.remove_like('music', self.user, music.pk)
+
+        body = self.sync(token)
+        self.assertFalse(body['reset'])
+        self.assertEqual({item['id'] for item in body['posts']['updated']}, {mine.pk, theirs.pk})
+        self.assertEqual([like['post'] for like in body['post_likes']['created']], [theirs.pk])
+        self.assertEqual(body['music_likes'], {'created': [], 'deleted': [music.pk]})
+
+        # 다음 토큰 이후로는 아무것도 바뀌지 않음
+        Post.objects.filter(pk__in=[mine.pk, theirs.pk]).update(updated_at=timezone.now() - timedelta(minutes=1))
+        later = self.sync(body['token'])
+        self.assertEqual(later['posts'], {'updated': [], 'deleted': []})
+
+    def test_soft_deleted_post_is_reported_as_deleted(self):
+        post = Post.objects.create(title='gone', content='c', author=self.user)
+        token = encode_token(timezone.now())
+        post.soft_delete()
+        body = self.sync(token)
+        self.assertEqual(body['posts'], {'updated': [], 'deleted': [post.pk]})
+
+    def test_bad_token_is_rejected(self):
+        response = self.client.get('/api/sync/', {'since': 'not-a-token'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
+
+    @override_settings(SYNC_TOMBSTONE_DAYS=1)
+    def test_expired_token_asks_for_reset(self):
+        token = encode_token(timezone.now() - timedelta(days=2))
+        self.assertTrue(self.sync(token)['reset'])
+
+    @override_settings(SYNC_MAX_CHANGES=2)
+    def test_too_many_changes_asks_for_reset(self):
+        token = encode_token(timezone.now())
+        for i in range(3):
+            Post.objects.create(title=f'p{i}', content='c', author=self.user)
+        self.assertTrue(self.sync(token)['reset'])
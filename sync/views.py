@@ -0,0 +1,36 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .changes import InvalidToken, TooManyChanges, collect_changes, decode_token, is_expired, next_token
+
+
+class SyncView(APIView):
+    """
+    모바일 델타 동기화. GET /api/sync/?since=<token>
+
+    since 없이 부르면 토큰만 받음 (reset: true) -> 목록 API로 전체를 받고, 다음부터 그 토큰으로 호출.
+    삭제 기록은 바뀐 것보다 먼저 적용하면 됨
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        # 조회를 시작하기 전에 토큰을 정해야 조회 도중의 변경을 놓치지 않음
+        token = next_token()
+        since = request.query_params.get('since')
+        if not since:
+            return Response({'token': token, 'reset': True})
+
+        try:
+            since = decode_token(since)
+        except InvalidToken:
+            return Response({'error': '올바르지 않은 since 토큰입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        if is_expired(since):
+            return Response({'token': token, 'reset': True})
+
+        try:
+            changes = collect_changes(request.user, since, {'request': request})
+        except TooManyChanges:
+            return Response({'token': token, 'reset': True})
+        return Response({'token': token, 'reset': False, **changes})
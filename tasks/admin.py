@@ -0,0 +1,20 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'lane', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'finished_at']
+    list_filter = ['status', 'lane', 'name']
+    search_fields = ['name', 'locked_by']
+    readonly_fields = ['created_at', 'finished_at', 'lease_expires_at', 'locked_by', 'last_error']
+    actions = ['retry_tasks']
+
+    @admin.action(description="선택한 작업 다시 실행")
+    def retry_tasks(self, request, queryset):
+        updated = queryset.exclude(status=Task.STATUS_RUNNING).update(
+            status=Task.STATUS_QUEUED, attempts=0, run_at=timezone.now(), finished_at=None,
+        )
+        self.message_user(request, f"{updated}개 작업을 다시 대기열에 넣었습니다.")
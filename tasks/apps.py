@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TasksConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'tasks'
+    verbose_name = 'Tasks'
+
+    def ready(self):
+        # 각 앱의 tasks.py에 있는 @task 함수를 등록
+        autodiscover_modules('tasks')
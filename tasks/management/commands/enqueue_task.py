@@ -0,0 +1,36 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.queue import LANES, UnknownTask, enqueue, registered_tasks
+
+
+class Command(BaseCommand):
+    help = "등록된 작업을 큐에 넣습니다. (cron에서 주기 작업을 넣을 때 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', nargs='?', help="작업 이름 (생략하면 등록된 작업 목록 출력)")
+        parser.add_argument('--kwargs', default='{}', help="JSON 객체 인자")
+        parser.add_argument('--lane', choices=sorted(LANES))
+        parser.add_argument('--delay', type=float, default=0, help="몇 초 뒤부터 실행할지")
+        parser.add_argument('--unique', action='store_true', help="같은 작업이 대기 중이면 넣지 않음")
+
+    def handle(self, *args, **options):
+        if not options['name']:
+            for name in registered_tasks():
+                self.stdout.write(name)
+            return
+
+        try:
+            kwargs = json.loads(options['kwargs'])
+        except ValueError:
+            raise CommandError("--kwargs는 JSON 객체여야 합니다.")
+        if not isinstance(kwargs, dict):
+            raise CommandError("--kwargs는 JSON 객체여야 합니다.")
+
+        try:
+            task = enqueue(options['name'], lane=options['lane'], delay=options['delay'],
+                           unique=options['unique'], **kwargs)
+        except UnknownTask:
+            raise CommandError(f"등록되지 않은 작업입니다: {options['name']}")
+        self.stdout.write(self.style.SUCCESS(f"작업 #{task.pk} ({task.name}, {task.lane}) 대기 중"))
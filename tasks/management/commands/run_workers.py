@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.queue import LANES
+from tasks.worker import Supervisor
+
+
+class Command(BaseCommand):
+    help = "DB 작업 큐를 처리하는 워커 프로세스들을 실행합니다. (Ctrl+C 시 실행 중인 작업을 마치고 종료)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=2, help="워커 프로세스 수")
+        parser.add_argument('--lanes', help="처리할 레인, 쉼표로 구분 (예: high,default). 생략하면 전체")
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="큐가 비었을 때 대기 시간(초)")
+        parser.add_argument('--burst', action='store_true', help="큐가 비면 종료")
+
+    def handle(self, *args, **options):
+        lanes = None
+        if options['lanes']:
+            lanes = [lane.strip() for lane in options['lanes'].split(',') if lane.strip()]
+            unknown = set(lanes) - set(LANES)
+            if unknown:
+                raise CommandError(f"알 수 없는 레인: {', '.join(sorted(unknown))}")
+
+        Supervisor(
+            processes=options['processes'],
+            lanes=lanes,
+            poll_interval=options['poll_interval'],
+            burst=options['burst'],
+            log=self.stdout.write,
+        ).run()
+        self.stdout.write(self.style.SUCCESS("워커 종료"))
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.23 on 2026-10-19 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='작업 이름')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='인자')),
+                ('lane', models.CharField(default='default', max_length=20, verbose_name='우선순위 레인')),
+                ('priority', models.SmallIntegerField(default=5, verbose_name='우선순위 (작을수록 먼저)')),
+                ('dedupe_key', models.CharField(blank=True, db_index=True, max_length=64, verbose_name='중복 방지 키')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('run_at', models.DateTimeField(verbose_name='실행 가능 시각')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='실행 중인 워커')),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True, verbose_name='임대 만료')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료일')),
+            ],
+            options={
+                'verbose_name': '작업',
+                'verbose_name_plural': '작업들',
+                'ordering': ['priority', 'run_at', 'id'],
+                'indexes': [models.Index(fields=['status', 'priority', 'run_at'], name='task_claim_idx')],
+            },
+        ),
+    ]
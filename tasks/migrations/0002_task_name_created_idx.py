@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-19 08:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['name', 'created_at'], name='task_name_created_idx'),
+        ),
+    ]
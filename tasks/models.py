@@ -0,0 +1,44 @@
+from django.db import models
+
+
+class Task(models.Model):
+    """DB에 쌓이는 작업 하나 (run_workers가 가져가 실행)"""
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    name = models.CharField(max_length=200, verbose_name="작업 이름")
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name="인자")
+    lane = models.CharField(max_length=20, default='default', verbose_name="우선순위 레인")
+    priority = models.SmallIntegerField(default=5, verbose_name="우선순위 (작을수록 먼저)")
+    # 같은 작업이 대기 중이면 다시 넣지 않기 위한 키 (unique=True로 넣었을 때만)
+    dedupe_key = models.CharField(max_length=64, blank=True, db_index=True, verbose_name="중복 방지 키")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED, verbose_name="상태")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수")
+    max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name="최대 시도 횟수")
+    run_at = models.DateTimeField(verbose_name="실행 가능 시각")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="실행 중인 워커")
+    lease_expires_at = models.DateTimeField(blank=True, null=True, verbose_name="임대 만료")
+    last_error = models.TextField(blank=True, verbose_name="마지막 오류")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    finished_at = models.DateTimeField(blank=True, null=True, verbose_name="종료일")
+
+    class Meta:
+        ordering = ['priority', 'run_at', 'id']
+        verbose_name = "작업"
+        verbose_name_plural = "작업들"
+        indexes = [
+            models.Index(fields=['status', 'priority', 'run_at'], name='task_claim_idx'),
+            # 주기 작업을 마지막으로 넣은 시각 확인용 (enqueue_periodic)
+            models.Index(fields=['name', 'created_at'], name='task_name_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
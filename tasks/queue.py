@@ -0,0 +1,251 @@
+# tasks/queue.py
+"""
+DB 기반 작업 큐 (외부 브로커 없이 한 대에서 동작).
+
+    from tasks.queue import task, enqueue
+
+    @task(lane='low', max_attempts=5)
+    def build_something(kind):
+        ...
+
+    enqueue(build_something, kind='post')        # 또는 enqueue('posts.tasks.build_something', kind='post')
+
+작업은 Task 행이므로 트랜잭션 안에서 넣으면 커밋될 때 같이 보이고 롤백되면 같이 사라진다.
+워커는 조건부 UPDATE로 행을 임대(lease)해 가져가고, 실행하는 동안 임대를 연장한다.
+임대가 끝날 때까지 결과를 쓰지 못하고 죽으면 다른 워커가 다시 가져간다.
+실패하면 TASK_RETRY_BASE_SECONDS * 2^(시도-1) 뒤에 다시 시도한다.
+
+같은 작업이 동시에 두 번 돌면 안 되는 경우:
+- unique=True로 넣은 작업은 같은 키의 작업이 실행 중(임대 유효)이면 그것이 끝날 때까지 가져가지 않는다.
+- @task(exclusive=True) 작업은 인자와 상관없이 같은 이름의 작업이 실행 중이면 가져가지 않는다.
+"""
+import hashlib
+import json
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from .models import Task
+
+
+# 레인 -> 우선순위 (작을수록 먼저)
+LANES = {
+    'high': 0,
+    'default': 5,
+    'low': 9,
+}
+
+# 한 번에 살펴보는 후보 수 (다른 워커와 경쟁해 놓치면 다음 후보로)
+CLAIM_CANDIDATES = 10
+
+_registry = {}
+
+
+class UnknownTask(Exception):
+    """등록되지 않은 작업 이름"""
+
+
+def task(func=None, *, name=None, lane='default', max_attempts=3, exclusive=False):
+    """
+    함수를 작업으로 등록하는 데코레이터. 이름은 기본적으로 '모듈.함수'
+    exclusive: 같은 이름의 작업을 한 번에 하나만 실행 (카운터를 더하는 작업 등)
+    """
+    if lane not in LANES:
+        raise ValueError(f'알 수 없는 레인: {lane}')
+
+    def register(func):
+        func.task_name = name or f'{func.__module__}.{func.__name__}'
+        func.task_lane = lane
+        func.task_max_attempts = max_attempts
+        func.task_exclusive = exclusive
+        _registry[func.task_name] = func
+        return func
+
+    return register(func) if func else register
+
+
+def get_task(name):
+    try:
+        return _registry[name]
+    except KeyError:
+        raise UnknownTask(name)
+
+
+def registered_tasks():
+    return sorted(_registry)
+
+
+def enqueue(func, *, lane=None, delay=0, unique=False, **kwargs):
+    """
+    작업을 큐에 넣고 Task를 반환.
+    lane: 'high' / 'default' / 'low' (생략하면 등록할 때 정한 레인)
+    delay: 몇 초 뒤부터 실행할지
+    unique: 같은 이름·인자의 작업이 이미 대기 중이면 새로 넣지 않고 그것을 반환
+            (그 작업이 더 늦게 예약돼 있으면 이번 시각으로 당김.
+             실행 중인 것은 이미 읽은 상태로 돌고 있을 수 있으므로 새로 넣되, 그것이 끝난 뒤에 실행됨)
+    kwargs는 JSON으로 저장할 수 있는 값이어야 함
+    """
+    name = func if isinstance(func, str) else func.task_name
+    target = get_task(name)
+    lane = lane or target.task_lane
+    if lane not in LANES:
+        raise ValueError(f'알 수 없는 레인: {lane}')
+
+    run_at = timezone.now() + timedelta(seconds=delay)
+    dedupe_key = ''
+    if unique:
+        dedupe_key = hashlib.sha1(
+            json.dumps([name, kwargs], sort_keys=True).encode()
+        ).hexdigest()
+        existing = Task.objects.filter(dedupe_key=dedupe_key, status=Task.STATUS_QUEUED).first()
+        if existing:
+            if existing.run_at > run_at and Task.objects.filter(
+                    pk=existing.pk, status=Task.STATUS_QUEUED, run_at__gt=run_at).update(run_at=run_at):
+                existing.run_at = run_at
+            return existing
+
+    return Task.objects.create(
+        name=name,
+        kwargs=kwargs,
+        lane=lane,
+        priority=LANES[lane],
+        dedupe_key=dedupe_key,
+        max_attempts=target.task_max_attempts,
+        run_at=run_at,
+    )
+
+
+def _lease():
+    return timedelta(seconds=getattr(settings, 'TASK_LEASE_SECONDS', 300))
+
+
+def _ready(now):
+    """실행할 수 있는 작업: 대기 중이고 시간이 된 것, 또는 임대가 끝난 실행 중 작업"""
+    return (
+        Q(status=Task.STATUS_QUEUED, run_at__lte=now)
+        | Q(status=Task.STATUS_RUNNING, lease_expires_at__lt=now)
+    )
+
+
+def _blocked(now):
+    """같은 키(unique) 또는 같은 이름(exclusive)의 다른 작업이 실행 중이라 지금 가져가면 안 되는 작업"""
+    running = Task.objects.filter(
+        status=Task.STATUS_RUNNING, lease_expires_at__gte=now
+    ).exclude(pk=OuterRef('pk'))
+    exclusive = [name for name, func in _registry.items() if func.task_exclusive]
+    return (
+        (~Q(dedupe_key='') & Exists(running.filter(dedupe_key=OuterRef('dedupe_key'))))
+        | (Q(name__in=exclusive) & Exists(running.filter(name=OuterRef('name'))))
+    )
+
+
+def claim(worker_id, lanes=None):
+    """실행할 작업 하나를 임대해서 반환. 없으면 None"""
+    now = timezone.now()
+    candidates = Task.objects.filter(_ready(now)).exclude(_blocked(now))
+    if lanes:
+        candidates = candidates.filter(lane__in=lanes)
+
+    for pk in candidates.order_by('priority', 'run_at', 'id').values_list('pk', flat=True)[:CLAIM_CANDIDATES]:
+        # 다른 워커가 먼저 가져갔거나 그 사이 같은 작업이 실행되기 시작했으면 바뀐 행이 0
+        claimed = Task.objects.filter(_ready(now), pk=pk).exclude(_blocked(now)).update(
+            status=Task.STATUS_RUNNING,
+            locked_by=worker_id,
+            lease_expires_at=now + _lease(),
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return Task.objects.get(pk=pk)
+    return None
+
+
+def _owned(task, worker_id):
+    """아직 이 워커가 임대 중인 작업 (임대가 끝나 다른 워커가 가져갔으면 비어 있음)"""
+    return Task.objects.filter(pk=task.pk, status=Task.STATUS_RUNNING, locked_by=worker_id)
+
+
+def extend_lease(task, worker_id):
+    return _owned(task, worker_id).update(lease_expires_at=timezone.now() + _lease())
+
+
+def _finish(task, worker_id, error=None):
+    now = timezone.now()
+    if error is None:
+        return _owned(task, worker_id).update(
+            status=Task.STATUS_DONE, finished_at=now, lease_expires_at=None, last_error='',
+        )
+    if task.attempts < task.max_attempts:
+        backoff = getattr(settings, 'TASK_RETRY_BASE_SECONDS', 30) * 2 ** (task.attempts - 1)
+        return _owned(task, worker_id).update(
+            status=Task.STATUS_QUEUED, run_at=now + timedelta(seconds=backoff),
+            lease_expires_at=None, last_error=error,
+        )
+    return _owned(task, worker_id).update(
+        status=Task.STATUS_FAILED, finished_at=now, lease_expires_at=None, last_error=error,
+    )
+
+
+def run_task(task, worker_id):
+    """임대한 작업을 실행하고 결과를 기록. 성공하면 True"""
+    if task.attempts > task.max_attempts:
+        # 실행 도중 워커가 계속 죽어서 임대만 끝난 경우
+        _finish(task, worker_id, '임대가 끝날 때까지 완료되지 않아 더 이상 재시도하지 않습니다.')
+        return False
+    try:
+        func = get_task(task.name)
+    except UnknownTask:
+        task.attempts = task.max_attempts
+        _finish(task, worker_id, f'등록되지 않은 작업입니다: {task.name}')
+        return False
+
+    # 실행하는 동안 주기적으로 임대 연장
+    stop = threading.Event()
+
+    def heartbeat():
+        try:
+            while not stop.wait(_lease().total_seconds() / 3):
+                extend_lease(task, worker_id)
+        finally:
+            connection.close()  # 스레드마다 따로 연결이 생김
+
+    beat = threading.Thread(target=heartbeat, daemon=True)
+    beat.start()
+    try:
+        func(**task.kwargs)
+    except Exception:
+        _finish(task, worker_id, traceback.format_exc())
+        return False
+    finally:
+        stop.set()
+        beat.join()
+    _finish(task, worker_id)
+    return True
+
+
+def purge_finished(days=None):
+    """완료된 지 오래된 작업 삭제 (실패한 작업은 확인할 수 있도록 남김)"""
+    days = days if days is not None else getattr(settings, 'TASK_KEEP_DONE_DAYS', 7)
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = Task.objects.filter(status=Task.STATUS_DONE, finished_at__lt=cutoff).delete()
+    return deleted
+
+
+def enqueue_periodic(now=None):
+    """
+    TASK_SCHEDULE({작업 이름: 간격(초)})의 작업 중 마지막으로 들어온 지 간격이 지난 것을 넣음.
+    마지막 시각은 Task 행으로 판단하므로 Supervisor를 다시 띄우거나 여러 대에서 띄워도 몰리지 않음.
+    넣은 작업 이름 목록을 반환
+    """
+    now = now or timezone.now()
+    enqueued = []
+    for name, interval in getattr(settings, 'TASK_SCHEDULE', {}).items():
+        if Task.objects.filter(name=name, created_at__gt=now - timedelta(seconds=interval)).exists():
+            continue
+        enqueue(name, unique=True)
+        enqueued.append(name)
+    return enqueued
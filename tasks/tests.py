@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import Task
+from .queue import claim, enqueue, enqueue_periodic, get_task, run_task, task
+
+
+calls = []
+
+
+@task(name='tasks.tests.record', max_attempts=2)
+def record(value=None):
+    calls.append(value)
+
+
+@task(name='tasks.tests.exclusive', exclusive=True)
+def exclusive(value=None):
+    calls.append(value)
+
+
+@task(name='tasks.tests.fail', max_attempts=2)
+def fail():
+    raise RuntimeError('boom')
+
+
+def expire_lease(task):
+    Task.objects.filter(pk=task.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+
+class LeaseTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_task_is_leased_to_one_worker(self):
+        enqueue(record, value=1)
+        first = claim('w1')
+        self.assertEqual(first.locked_by, 'w1')
+        self.assertEqual(first.status, Task.STATUS_RUNNING)
+        self.assertIsNone(claim('w2'))
+
+    def test_expired_lease_is_taken_over(self):
+        enqueue(record, value=1)
+        first = claim('w1')
+        expire_lease(first)
+
+        second = claim('w2')
+        self.assertEqual(second.pk, first.pk)
+        self.assertEqual(second.attempts, 2)
+        # 임대를 잃은 워커가 뒤늦게 끝내도 결과를 쓰지 못함
+        run_task(first, 'w1')
+        taken = Task.objects.get(pk=first.pk)
+        self.assertEqual((taken.status, taken.locked_by), (Task.STATUS_RUNNING, 'w2'))
+
+        self.assertTrue(run_task(second, 'w2'))
+        self.assertEqual(Task.objects.get(pk=first.pk).status, Task.STATUS_DONE)
+
+    def test_failure_is_retried_with_backoff_then_failed(self):
+        enqueue(fail)
+        leased = claim('w1')
+        self.assertFalse(run_task(leased, 'w1'))
+        retried = Task.objects.get(pk=leased.pk)
+        self.assertEqual(retried.status, Task.STATUS_QUEUED)
+        self.assertGreater(retried.run_at, timezone.now())
+        self.assertIn('boom', retried.last_error)
+
+        Task.objects.filter(pk=leased.pk).update(run_at=timezone.now())
+        self.assertFalse(run_task(claim('w1'), 'w1'))
+        self.assertEqual(Task.objects.get(pk=leased.pk).status, Task.STATUS_FAILED)
+
+
+class MutualExclusionTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_unique_reuses_queued_task(self):
+        first = enqueue(record, unique=True, value=1)
+        self.assertEqual(enqueue(record, unique=True, value=1).pk, first.pk)
+        self.assertNotEqual(enqueue(record, unique=True, value=2).pk, first.pk)
+
+    def test_unique_pulls_delayed_task_forward(self):
+        delayed = enqueue(record, unique=True, delay=3600, value=1)
+        self.assertIsNone(claim('w1'))
+        # 더 이른 요청이 오면 기다리던 것을 당겨서 실행 (늦은 요청은 그대로)
+        self.assertEqual(enqueue(record, unique=True, delay=7200, value=1).pk, delayed.pk)
+        self.assertIsNone(claim('w1'))
+        self.assertEqual(enqueue(record, unique=True, value=1).pk, delayed.pk)
+        self.assertEqual(claim('w1').pk, delayed.pk)
+
+    def test_unique_task_waits_for_running_duplicate(self):
+        running = enqueue(record, unique=True, value=1)
+        self.assertEqual(claim('w1').pk, running.pk)
+
+        # 실행 중인 것은 이미 읽은 상태로 돌고 있으므로 새로 넣되, 끝날 때까지 가져가지 않음
+        queued = enqueue(record, unique=True, value=1)
+        self.assertNotEqual(queued.pk, running.pk)
+        self.assertIsNone(claim('w2'))
+
+        run_task(Task.objects.get(pk=running.pk), 'w1')
+        self.assertEqual(claim('w2').pk, queued.pk)
+
+    def test_running_duplicate_with_expired_lease_does_not_block(self):
+        running = enqueue(record, unique=True, value=1)
+        claim('w1')
+        queued = enqueue(record, unique=True, value=1)
+        expire_lease(running)
+        self.assertIn(claim('w2').pk, {running.pk, queued.pk})
+
+    def test_exclusive_task_runs_one_at_a_time_regardless_of_arguments(self):
+        enqueue(exclusive, value=1)
+        enqueue(exclusive, value=2)
+        enqueue(record, value=3)
+
+        first = claim('w1')
+        self.assertEqual(first.name, 'tasks.tests.exclusive')
+        # 같은 이름의 exclusive 작업은 건너뛰고 다른 작업을 가져감
+        self.assertEqual(claim('w2').name, 'tasks.tests.record')
+        self.assertIsNone(claim('w3'))
+
+        run_task(first, 'w1')
+        self.assertEqual(claim('w3').kwargs, {'value': 2})
+
+
+class PeriodicTests(TestCase):
+    def test_scheduled_tasks_are_registered(self):
+        for name in settings.TASK_SCHEDULE:
+            get_task(name)
+
+    @override_settings(TASK_SCHEDULE={'tasks.tests.record': 60})
+    def test_task_is_enqueued_once_per_interval(self):
+        self.assertEqual(enqueue_periodic(), ['tasks.tests.record'])
+        self.assertEqual(enqueue_periodic(), [])
+        # 다른 곳에서 넣은 것도 마지막 실행으로 침
+        Task.objects.all().delete()
+        enqueue(record)
+        self.assertEqual(enqueue_periodic(), [])
+
+        self.assertEqual(enqueue_periodic(now=timezone.now() + timedelta(seconds=61)), ['tasks.tests.record'])
+        self.assertEqual(Task.objects.filter(name='tasks.tests.record').count(), 2)
@@ -0,0 +1,120 @@
+# tasks/worker.py
+"""
+run_workers가 띄우는 워커 프로세스.
+
+부모 프로세스는 자식을 N개 fork하고, 죽은 자식은 다시 띄우며,
+SIGINT/SIGTERM을 받으면 자식들이 지금 하던 작업을 마치고 끝나도록 기다린다.
+부모는 주기 작업(TASK_SCHEDULE)도 때가 되면 큐에 넣는다.
+"""
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+from django.db import OperationalError, close_old_connections, connections
+
+from .queue import claim, enqueue_periodic, purge_finished, run_task
+
+
+PURGE_INTERVAL = 3600
+# TASK_SCHEDULE을 확인하는 간격(초)
+SCHEDULE_INTERVAL = 60
+
+
+class _Flag:
+    """signal 핸들러에서 건드려도 안전한 종료 표시 (Event는 핸들러 안에서 잠금을 잡다가 멈출 수 있음)"""
+    def __init__(self):
+        self.set = False
+
+    def __call__(self, *args):
+        self.set = True
+
+
+def worker_main(lanes, poll_interval, burst, stop):
+    """자식 프로세스: 작업을 하나씩 가져와 실행"""
+    # 부모의 DB 연결을 공유하지 않도록 새로 염
+    connections.close_all()
+    # Ctrl+C는 부모가 받아서 stop으로 알려줌 (작업 도중에 끊기지 않게)
+    terminated = _Flag()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, terminated)
+
+    worker_id = f'{socket.gethostname()}:{os.getpid()}'
+    while not (terminated.set or stop.is_set()):
+        close_old_connections()
+        try:
+            task = claim(worker_id, lanes)
+        except OperationalError:
+            # SQLite에서 다른 프로세스가 쓰는 중이면 잠시 뒤 다시
+            time.sleep(poll_interval)
+            continue
+        if task is None:
+            if burst:
+                break
+            time.sleep(poll_interval)
+            continue
+        run_task(task, worker_id)
+    connections.close_all()
+
+
+class Supervisor:
+    def __init__(self, processes, lanes=None, poll_interval=1.0, burst=False, log=print):
+        self.processes = processes
+        self.lanes = lanes
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.log = log
+        self.context = multiprocessing.get_context('fork')
+        self.stop = self.context.Event()
+        self.children = []
+
+    def spawn(self):
+        child = self.context.Process(
+            target=worker_main, args=(self.lanes, self.poll_interval, self.burst, self.stop), daemon=False
+        )
+        child.start()
+        return child
+
+    def run(self):
+        interrupted = _Flag()
+        previous = {sig: signal.signal(sig, interrupted) for sig in (signal.SIGINT, signal.SIGTERM)}
+        connections.close_all()
+        last_purge = last_schedule = 0
+        try:
+            self.children = [self.spawn() for _ in range(self.processes)]
+            self.log(f"워커 {self.processes}개 시작 (레인: {', '.join(self.lanes) if self.lanes else '전체'})")
+            while not interrupted.set:
+                alive = []
+                for child in self.children:
+                    if child.is_alive():
+                        alive.append(child)
+                    elif not self.burst and child.exitcode != 0:
+                        self.log(f"워커 {child.pid}가 종료됨 (코드 {child.exitcode}), 다시 시작")
+                        alive.append(self.spawn())
+                self.children = alive
+                if self.burst and not alive:
+                    break
+
+                if not self.burst and time.monotonic() - last_purge > PURGE_INTERVAL:
+                    try:
+                        purge_finished()
+                    except OperationalError:
+                        pass
+                    connections.close_all()
+                    last_purge = time.monotonic()
+                if not self.burst and time.monotonic() - last_schedule > SCHEDULE_INTERVAL:
+                    try:
+                        for name in enqueue_periodic():
+                            self.log(f"주기 작업 예약: {name}")
+                    except OperationalError:
+                        pass
+                    connections.close_all()
+                    last_schedule = time.monotonic()
+                time.sleep(self.poll_interval)
+        finally:
+            self.stop.set()
+            for child in self.children:
+                child.join()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import StoredBlob, UploadSession
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = ['sha256', 'file', 'size', 'created_at']
+    search_fields = ['sha256', 'file']
+    readonly_fields = ['created_at']
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'filename', 'received', 'size', 'status', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['user__username', 'filename']
+    readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user']
@@ -0,0 +1,202 @@
+# uploads/chunked.py
+"""
+분할 업로드 저장 로직.
+
+조각은 UPLOAD_TEMP_DIR/<id>.part 에 이어 붙이고, SHA-256은 조각을 받을 때마다 갱신한다.
+해시 상태는 프로세스 메모리에만 있으므로, 다른 워커로 요청이 가거나 재시작된 경우에는
+디스크의 부분 파일을 다시 읽어 복구한다.
+완료되면 blobs/ab/cd/<sha256>.<ext> 로 옮기며, 같은 해시가 이미 있으면 새로 저장하지 않는다.
+"""
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import threading
+
+from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError
+
+from .models import StoredBlob
+
+
+READ_SIZE = 1024 * 1024
+
+_hashers = {}
+_hashers_lock = threading.Lock()
+
+
+class OffsetMismatch(Exception):
+    """클라이언트가 보낸 offset이 서버가 받은 크기와 다름"""
+    def __init__(self, received):
+        super().__init__(received)
+        self.received = received
+
+
+class UploadTooLarge(Exception):
+    """선언한 전체 크기를 넘어서는 조각"""
+
+
+class UploadIncomplete(Exception):
+    """아직 전체 크기만큼 받지 못함"""
+
+
+class HashMismatch(Exception):
+    """클라이언트가 보낸 SHA-256과 실제 내용이 다름"""
+
+
+def partial_path(session):
+    return os.path.join(settings.UPLOAD_TEMP_DIR, f'{session.pk}.part')
+
+
+def _take_hasher(session, offset, f):
+    """offset까지의 해시 상태를 가져옴 (메모리에 없으면 부분 파일을 다시 읽음)"""
+    with _hashers_lock:
+        entry = _hashers.pop(session.pk, None)
+    if entry and entry[0] == offset:
+        return entry[1]
+
+    hasher = hashlib.sha256()
+    f.seek(0)
+    remaining = offset
+    while remaining:
+        data = f.read(min(READ_SIZE, remaining))
+        if not data:
+            break
+        hasher.update(data)
+        remaining -= len(data)
+    return hasher
+
+
+def _keep_hasher(session, offset, hasher):
+    with _hashers_lock:
+        _hashers[session.pk] = (offset, hasher)
+
+
+def append_chunk(session, offset, stream):
+    """stream의 내용을 offset 위치에 이어 붙이고, 받은 전체 크기를 반환"""
+    path = partial_path(session)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'a+b') as f:
+        # 같은 세션에 동시에 조각이 들어와도 한 번에 하나만 씀
+        fcntl.flock(f, fcntl.LOCK_EX)
+        current = f.seek(0, os.SEEK_END)
+        if offset != current:
+            raise OffsetMismatch(current)
+
+        hasher = _take_hasher(session, current, f)
+        f.seek(0, os.SEEK_END)
+        written = current
+        try:
+            for data in iter(lambda: stream.read(READ_SIZE), b''):
+                if written + len(data) > session.size:
+                    raise UploadTooLarge()
+                f.write(data)
+                hasher.update(data)
+                written += len(data)
+        except UploadTooLarge:
+            # 이번 조각은 통째로 버림
+            f.truncate(current)
+            raise
+        # 도중에 연결이 끊기면 받은 만큼은 파일에 남고, 해시는 다음 요청에서 디스크로부터 복구
+        f.flush()
+        _keep_hasher(session, written, hasher)
+    return written
+
+
+def blob_name(digest, filename):
+    ext = os.path.splitext(filename)[1].lower()
+    if not re.fullmatch(r'\.[a-z0-9]{1,10}', ext):
+        ext = ''
+    return f'blobs/{digest[:2]}/{digest[2:4]}/{digest}{ext}'
+
+
+def _move_into_storage(path, name):
+    storage = StoredBlob._meta.get_field('file').storage
+    try:
+        dest = storage.path(name)
+    except NotImplementedError:
+        # 로컬 경로가 없는 storage는 복사 후 삭제
+        with open(path, 'rb') as f:
+            name = storage.save(name, File(f))
+        os.remove(path)
+        return name
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    shutil.move(path, dest)
+    return name
+
+
+def complete(session):
+    """전체를 다 받았으면 해시를 확인하고 StoredBlob으로 만들어 반환"""
+    path = partial_path(session)
+    if not os.path.exists(path):
+        raise UploadIncomplete()
+
+    with open(path, 'rb') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        size = f.seek(0, os.SEEK_END)
+        if size != session.size:
+            raise UploadIncomplete()
+        digest = _take_hasher(session, size, f).hexdigest()
+
+    if session.sha256 and digest != session.sha256.lower():
+        os.remove(path)
+        raise HashMismatch(digest)
+
+    blob = StoredBlob.objects.filter(sha256=digest).first()
+    if blob and blob.file.storage.exists(blob.file.name):
+        # 이미 같은 내용이 있으면 새로 저장하지 않고 참조만 함
+        os.remove(path)
+        return blob
+
+    name = _move_into_storage(path, blob_name(digest, session.filename))
+    try:
+        blob, _ = StoredBlob.objects.update_or_create(
+            sha256=digest, defaults={'file': name, 'size': size}
+        )
+    except IntegrityError:
+        blob = StoredBlob.objects.get(sha256=digest)
+    return blob
+
+
+def expire_stale(max_age):
+    """
+    max_age(timedelta)보다 오래 조각이 오지 않은 업로드 세션과 부분 파일을 지움.
+    세션 행이 없는 부분 파일(세션을 직접 지운 경우 등)도 같은 기준으로 지움. 반환: (세션 수, 파일 수)
+    """
+    from django.utils import timezone
+    from .models import UploadSession
+
+    cutoff = timezone.now() - max_age
+    stale = list(UploadSession.objects.filter(status=UploadSession.STATUS_UPLOADING, updated_at__lt=cutoff))
+    for session in stale:
+        discard(session)
+    UploadSession.objects.filter(pk__in=[session.pk for session in stale]).delete()
+
+    removed = 0
+    directory = settings.UPLOAD_TEMP_DIR
+    if os.path.isdir(directory):
+        active = {f'{pk}.part' for pk in UploadSession.objects.filter(
+            status=UploadSession.STATUS_UPLOADING).values_list('pk', flat=True)}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if (entry.name.endswith('.part') and entry.name not in active
+                        and entry.stat().st_mtime < cutoff.timestamp()):
+                    try:
+                        os.remove(entry.path)
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+    return len(stale), removed
+
+
+def discard(session):
+    """세션의 부분 파일과 해시 상태 정리"""
+    with _hashers_lock:
+        _hashers.pop(session.pk, None)
+    try:
+        os.remove(partial_path(session))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,108 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from uploads import chunked
+from uploads.media import MEDIA_REFERENCES
+from uploads.models import StoredBlob
+
+
+def walk_files(root):
+    """os.scandir로 MEDIA_ROOT 아래 파일을 하나씩 내줌 (목록을 한 번에 만들지 않음)"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+class Command(BaseCommand):
+    help = (
+        "MEDIA_ROOT에서 어떤 행도 참조하지 않는 오래된 파일(고아 미디어)을 찾아 지웁니다. "
+        "UPLOAD_EXPIRE_HOURS 동안 멈춘 분할 업로드도 함께 정리합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=float, default=24,
+                            help="이 시간보다 최근에 수정된 파일은 건드리지 않음 (업로드 직후 보호)")
+        parser.add_argument('--workers', type=int, default=8, help="삭제 스레드 수")
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help="지우지 않고 대상만 출력")
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        # 멈춘 분할 업로드부터 정리 (부분 파일은 MEDIA_ROOT 밖의 UPLOAD_TEMP_DIR에 있음)
+        if not dry_run:
+            sessions, parts = chunked.expire_stale(timedelta(hours=settings.UPLOAD_EXPIRE_HOURS))
+            self.stdout.write(f"멈춘 업로드 세션 {sessions}개, 부분 파일 {parts}개 삭제")
+
+        root = str(settings.MEDIA_ROOT)
+        if not os.path.isdir(root):
+            self.stdout.write("MEDIA_ROOT가 없습니다.")
+            return
+
+        referenced = self.referenced_names()
+        cutoff = time.time() - options['grace_hours'] * 3600
+        self.stdout.write(f"참조 중인 파일 {len(referenced)}개")
+
+        stats = {'scanned': 0, 'orphans': 0, 'bytes': 0}
+        batch = []
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            for entry in walk_files(root):
+                stats['scanned'] += 1
+                name = os.path.relpath(entry.path, root).replace(os.sep, '/')
+                if name in referenced:
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime > cutoff:
+                    continue
+                batch.append((entry.path, name, stat.st_size))
+                if len(batch) >= options['batch_size']:
+                    self.remove_batch(executor, batch, stats, dry_run)
+                    batch = []
+            if batch:
+                self.remove_batch(executor, batch, stats, dry_run)
+
+        verb = "삭제 대상" if dry_run else "삭제"
+        self.stdout.write(self.style.SUCCESS(
+            f"파일 {stats['scanned']}개 검사 / 고아 파일 {stats['orphans']}개 {verb}, "
+            f"{stats['bytes']}바이트 ({stats['bytes'] / 1024 / 1024:.1f}MB) 회수"
+        ))
+
+    def referenced_names(self):
+        """Post/Music/Profile이 참조하는 파일 경로 집합 (삭제 표시된 행 포함)"""
+        names = set()
+        for model, fields in MEDIA_REFERENCES:
+            rows = model._base_manager.values_list(*fields).order_by().iterator(chunk_size=5000)
+            for row in rows:
+                names.update(name for name in row if name)
+        return names
+
+    def remove_batch(self, executor, batch, stats, dry_run):
+        if dry_run:
+            for _, name, size in batch:
+                self.stdout.write(f"  {name} ({size}바이트)")
+                stats['orphans'] += 1
+                stats['bytes'] += size
+            return
+
+        def remove(item):
+            path, name, size = item
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return None
+            return name, size
+
+        removed = [result for result in executor.map(remove, batch) if result]
+        stats['orphans'] += len(removed)
+        stats['bytes'] += sum(size for _, size in removed)
+        # 내용 주소 파일이었다면 StoredBlob 행도 정리
+        StoredBlob.objects.filter(file__in=[name for name, _ in removed if name.startswith('blobs/')]).delete()
@@ -0,0 +1,62 @@
+# uploads/media.py
+from functools import reduce
+from operator import or_
+
+from django.core.files.storage import default_storage
+from django.db.models import Q
+
+from accounts.models import Profile
+from mypage.models import Music
+from posts.models import Post
+from .models import StoredBlob
+
+
+# MEDIA_ROOT의 파일을 참조하는 (모델, 파일 필드들)
+MEDIA_REFERENCES = [
+    (Post, ['audio_file', 'image']),
+    (Music, ['audio_file', 'cover_image']),
+    (Profile, ['profile_image']),
+]
+
+
+def looks_like_audio(header):
+    """
+    파일 앞부분(16바이트 이상)이 흔한 오디오 형식인지 (MP3/AAC, WAV, FLAC, Ogg, M4A, AIFF).
+    완전한 검사는 아니고, 오디오가 아닌 파일을 오디오 필드에 붙이지 못하게 막는 용도
+    """
+    return (
+        header.startswith((b'ID3', b'fLaC', b'OggS'))
+        or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0)   # MPEG/ADTS 프레임
+        or (header.startswith(b'RIFF') and header[8:12] == b'WAVE')
+        or (header.startswith(b'FORM') and header[8:12] in (b'AIFF', b'AIFC'))
+        or header[4:8] == b'ftyp'
+    )
+
+
+def is_referenced(name):
+    """아직 이 파일을 가리키는 행이 있는지 (삭제 표시된 행 포함)"""
+    for model, fields in MEDIA_REFERENCES:
+        condition = reduce(or_, (Q(**{field: name}) for field in fields))
+        if model._base_manager.filter(condition).exists():
+            return True
+    return False
+
+
+def delete_unreferenced(names, storage=default_storage):
+    """
+    참조하는 행이 하나도 남지 않은 파일만 지움.
+    내용 주소(blobs/)로 여러 행이 같은 파일을 공유할 수 있으므로 지우기 전에 꼭 확인.
+    반환: 지운 바이트 수
+    """
+    freed = 0
+    for name in set(filter(None, names)):
+        if is_referenced(name):
+            continue
+        try:
+            size = storage.size(name)
+        except OSError:
+            continue
+        storage.delete(name)
+        StoredBlob.objects.filter(file=name).delete()
+        freed += size
+    return freed
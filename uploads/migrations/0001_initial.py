@@ -0,0 +1,52 @@
+# Generated by Django 4.2.23 on 2026-10-19 07:39
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('file', models.FileField(max_length=255, upload_to='blobs/', verbose_name='파일')),
+                ('size', models.BigIntegerField(verbose_name='크기(바이트)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '저장된 파일',
+                'verbose_name_plural': '저장된 파일들',
+            },
+        ),
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='원본 파일명')),
+                ('size', models.BigIntegerField(verbose_name='전체 크기(바이트)')),
+                ('received', models.BigIntegerField(default=0, verbose_name='받은 크기(바이트)')),
+                ('sha256', models.CharField(blank=True, max_length=64, verbose_name='클라이언트가 보낸 SHA-256')),
+                ('status', models.CharField(choices=[('uploading', '업로드 중'), ('complete', '완료')], default='uploading', max_length=20, verbose_name='상태')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('blob', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sessions', to='uploads.storedblob', verbose_name='저장된 파일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '업로드 세션',
+                'verbose_name_plural': '업로드 세션들',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
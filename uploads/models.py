@@ -0,0 +1,50 @@
+import uuid
+
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class StoredBlob(models.Model):
+    """내용(SHA-256) 기준으로 한 번만 저장되는 파일. 같은 파일은 여러 행이 같은 경로를 참조"""
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name="SHA-256")
+    file = models.FileField(upload_to='blobs/', max_length=255, verbose_name="파일")
+    size = models.BigIntegerField(verbose_name="크기(바이트)")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    class Meta:
+        verbose_name = "저장된 파일"
+        verbose_name_plural = "저장된 파일들"
+
+    def __str__(self):
+        return self.file.name
+
+
+class UploadSession(models.Model):
+    """분할 업로드 세션 (init -> chunk 반복 -> complete)"""
+    STATUS_UPLOADING = 'uploading'
+    STATUS_COMPLETE = 'complete'
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, '업로드 중'),
+        (STATUS_COMPLETE, '완료'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions', verbose_name="사용자")
+    filename = models.CharField(max_length=255, verbose_name="원본 파일명")
+    size = models.BigIntegerField(verbose_name="전체 크기(바이트)")
+    received = models.BigIntegerField(default=0, verbose_name="받은 크기(바이트)")
+    sha256 = models.CharField(max_length=64, blank=True, verbose_name="클라이언트가 보낸 SHA-256")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_UPLOADING, verbose_name="상태")
+    blob = models.ForeignKey(StoredBlob, on_delete=models.SET_NULL, null=True, blank=True,
+                             related_name='sessions', verbose_name="저장된 파일")
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "업로드 세션"
+        verbose_name_plural = "업로드 세션들"
+
+    def __str__(self):
+        return f"{self.filename} ({self.received}/{self.size})"
@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from .models import UploadSession
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """분할 업로드 세션 시리얼라이저"""
+    uploadId = serializers.UUIDField(source='id', read_only=True)
+    sha256 = serializers.RegexField(r'^[0-9a-fA-F]{64}$', required=False, allow_blank=True)
+    file = serializers.FileField(source='blob.file', read_only=True, default=None)
+
+    class Meta:
+        model = UploadSession
+        fields = ['uploadId', 'filename', 'size', 'received', 'sha256', 'status', 'file', 'created_at']
+        read_only_fields = ['received', 'status', 'created_at']
+
+    def validate_size(self, value):
+        from django.conf import settings
+        if value <= 0:
+            raise serializers.ValidationError("파일 크기는 0보다 커야 합니다.")
+        if value > settings.UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError("허용된 최대 크기를 넘었습니다.")
+        return value
+
+
+class AttachUploadSerializer(serializers.Serializer):
+    """완료된 업로드를 게시물/음악의 파일 필드에 연결"""
+    target = serializers.ChoiceField(choices=['post', 'music'])
+    id = serializers.IntegerField()
+    field = serializers.CharField()
@@ -0,0 +1,12 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from tasks.queue import task
+from . import chunked
+
+
+@task(lane='low', exclusive=True)
+def expire_uploads():
+    """UPLOAD_EXPIRE_HOURS 동안 조각이 오지 않은 분할 업로드의 세션과 부분 파일 정리"""
+    chunked.expire_stale(timedelta(hours=settings.UPLOAD_EXPIRE_HOURS))
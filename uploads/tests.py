@@ -0,0 +1,149 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import uuid
+import wave
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from mypage.models import Music
+from posts.models import Post
+from . import chunked
+from .models import StoredBlob, UploadSession
+
+
+class ChunkedUploadTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        settings_override = override_settings(
+            MEDIA_ROOT=root, UPLOAD_TEMP_DIR=f'{root}/tmp', THROTTLE_ENABLED=False,
+            CACHES={alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'uploads-tests'}
+                    for alias in ('default', 'fragments')},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user('uploader', password='pw12345!')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.data = bytes(range(256)) * 40
+
+    def start(self, data=None, filename='song.mp3'):
+        data = self.data if data is None else data
+        response = self.client.post('/api/uploads/', {
+            'filename': filename, 'size': len(data), 'sha256': hashlib.sha256(data).hexdigest(),
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.json()['uploadId']
+
+    def put(self, upload_id, offset, body):
+        return self.client.put(f'/api/uploads/{upload_id}/chunk/', body,
+                               content_type='application/octet-stream', HTTP_UPLOAD_OFFSET=str(offset))
+
+    def complete(self, upload_id):
+        return self.client.post(f'/api/uploads/{upload_id}/complete/')
+
+    def test_offset_mismatch_reports_received(self):
+        upload_id = self.start()
+        self.assertEqual(self.put(upload_id, 0, self.data[:1000]).json()['received'], 1000)
+
+        response = self.put(upload_id, 0, self.data[:1000])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['received'], 1000)
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/').json()['received'], 1000)
+
+    def test_resume_after_hash_state_is_lost(self):
+        upload_id = self.start()
+        self.put(upload_id, 0, self.data[:3000])
+        # 다른 워커로 간 경우처럼 메모리의 해시 상태가 없어도 부분 파일에서 복구
+        chunked._hashers.clear()
+        self.assertEqual(self.put(upload_id, 3000, self.data[3000:]).json()['received'], len(self.data))
+
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], UploadSession.STATUS_COMPLETE)
+        blob = StoredBlob.objects.get()
+        self.assertEqual(blob.sha256, hashlib.sha256(self.data).hexdigest())
+        with blob.file.open('rb') as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_empty_chunk_only_reports_received(self):
+        upload_id = self.start()
+        self.put(upload_id, 0, self.data[:500])
+        response = self.put(upload_id, 500, b'')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['received'], 500)
+
+    def test_chunk_past_declared_size_is_dropped(self):
+        upload_id = self.start()
+        self.put(upload_id, 0, self.data[:1000])
+        response = self.put(upload_id, 1000, self.data[1000:] + b'extra')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.put(upload_id, 1000, b'').json()['received'], 1000)
+
+    def test_incomplete_upload_cannot_complete(self):
+        upload_id = self.start()
+        self.put(upload_id, 0, self.data[:1000])
+        self.assertEqual(self.complete(upload_id).status_code, 400)
+
+    def test_same_content_is_stored_once(self):
+        for filename in ('a.mp3', 'b.mp3'):
+            upload_id = self.start(filename=filename)
+            self.put(upload_id, 0, self.data)
+            self.assertEqual(self.complete(upload_id).status_code, 200)
+        self.assertEqual(StoredBlob.objects.count(), 1)
+        self.assertEqual(set(UploadSession.objects.values_list('blob', flat=True)), {StoredBlob.objects.get().pk})
+
+    def upload(self, data, filename):
+        upload_id = self.start(data, filename)
+        self.put(upload_id, 0, data)
+        self.assertEqual(self.complete(upload_id).status_code, 200)
+        return upload_id
+
+    def attach(self, upload_id, target, pk, field):
+        return self.client.post(f'/api/uploads/{upload_id}/attach/',
+                                {'target': target, 'id': pk, 'field': field}, format='json')
+
+    def test_attach_validates_content_like_a_normal_upload(self):
+        post = Post.objects.create(title='t', content='c', author=self.user)
+        music = Music.objects.create(title='m', author=self.user, audio_file='music/audio/old.wav')
+        text = self.upload(b'not an image or audio' * 10, 'fake.png')
+
+        self.assertEqual(self.attach(text, 'post', post.pk, 'image').status_code, 400)
+        self.assertEqual(self.attach(text, 'music', music.pk, 'audio_file').status_code, 400)
+        post.refresh_from_db()
+        self.assertFalse(post.image)
+
+        image = io.BytesIO()
+        Image.new('RGB', (4, 4), 'red').save(image, 'PNG')
+        response = self.attach(self.upload(image.getvalue(), 'cover.png'), 'post', post.pk, 'image')
+        self.assertEqual(response.status_code, 200)
+
+        wav = io.BytesIO()
+        with wave.open(wav, 'wb') as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(8000)
+            f.writeframes(b'\0\0' * 800)
+        response = self.attach(self.upload(wav.getvalue(), 'song.wav'), 'music', music.pk, 'audio_file')
+        self.assertEqual(response.status_code, 200)
+
+    def test_stale_uploads_expire(self):
+        stale = self.start()
+        self.put(stale, 0, self.data[:100])
+        fresh = self.start()
+        self.put(fresh, 0, self.data[:100])
+        UploadSession.objects.filter(pk=stale).update(updated_at=timezone.now() - timedelta(hours=2))
+
+        self.assertEqual(chunked.expire_stale(timedelta(hours=1)), (1, 0))
+        self.assertEqual(list(UploadSession.objects.values_list('pk', flat=True)), [uuid.UUID(fresh)])
+        self.assertFalse(os.path.exists(chunked.partial_path(UploadSession(pk=stale))))
+        self.assertEqual(self.put(fresh, 100, b'').json()['received'], 100)
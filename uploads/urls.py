@@ -0,0 +1,16 @@
+from django.urls import path
+from .views import (
+    UploadInitView,
+    UploadDetailView,
+    UploadChunkView,
+    UploadCompleteView,
+    UploadAttachView
+)
+
+urlpatterns = [
+    path('', UploadInitView.as_view(), name='upload-init'),
+    path('<uuid:upload_id>/', UploadDetailView.as_view(), name='upload-detail'),
+    path('<uuid:upload_id>/chunk/', UploadChunkView.as_view(), name='upload-chunk'),
+    path('<uuid:upload_id>/complete/', UploadCompleteView.as_view(), name='upload-complete'),
+    path('<uuid:upload_id>/attach/', UploadAttachView.as_view(), name='upload-attach'),
+]
@@ -0,0 +1,168 @@
+import io
+
+from django.core.files import File
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from posts.models import Post
+from posts.serializers import PostSerializer
+from mypage.models import Music
+from mypage.serializers import MusicSerializer
+from .models import UploadSession
+from .serializers import UploadSessionSerializer, AttachUploadSerializer
+from . import chunked
+from .media import looks_like_audio
+
+
+# 업로드 파일을 붙일 수 있는 대상: (모델, 일반 업로드에 쓰는 시리얼라이저, 허용 필드)
+ATTACH_TARGETS = {
+    'post': (Post, PostSerializer, ['audio_file', 'image']),
+    'music': (Music, MusicSerializer, ['audio_file', 'cover_image']),
+}
+
+# 내용이 오디오인지 확인하는 필드 (이미지 필드는 시리얼라이저의 ImageField가 확인)
+AUDIO_FIELDS = {'audio_file'}
+
+
+def validate_blob(serializer_class, field, session):
+    """일반 업로드와 같은 검증을 저장된 파일에 적용. 오류 메시지 목록 (통과하면 빈 목록)"""
+    with session.blob.file.open('rb') as f:
+        if field in AUDIO_FIELDS and not looks_like_audio(f.read(16)):
+            return ['오디오 파일이 아닙니다.']
+        f.seek(0)
+        serializer = serializer_class(data={field: File(f, name=session.filename)}, partial=True)
+        serializer.is_valid()
+        return serializer.errors.get(field, [])
+
+
+def get_session(request, upload_id):
+    return get_object_or_404(UploadSession, pk=upload_id, user=request.user)
+
+
+class UploadInitView(APIView):
+    """분할 업로드 시작 (filename, size, sha256(선택))"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = UploadSessionSerializer(data=request.data, context={'request': request})
+        if serializer.is_valid():
+            serializer.save(user=request.user)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class UploadDetailView(APIView):
+    """업로드 상태 조회 (이어 올리기 전에 received 확인용)"""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, upload_id):
+        session = get_session(request, upload_id)
+        return Response(UploadSessionSerializer(session, context={'request': request}).data)
+
+    def delete(self, request, upload_id):
+        session = get_session(request, upload_id)
+        chunked.discard(session)
+        session.delete()
+        return Response({'message': '업로드가 취소되었습니다.'}, status=status.HTTP_200_OK)
+
+
+class UploadChunkView(APIView):
+    """
+    조각 이어 붙이기. 본문은 파일 바이트 그대로 보내고,
+    이어 붙일 위치는 Upload-Offset 헤더(또는 ?offset=)로 지정
+    """
+    permission_classes = [IsAuthenticated]
+
+    def put(self, request, upload_id):
+        session = get_session(request, upload_id)
+        if session.status != UploadSession.STATUS_UPLOADING:
+            return Response({'error': '이미 완료된 업로드입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        offset = request.headers.get('Upload-Offset', request.query_params.get('offset'))
+        try:
+            offset = int(offset)
+        except (TypeError, ValueError):
+            return Response({'error': 'Upload-Offset 헤더가 필요합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 본문이 비어 있으면 DRF는 request.stream을 None으로 둠 -> 0바이트 조각 (현재 received만 돌려줌)
+        stream = request.stream or io.BytesIO()
+        try:
+            received = chunked.append_chunk(session, offset, stream)
+        except chunked.OffsetMismatch as exc:
+            # 클라이언트는 received 위치부터 다시 보내면 됨
+            return Response(
+                {'error': 'offset이 맞지 않습니다.', 'received': exc.received},
+                status=status.HTTP_409_CONFLICT
+            )
+        except chunked.UploadTooLarge:
+            return Response({'error': '선언한 파일 크기를 넘었습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # updated_at은 오래 멈춘 업로드를 정리하는 기준 (chunked.expire_stale)
+        UploadSession.objects.filter(pk=session.pk).update(received=received, updated_at=timezone.now())
+        return Response({'received': received, 'size': session.size})
+
+
+class UploadCompleteView(APIView):
+    """업로드 완료: 해시 확인 후 내용 주소(sha256) 경로로 저장 (같은 파일이 있으면 재사용)"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, upload_id):
+        session = get_session(request, upload_id)
+        if session.status == UploadSession.STATUS_UPLOADING:
+            try:
+                blob = chunked.complete(session)
+            except chunked.UploadIncomplete:
+                return Response({'error': '아직 모든 조각을 받지 못했습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            except chunked.HashMismatch:
+                session.received = 0
+                session.save(update_fields=['received', 'updated_at'])
+                return Response({'error': 'SHA-256이 일치하지 않습니다. 처음부터 다시 올려주세요.'},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+            session.blob = blob
+            session.received = session.size
+            session.status = UploadSession.STATUS_COMPLETE
+            session.save(update_fields=['blob', 'received', 'status', 'updated_at'])
+
+        return Response(UploadSessionSerializer(session, context={'request': request}).data)
+
+
+class UploadAttachView(APIView):
+    """완료된 업로드를 내 게시물/음악의 파일 필드에 연결"""
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, upload_id):
+        session = get_session(request, upload_id)
+        if session.status != UploadSession.STATUS_COMPLETE or session.blob is None:
+            return Response({'error': '완료되지 않은 업로드입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = AttachUploadSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        model, target_serializer, fields = ATTACH_TARGETS[serializer.validated_data['target']]
+        field = serializer.validated_data['field']
+        if field not in fields:
+            return Response({'error': f'연결할 수 없는 필드입니다: {field}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            obj = model.objects.get(pk=serializer.validated_data['id'])
+        except model.DoesNotExist:
+            return Response({'error': '대상을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+        if obj.author != request.user:
+            return Response({'error': '수정 권한이 없습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        errors = validate_blob(target_serializer, field, session)
+        if errors:
+            return Response({field: errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 파일을 복사하지 않고 같은 경로를 참조
+        setattr(obj, field, session.blob.file.name)
+        # updated_at도 같이 저장해야 델타 동기화(/api/sync/)에 바뀐 것으로 잡힘
+        obj.save(update_fields=[field, 'updated_at'])
+        return Response({'target': serializer.validated_data['target'], 'id': obj.pk,
+                         field: getattr(obj, field).url})